@@ -32,6 +32,40 @@ options:
     default:
       - RUNNING
       - CREATION_IN_PROGRESS
+  max_workers:
+    description:
+      - The maximum number of concurrent API requests.
+      - The regions are queried concurrently, and the details of the brokers within each region are
+        retrieved concurrently, using two pools of up to I(max_workers) threads.
+      - The default of C(1) queries the regions and brokers one at a time.
+    type: int
+    default: 1
+    version_added: 12.0.0
+  broker_details:
+    description:
+      - Whether to retrieve the details of each broker with a C(DescribeBroker) request.
+      - The brokers are first filtered by I(statuses) using the C(ListBrokers) response,
+        so the details are only retrieved for the brokers which are added to the inventory.
+      - When set to C(False) only the attributes returned by C(ListBrokers) are available (C(broker_arn), C(broker_id),
+        C(broker_name), C(broker_state), C(created), C(deployment_mode), C(engine_type) and C(host_instance_type)),
+        and a single request is made for each region. Set this to C(False) if none of I(compose), I(groups) or
+        I(keyed_groups) use other attributes such as C(tags), C(engine_version) or C(broker_instances).
+    type: bool
+    default: True
+    version_added: 12.0.0
+  incremental_cache:
+    description:
+      - Cache the details of each broker, rather than the complete inventory.
+      - The brokers are always listed, but the details are only retrieved for new brokers and brokers whose
+        state, creation time, deployment mode, engine type or instance type has changed,
+        or whose cached details are older than I(cache_timeout).
+        Brokers which no longer exist are removed from the cache.
+      - Changes which aren't reflected by C(ListBrokers), such as changes to the tags of a broker, are only
+        picked up once the cached details are older than I(cache_timeout), or when the cache is refreshed.
+      - Requires I(cache=True).
+    type: bool
+    default: False
+    version_added: 12.0.0
   hostvars_prefix:
     description:
       - The prefix for host variables names coming from AWS.
@@ -83,14 +117,59 @@ compose:
   app: 'tags.Applications|split(",")'
 hostvars_prefix: aws_
 hostvars_suffix: _mq
+
+---
+
+# Example querying many regions concurrently
+plugin: community.aws.aws_mq
+regions:
+  - us-east-1
+  - us-east-2
+  - us-west-1
+  - us-west-2
+  - eu-west-1
+max_workers: 8
+
+---
+
+# Example only using the attributes returned when listing the brokers, avoiding a request per broker
+plugin: community.aws.aws_mq
+regions:
+  - ca-central-1
+broker_details: false
+keyed_groups:
+  - key: engine_type
+    prefix: mq
+  - key: deployment_mode
+    prefix: mq
+
+---
+
+# Example caching the details of each broker, only describing brokers which have changed
+plugin: community.aws.aws_mq
+regions:
+  - ca-central-1
+cache: true
+cache_plugin: ansible.builtin.jsonfile
+cache_connection: /tmp/aws_mq_cache
+cache_timeout: 86400
+incremental_cache: true
 """
 
+import functools
+import hashlib
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 try:
     import botocore
 except ImportError:
     pass  # will be captured by imported HAS_BOTO3
 
 from ansible.errors import AnsibleError
+from ansible.errors import AnsibleParserError
 from ansible.module_utils._text import to_native
 from ansible.module_utils.common.dict_transformations import camel_dict_to_snake_dict
 
@@ -119,6 +198,16 @@ broker_attr = [
     "Logs",
 ]
 
+# The attributes of a ListBrokers summary which are used to decide whether a broker has changed
+broker_fingerprint_attr = [
+    "BrokerName",
+    "BrokerState",
+    "Created",
+    "DeploymentMode",
+    "EngineType",
+    "HostInstanceType",
+]
+
 inventory_group = "aws_mq"
 
 
@@ -147,23 +236,94 @@ def _get_broker_host_tags(detail):
     return tags
 
 
-def _add_details_to_hosts(connection, hosts, strict):
-    for host in hosts:
-        detail = None
-        resource_id = host["BrokerId"]
-        try:
-            detail = connection.describe_broker(BrokerId=resource_id)
-        except is_boto3_error_code("AccessDenied") as e:
-            if not strict:
-                pass
-            else:
-                raise AnsibleError(f"Failed to query MQ: {to_native(e)}")
-        except (
-            botocore.exceptions.BotoCoreError,
-            botocore.exceptions.ClientError,
-        ) as e:  # pylint: disable=duplicate-except
+def _describe_broker(connection, host, strict):
+    try:
+        return connection.describe_broker(BrokerId=host["BrokerId"])
+    except is_boto3_error_code("AccessDenied") as e:
+        if strict:
             raise AnsibleError(f"Failed to query MQ: {to_native(e)}")
-
+    except (
+        botocore.exceptions.BotoCoreError,
+        botocore.exceptions.ClientError,
+    ) as e:  # pylint: disable=duplicate-except
+        raise AnsibleError(f"Failed to query MQ: {to_native(e)}")
+    return None
+
+
+class BrokerDetailCache:
+    """
+    The details of each broker, keyed by ARN, along with a fingerprint of the ListBrokers summary
+    of the broker at the time its details were retrieved.
+    """
+
+    VERSION = 1
+
+    def __init__(self, data=None, max_age=0):
+        self.entries = {}
+        if data and data.get("version") == self.VERSION:
+            self.entries = data.get("brokers", {})
+        self.max_age = max_age
+        # only the brokers seen during this run are saved, which evicts brokers which no longer exist
+        self.seen = {}
+        self.hits = 0
+        self.misses = 0
+        # get() and set() are called from the worker threads describing the brokers
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def fingerprint(host):
+        summary = {attr: host.get(attr) for attr in broker_fingerprint_attr}
+        return hashlib.sha256(json.dumps(summary, sort_keys=True, default=str).encode()).hexdigest()
+
+    def get(self, host):
+        entry = self.entries.get(host.get("BrokerArn"))
+        stale = not entry or entry.get("fingerprint") != self.fingerprint(host)
+        if not stale and self.max_age and time.time() - entry.get("fetched", 0) > self.max_age:
+            stale = True
+        with self._lock:
+            if stale:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self.seen[host["BrokerArn"]] = entry
+        return entry["detail"]
+
+    def set(self, host, detail):
+        # The summary attributes are used as-is, the cached copy may have been serialized (e.g. Created).
+        detail = {
+            attr: detail[attr]
+            for attr in broker_attr + ["Tags"]
+            if attr in detail and attr not in broker_fingerprint_attr
+        }
+        entry = {
+            "fingerprint": self.fingerprint(host),
+            "fetched": time.time(),
+            "detail": detail,
+        }
+        with self._lock:
+            self.seen[host["BrokerArn"]] = entry
+
+    def dump(self):
+        return {"version": self.VERSION, "brokers": self.seen}
+
+
+def _add_details_to_hosts(connection, hosts, strict, executor=None, detail_cache=None):
+    def describe(host):
+        if detail_cache is not None:
+            detail = detail_cache.get(host)
+            if detail is not None:
+                return detail
+        detail = _describe_broker(connection, host, strict)
+        if detail_cache is not None and detail:
+            detail_cache.set(host, detail)
+        return detail
+
+    if executor is None:
+        details = map(describe, hosts)
+    else:
+        details = executor.map(describe, hosts)
+
+    for host, detail in zip(hosts, details):
         if detail:
             # special handling of tags
             host["Tags"] = _get_broker_host_tags(detail)
@@ -181,13 +341,17 @@ class InventoryModule(AWSInventoryBase):
     def __init__(self):
         super(InventoryModule, self).__init__()
 
-    def _get_broker_hosts(self, connection, strict):
+    def _get_broker_hosts(self, connection, strict, executor=None, statuses=None, details=True, detail_cache=None):
         def _boto3_paginate_wrapper(func, *args, **kwargs):
             results = []
             try:
                 results = func(*args, **kwargs)
                 results = results["BrokerSummaries"]
-                _add_details_to_hosts(connection, results, strict)
+                # The summaries include the state, only describe the brokers we're going to keep
+                if statuses is not None:
+                    results = _find_hosts_matching_statuses(results, statuses)
+                if details:
+                    _add_details_to_hosts(connection, results, strict, executor=executor, detail_cache=detail_cache)
             except is_boto3_error_code("AccessDenied") as e:  # pylint: disable=duplicate-except
                 if not strict:
                     results = []
@@ -202,19 +366,43 @@ class InventoryModule(AWSInventoryBase):
 
         return _boto3_paginate_wrapper
 
-    def _get_all_hosts(self, regions, strict, statuses):
+    def _get_region_hosts(self, client, strict, executor=None, statuses=None, details=True, detail_cache=None):
+        connection, _region = client
+        paginator = connection.get_paginator("list_brokers")
+        get_broker_hosts = self._get_broker_hosts(
+            connection, strict, executor=executor, statuses=statuses, details=details, detail_cache=detail_cache
+        )
+        return get_broker_hosts(paginator.paginate().build_full_result)
+
+    def _get_all_hosts(self, regions, strict, statuses, max_workers=1, details=True, detail_cache=None):
         """
         :param regions: a list of regions in which to describe hosts
         :param strict: a boolean determining whether to fail or ignore 403 error codes
         :param statuses: a list of statuses that the returned hosts should match
+        :param max_workers: the maximum number of regions (and brokers within a region) to query concurrently
+        :param details: a boolean determining whether to describe each of the brokers
+        :param detail_cache: a BrokerDetailCache used to avoid describing brokers which haven't changed
         :return A list of host dictionaries
         """
         all_instances = []
 
-        for connection, _region in self.all_clients("mq"):
-            paginator = connection.get_paginator("list_brokers")
-            all_instances.extend(self._get_broker_hosts(connection, strict)(paginator.paginate().build_full_result))
+        # Separate pools for the regions and the brokers, a region waiting on the details
+        # of its brokers mustn't be able to starve the pool the details are fetched from.
+        with ThreadPoolExecutor(max_workers=max_workers) as broker_executor:
+            with ThreadPoolExecutor(max_workers=max_workers) as region_executor:
+                get_region_hosts = functools.partial(
+                    self._get_region_hosts,
+                    strict=strict,
+                    executor=broker_executor,
+                    statuses=statuses,
+                    details=details,
+                    detail_cache=detail_cache,
+                )
+                # the clients are created up front, creating them isn't thread safe
+                for hosts in region_executor.map(get_region_hosts, list(self.all_clients("mq"))):
+                    all_instances.extend(hosts)
         sorted_hosts = list(sorted(all_instances, key=lambda x: x["BrokerName"]))
+        # the state may have changed between listing and describing the brokers
         return _find_hosts_matching_statuses(sorted_hosts, statuses)
 
     def _populate_from_cache(self, cache_data):
@@ -284,14 +472,41 @@ class InventoryModule(AWSInventoryBase):
         regions = self.get_option("regions")
         strict_permissions = self.get_option("strict_permissions")
         statuses = self.get_option("statuses")
+        max_workers = self.get_option("max_workers")
+        broker_details = self.get_option("broker_details")
+
+        if max_workers < 1:
+            raise AnsibleParserError("max_workers must be at least 1")
+
+        if self.get_option("incremental_cache") and self.get_option("cache"):
+            self._parse_incremental(path, cache, regions, strict_permissions, statuses, max_workers, broker_details)
+            return
 
         result_was_cached, results = self.get_cached_result(path, cache)
         if result_was_cached:
             self._populate_from_cache(results)
             return
 
-        results = self._get_all_hosts(regions, strict_permissions, statuses)
+        results = self._get_all_hosts(
+            regions, strict_permissions, statuses, max_workers=max_workers, details=broker_details
+        )
         self._populate(results)
 
         formatted_inventory = self._format_inventory(results)
         self.update_cached_result(path, cache, formatted_inventory)
+
+    def _parse_incremental(self, path, cache, regions, strict, statuses, max_workers, details):
+        cache_key = f"{self.get_cache_key(path)}_brokers"
+        data = None
+        # false when refresh_cache or --flush-cache is used, describe everything again
+        if cache:
+            data = self._cache.get(cache_key)
+        detail_cache = BrokerDetailCache(data, max_age=self.get_option("cache_timeout"))
+
+        results = self._get_all_hosts(
+            regions, strict, statuses, max_workers=max_workers, details=details, detail_cache=detail_cache
+        )
+        self._populate(results)
+
+        self._cache[cache_key] = detail_cache.dump()
+        self.debug(f"aws_mq: {detail_cache.hits} cached brokers, {detail_cache.misses} brokers described")
@@ -0,0 +1,161 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: Contributors to the Ansible project
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+import json
+import os
+import tempfile
+import time
+
+try:
+    import botocore
+except ImportError:
+    pass  # caught by AnsibleAWSModule
+
+
+def build_alias_index(distributions):
+    """Build an index of alias (in lower case) -> distribution ID from a listing of distributions."""
+    index = {}
+    for distribution in distributions:
+        for alias in distribution.get("Aliases", {}).get("Items", []):
+            index[alias.lower()] = distribution["Id"]
+    return index
+
+
+class DistributionIndexCache:
+    """Index of CloudFront distribution IDs, optionally persisted as JSON between runs.
+
+    Only the IDs of the distributions are stored.  A cached ID may be stale (or belong to another
+    account sharing the file), so callers must check that the distribution still matches before using it.
+    Caller references can't be changed so they're kept indefinitely, the alias index is only
+    used until it's older than alias_ttl seconds.
+    """
+
+    VERSION = 1
+
+    def __init__(self, path=None, alias_ttl=3600):
+        self.path = path
+        self.alias_ttl = alias_ttl
+        self.caller_references = {}
+        self.aliases = None
+        self.aliases_updated = 0
+        self._changed = False
+
+    def load(self):
+        if not self.path:
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        # A missing or corrupt cache just means we start again from scratch
+        except (OSError, ValueError):
+            return
+        if isinstance(data, dict) and data.get("version") == self.VERSION:
+            self.caller_references = data.get("caller_references") or {}
+            if isinstance(data.get("aliases"), dict):
+                self.aliases = data["aliases"].get("index")
+                self.aliases_updated = data["aliases"].get("updated", 0)
+
+    def get_caller_reference(self, caller_reference):
+        return self.caller_references.get(caller_reference)
+
+    def set_caller_reference(self, caller_reference, distribution_id):
+        if caller_reference and self.caller_references.get(caller_reference) != distribution_id:
+            self.caller_references[caller_reference] = distribution_id
+            self._changed = True
+
+    def discard_caller_reference(self, caller_reference):
+        if self.caller_references.pop(caller_reference, None) is not None:
+            self._changed = True
+
+    def get_aliases(self):
+        """Returns the cached alias index, None if there isn't one or it's expired."""
+        if self.aliases is None or time.time() - self.aliases_updated > self.alias_ttl:
+            return None
+        return self.aliases
+
+    def set_aliases(self, index):
+        self.aliases = index
+        self.aliases_updated = time.time()
+        self._changed = True
+
+    def discard_aliases(self):
+        if self.aliases is not None:
+            self.aliases = None
+            self._changed = True
+
+    def save(self):
+        if not self.path or not self._changed:
+            return
+        cache_dir = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(cache_dir, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, prefix=".cloudfront_distribution_cache")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                data = {"version": self.VERSION, "caller_references": self.caller_references}
+                if self.aliases is not None:
+                    data["aliases"] = {"index": self.aliases, "updated": self.aliases_updated}
+                json.dump(data, f)
+            os.replace(tmp_path, self.path)
+        except Exception:
+            os.unlink(tmp_path)
+            raise
+        self._changed = False
+
+
+class DistributionAliasLookup:
+    """Finds distributions by alias using an alias -> ID index built from a single listing of the distributions.
+
+    The index is built at most once per run (unless a cached index turns out to be stale).
+    IDs found in an index loaded from the cache are checked against the distribution, and
+    aliases missing from a cached index are looked up again in a fresh listing.
+    """
+
+    def __init__(self, facts_mgr, cache):
+        self.facts_mgr = facts_mgr
+        self.cache = cache
+        self._index = None
+        self._fresh = False
+
+    def index(self, refresh=False):
+        if self._index is None or (refresh and not self._fresh):
+            cached = None if refresh else self.cache.get_aliases()
+            if cached is not None:
+                self._index = cached
+            else:
+                self._index = build_alias_index(self.facts_mgr.list_distributions(keyed=False))
+                self._fresh = True
+                self.cache.set_aliases(self._index)
+        return self._index
+
+    def discard(self):
+        """Forget the index once the aliases of a distribution have been changed."""
+        self._index = None
+        self._fresh = False
+        self.cache.discard_aliases()
+
+    def lookup(self, aliases):
+        """Returns the ID of the distribution using (one of) aliases, None if there isn't one."""
+        distribution_id = self._find(self.index(), aliases)
+        if self._fresh:
+            return distribution_id
+        if distribution_id is not None and self._uses_alias(distribution_id, aliases):
+            return distribution_id
+        return self._find(self.index(refresh=True), aliases)
+
+    def _find(self, index, aliases):
+        for alias in aliases:
+            distribution_id = index.get(alias.lower())
+            if distribution_id is not None:
+                return distribution_id
+        return None
+
+    def _uses_alias(self, distribution_id, aliases):
+        try:
+            distribution = self.facts_mgr.get_distribution(id=distribution_id, fail_if_error=False)
+        # Deleted distributions (or ones we can't describe) get looked up again in a fresh listing
+        except (botocore.exceptions.ClientError, botocore.exceptions.BotoCoreError):
+            return False
+        distribution_aliases = distribution["Distribution"]["DistributionConfig"]["Aliases"].get("Items", [])
+        return bool(set(alias.lower() for alias in aliases) & set(alias.lower() for alias in distribution_aliases))
@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: Contributors to the Ansible project
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+import hashlib
+import json
+import os
+import tempfile
+
+
+def task_definition_family(task_definition_arn):
+    """Returns the family of a task definition ARN (arn:aws:ecs:region:account:task-definition/family:revision)."""
+    return task_definition_arn.rsplit("/", 1)[-1].rsplit(":", 1)[0]
+
+
+def task_definition_revision(task_definition_arn):
+    return int(task_definition_arn.rsplit(":", 1)[-1])
+
+
+class TaskDefinitionCache:
+    """Index of task definition ARNs by a hash of the requested definition, optionally persisted as JSON between runs.
+
+    Task definitions can't be modified, so a cached ARN still matches the definition it was recorded for.
+    It may however have been deregistered since, callers must check its status before using it.
+    The fingerprint should include the account and region, so that a file shared between them can't
+    return the ARN of another account's (or region's) task definition.
+    """
+
+    VERSION = 2
+
+    def __init__(self, path=None):
+        self.path = path
+        self.task_definitions = {}
+        self._changed = False
+
+    @staticmethod
+    def fingerprint(**definition):
+        return hashlib.sha256(json.dumps(definition, sort_keys=True, default=str).encode()).hexdigest()
+
+    def load(self):
+        if not self.path:
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        # A missing or corrupt cache just means we start again from scratch
+        except (OSError, ValueError):
+            return
+        if isinstance(data, dict) and data.get("version") == self.VERSION:
+            self.task_definitions = data.get("task_definitions") or {}
+
+    def get(self, fingerprint):
+        return self.task_definitions.get(fingerprint)
+
+    def set(self, fingerprint, task_definition_arn):
+        if self.task_definitions.get(fingerprint) != task_definition_arn:
+            self.task_definitions[fingerprint] = task_definition_arn
+            self._changed = True
+
+    def discard(self, fingerprint):
+        if self.task_definitions.pop(fingerprint, None) is not None:
+            self._changed = True
+
+    def save(self):
+        if not self.path or not self._changed:
+            return
+        cache_dir = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(cache_dir, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, prefix=".ecs_taskdefinition_cache")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"version": self.VERSION, "task_definitions": self.task_definitions}, f)
+            os.replace(tmp_path, self.path)
+        except Exception:
+            os.unlink(tmp_path)
+            raise
+        self._changed = False
@@ -20,7 +20,18 @@
 # You should have received a copy of the GNU General Public License
 # along with calculate_multipart_etag.  If not, see <http://www.gnu.org/licenses/>.
 
+import base64
 import hashlib
+import mmap
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    from awscrt import checksums as crt_checksums
+
+    HAS_AWSCRT = True
+except ImportError:
+    HAS_AWSCRT = False
 
 try:
     from boto3.s3.transfer import TransferConfig
@@ -30,8 +41,49 @@ except ImportError:
     DEFAULT_CHUNK_SIZE = 5 * 1024 * 1024
     pass  # Handled by AnsibleAWSModule
 
+# Files at least this large have their parts hashed using a pool of threads
+DEFAULT_PARALLEL_THRESHOLD = 64 * 1024 * 1024
+DEFAULT_MAX_WORKERS = min(8, os.cpu_count() or 1)
+
 
-def calculate_multipart_etag(source_path, chunk_size=DEFAULT_CHUNK_SIZE):
+def _md5(data):
+    md5 = hashlib.new("md5", usedforsecurity=False)
+    md5.update(data)
+    return md5
+
+
+def _md5_part(view, offset, chunk_size):
+    # slicing a memoryview doesn't copy the data, and hashlib releases the GIL while hashing large buffers
+    with view[offset:offset + chunk_size] as part:  # fmt:skip
+        return _md5(part)
+
+
+def _read_md5s(fp, chunk_size):
+    md5s = []
+    while True:
+        data = fp.read(chunk_size)
+
+        if not data:
+            break
+        md5s.append(_md5(data))
+    return md5s
+
+
+def _mmap_md5s(mapped, size, chunk_size, max_workers):
+    with memoryview(mapped) as view:
+        offsets = range(0, size, chunk_size)
+        if max_workers > 1 and len(offsets) > 1:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                return list(executor.map(lambda offset: _md5_part(view, offset, chunk_size), offsets))
+        return [_md5_part(view, offset, chunk_size) for offset in offsets]
+
+
+def calculate_multipart_etag(
+    source_path,
+    chunk_size=DEFAULT_CHUNK_SIZE,
+    max_workers=DEFAULT_MAX_WORKERS,
+    parallel_threshold=DEFAULT_PARALLEL_THRESHOLD,
+):
     """
     calculates a multipart upload etag for amazon s3
 
@@ -39,19 +91,26 @@ def calculate_multipart_etag(source_path, chunk_size=DEFAULT_CHUNK_SIZE):
 
     source_path -- The file to calculate the etag for
     chunk_size -- The chunk size to calculate for.
+    max_workers -- The number of threads used to hash the parts of large files.
+    parallel_threshold -- The size from which the parts of a file are hashed in parallel.
     """
 
-    md5s = []
-
     with open(source_path, "rb") as fp:
-        while True:
-            data = fp.read(chunk_size)
+        size = os.fstat(fp.fileno()).st_size
+        mapped = None
+        # empty files can't be mapped
+        if size:
+            try:
+                mapped = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+            except (OSError, ValueError, OverflowError):
+                mapped = None
 
-            if not data:
-                break
-            md5 = hashlib.new("md5", usedforsecurity=False)
-            md5.update(data)
-            md5s.append(md5)
+        if mapped is None:
+            md5s = _read_md5s(fp, chunk_size)
+        else:
+            with mapped:
+                workers = max_workers if size >= parallel_threshold else 1
+                md5s = _mmap_md5s(mapped, len(mapped), chunk_size, workers)
 
     if len(md5s) == 1:
         new_etag = f'"{md5s[0].hexdigest()}"'
@@ -62,3 +121,168 @@ def calculate_multipart_etag(source_path, chunk_size=DEFAULT_CHUNK_SIZE):
         new_etag = f'"{new_md5.hexdigest()}-{len(md5s)}"'
 
     return new_etag
+
+
+MiB = 1024 * 1024
+
+# Part sizes used by commonly used tools (boto3/aws cli, s3cmd, rclone, SDK and console uploads, ...)
+COMMON_CHUNK_SIZES = tuple(size * MiB for size in (5, 8, 10, 15, 16, 32, 50, 64, 100, 128, 256, 512))
+
+
+def multipart_etag_parts(etag):
+    """
+    returns the number of parts encoded in a multipart upload etag ("<md5>-<parts>"),
+    or None if the etag isn't from a multipart upload.
+    """
+    parts = etag.strip('"').rpartition("-")[2] if "-" in etag else None
+    if not parts or not parts.isdigit():
+        return None
+    return int(parts)
+
+
+def candidate_chunk_sizes(remote_etag, size, chunk_size=DEFAULT_CHUNK_SIZE, chunk_sizes=COMMON_CHUNK_SIZES):
+    """
+    returns the part sizes which could have produced remote_etag for an object of size bytes.
+
+    The preferred chunk_size is listed first if it's consistent with the etag.  For an etag which
+    isn't from a multipart upload the whole object was hashed as one part.
+    """
+    parts = multipart_etag_parts(remote_etag)
+    if parts is None:
+        return [max(size, 1)]
+
+    candidates = []
+    # Tools which pick their own part size usually round it up to a whole number of MiB
+    smallest = -(-size // (parts * MiB)) * MiB
+    for candidate in (chunk_size, *chunk_sizes, smallest):
+        if candidate in candidates:
+            continue
+        # parts - 1 full parts, and a final part of between 1 and candidate bytes
+        if (parts - 1) * candidate < size <= parts * candidate:
+            candidates.append(candidate)
+    return candidates
+
+
+def _format_etag(digests):
+    if len(digests) == 1:
+        return f'"{digests[0].hex()}"'
+    new_md5 = hashlib.md5(b"".join(digests))
+    return f'"{new_md5.hexdigest()}-{len(digests)}"'
+
+
+class _Crc32c:
+    """hashlib style wrapper around the CRC32C implementation from awscrt (also used by botocore)"""
+
+    def __init__(self):
+        self._crc = 0
+
+    def update(self, data):
+        self._crc = crt_checksums.crc32c(data, self._crc)
+
+    def digest(self):
+        return self._crc.to_bytes(4, byteorder="big")
+
+
+def _new_hash(algorithm):
+    if algorithm == "crc32c":
+        return _Crc32c()
+    return hashlib.new(algorithm, usedforsecurity=False)
+
+
+def _multipart_digests(source_path, chunk_sizes, algorithm, block_size):
+    """
+    calculates the digests of the parts of a file for several chunk sizes in a single pass over the file
+
+    Returns a dict mapping each chunk size to the list of part digests.
+    """
+
+    # chunk size -> [running hash of the current part, bytes in the current part, digests of the completed parts]
+    states = {chunk_size: [None, 0, []] for chunk_size in chunk_sizes}
+    buffer = bytearray(block_size)
+
+    with open(source_path, "rb") as fp, memoryview(buffer) as view:
+        while True:
+            length = fp.readinto(buffer)
+            if not length:
+                break
+            for chunk_size, state in states.items():
+                offset = 0
+                while offset < length:
+                    if state[0] is None:
+                        state[0] = _new_hash(algorithm)
+                    take = min(length - offset, chunk_size - state[1])
+                    state[0].update(view[offset:offset + take])  # fmt:skip
+                    state[1] += take
+                    offset += take
+                    if state[1] == chunk_size:
+                        state[2].append(state[0].digest())
+                        state[0], state[1] = None, 0
+
+    digests = {}
+    for chunk_size, (part_hash, _filled, part_digests) in states.items():
+        if part_hash is not None:
+            part_digests.append(part_hash.digest())
+        digests[chunk_size] = part_digests
+    return digests
+
+
+def calculate_multipart_etags(source_path, chunk_sizes, block_size=MiB):
+    """
+    calculates the multipart upload etags for several chunk sizes in a single pass over the file
+
+    Arguments:
+
+    source_path -- The file to calculate the etags for
+    chunk_sizes -- The chunk sizes to calculate for.
+    block_size -- The size of the reads.
+
+    Returns a dict mapping each chunk size to its etag.
+    """
+    digests = _multipart_digests(source_path, chunk_sizes, "md5", block_size)
+    return {chunk_size: _format_etag(part_digests) for chunk_size, part_digests in digests.items()}
+
+
+def _format_checksum(digests, algorithm, composite):
+    if not composite:
+        # a full object checksum, calculated with a single part
+        digest = digests[0] if digests else _new_hash(algorithm).digest()
+        return base64.b64encode(digest).decode()
+    checksum = _new_hash(algorithm)
+    checksum.update(b"".join(digests))
+    return f"{base64.b64encode(checksum.digest()).decode()}-{len(digests)}"
+
+
+def calculate_multipart_checksums(source_path, chunk_sizes, algorithm, composite=True, block_size=MiB):
+    """
+    calculates S3 additional checksums (crc32c or sha256) for several chunk sizes in a single pass over the file
+
+    Arguments:
+
+    source_path -- The file to calculate the checksums for
+    chunk_sizes -- The chunk sizes to calculate for.
+    algorithm -- The checksum algorithm, crc32c or sha256.
+    composite -- Whether to calculate the "checksum of checksums" used for multipart uploads
+                 ("<base64>-<parts>"), or a full object checksum.
+    block_size -- The size of the reads.
+
+    Returns a dict mapping each chunk size to its checksum.
+    """
+    if not composite:
+        # the chunk size doesn't matter for a full object checksum, hash the whole file as a single part
+        whole_file = max(os.path.getsize(source_path), 1)
+        digests = _multipart_digests(source_path, [whole_file], algorithm, block_size)
+        checksum = _format_checksum(digests[whole_file], algorithm, composite)
+        return {chunk_size: checksum for chunk_size in chunk_sizes}
+    digests = _multipart_digests(source_path, chunk_sizes, algorithm, block_size)
+    return {
+        chunk_size: _format_checksum(part_digests, algorithm, composite) for chunk_size, part_digests in digests.items()
+    }
+
+
+def select_etag(etags, chunk_sizes, remote_etag=None):
+    """
+    Returns the etag matching remote_etag if there is one, otherwise the etag for the first chunk size.
+    """
+    if remote_etag in (etags.get(chunk_size) for chunk_size in chunk_sizes):
+        return remote_etag
+    return etags[chunk_sizes[0]]
@@ -13,6 +13,7 @@ except ImportError:
 
 from ansible.module_utils.common.dict_transformations import camel_dict_to_snake_dict
 
+from ansible_collections.amazon.aws.plugins.module_utils.arn import parse_aws_arn
 from ansible_collections.amazon.aws.plugins.module_utils.botocore import is_boto3_error_code
 from ansible_collections.amazon.aws.plugins.module_utils.retries import AWSRetry
 from ansible_collections.amazon.aws.plugins.module_utils.tagging import ansible_dict_to_boto3_tag_list
@@ -26,6 +27,16 @@ def _list_topics_with_backoff(client):
     return paginator.paginate().build_full_result()["Topics"]
 
 
+@AWSRetry.jittered_backoff()
+def _get_topic_attributes_with_backoff(client, topic_arn):
+    return client.get_topic_attributes(TopicArn=topic_arn)["Attributes"]
+
+
+@AWSRetry.jittered_backoff()
+def _list_tags_for_resource_with_backoff(client, topic_arn):
+    return client.list_tags_for_resource(ResourceArn=topic_arn)["Tags"]
+
+
 @AWSRetry.jittered_backoff(catch_extra_error_codes=["NotFound"])
 def _list_topic_subscriptions_with_backoff(client, topic_arn):
     paginator = client.get_paginator("list_subscriptions_by_topic")
@@ -62,11 +73,97 @@ def list_topics(client, module):
     return [t["TopicArn"] for t in topics]
 
 
-def topic_arn_lookup(client, module, name):
+def iter_topics(client, module):
+    """Generator version of list_topics(), the topics are listed one page at a time."""
+    paginator = client.get_paginator("list_topics")
+    try:
+        for page in paginator.paginate():
+            for topic in page["Topics"]:
+                yield topic["TopicArn"]
+    except (botocore.exceptions.ClientError, botocore.exceptions.BotoCoreError) as e:
+        module.fail_json_aws(e, msg="Couldn't get topic list")
+
+
+def get_topic_attributes(client, module, topic_arn):
+    """
+    Returns the attributes of a topic, None if the topic doesn't exist.
+    Raises AuthorizationError rather than failing, so that callers can fall back to listing the topics.
+    """
+    try:
+        return _get_topic_attributes_with_backoff(client, topic_arn)
+    except is_boto3_error_code("NotFound"):
+        return None
+    except is_boto3_error_code("AuthorizationError"):
+        raise
+    except (
+        botocore.exceptions.ClientError,
+        botocore.exceptions.BotoCoreError,
+    ) as e:  # pylint: disable=duplicate-except
+        module.fail_json_aws(e, msg=f"Couldn't get topic attributes for topic {topic_arn}")
+
+
+def get_account_info(module):
+    """
+    Returns the account ID and partition of the caller, (None, None) if we're not permitted to look them up.
+
+    Unlike get_aws_account_info() this doesn't fail the module, without the account ID topics are found
+    by listing them.
+    """
+    try:
+        sts_client = module.client("sts", retry_decorator=AWSRetry.jittered_backoff())
+        caller_id = sts_client.get_caller_identity(aws_retry=True)
+    except (botocore.exceptions.ClientError, botocore.exceptions.BotoCoreError):
+        return None, None
+    return caller_id.get("Account"), caller_id.get("Arn").split(":")[1]
+
+
+def _find_topic(client, module, topic_arn, account_id):
+    """
+    Returns a tuple of whether topic_arn is a topic owned by this account in the region of the client,
+    and its attributes (None if they weren't retrieved).
+    """
+    arn = parse_aws_arn(topic_arn or "")
+    if not arn or arn["service"] != "sns" or arn["region"] != client.meta.region_name:
+        return False, None
+
+    if account_id is not None:
+        if arn["account_id"] != account_id:
+            return False, None
+        try:
+            attributes = get_topic_attributes(client, module, topic_arn)
+            return attributes is not None, attributes
+        except is_boto3_error_code("AuthorizationError"):
+            pass
+
+    return any(topic == topic_arn for topic in iter_topics(client, module)), None
+
+
+def topic_exists(client, module, topic_arn, account_id=None):
+    """
+    Whether topic_arn is a topic owned by this account in the region of the client.
+
+    Equivalent to ``topic_arn in list_topics(client, module)``, but uses a single GetTopicAttributes call
+    when account_id (as returned by get_account_info()) is passed.
+    The topics are only listed (until a match is found) if we're not permitted to call GetTopicAttributes
+    or don't know our account ID.
+    """
+    exists, _attributes = _find_topic(client, module, topic_arn, account_id)
+    return exists
+
+
+def topic_arn_lookup(client, module, name, account_id=None, partition=None):
+    if account_id is not None:
+        topic_arn = f"arn:{partition}:sns:{client.meta.region_name}:{account_id}:{name}"
+        try:
+            if get_topic_attributes(client, module, topic_arn) is None:
+                return None
+            return topic_arn
+        except is_boto3_error_code("AuthorizationError"):
+            pass
+
     # topic names cannot have colons, so this captures the full topic name
-    all_topics = list_topics(client, module)
     lookup_topic = f":{name}"
-    for topic in all_topics:
+    for topic in iter_topics(client, module):
         if topic.endswith(lookup_topic):
             return topic
 
@@ -105,7 +202,7 @@ def get_tags(client, module, topic_arn):
         module.fail_json_aws(e, msg="Couldn't obtain topic tags")
 
 
-def get_info(connection, module, topic_arn):
+def get_info(connection, module, topic_arn, account_id=None):
     name = module.params.get("name")
     topic_type = module.params.get("topic_type")
     state = module.params.get("state")
@@ -137,8 +234,14 @@ def get_info(connection, module, topic_arn):
         "attributes_set": attributes_set,
     }
     if state != "absent":
-        if topic_arn in list_topics(connection, module):
-            info.update(camel_dict_to_snake_dict(connection.get_topic_attributes(TopicArn=topic_arn)["Attributes"]))
+        exists, attributes = _find_topic(connection, module, topic_arn, account_id)
+        if exists:
+            if attributes is None:
+                try:
+                    attributes = get_topic_attributes(connection, module, topic_arn)
+                except is_boto3_error_code("AuthorizationError") as e:
+                    module.fail_json_aws(e, msg=f"Couldn't get topic attributes for topic {topic_arn}")
+            info.update(camel_dict_to_snake_dict(attributes))
             info["delivery_policy"] = info.pop("effective_delivery_policy")
         info["subscriptions"] = [
             camel_dict_to_snake_dict(sub) for sub in list_topic_subscriptions(connection, module, topic_arn)
@@ -147,6 +250,42 @@ def get_info(connection, module, topic_arn):
     return info
 
 
+def list_topic_tags(client, topic_arn):
+    """Returns the tags of a topic, unlike get_tags() errors are raised rather than failing the module."""
+    return boto3_tag_list_to_ansible_dict(_list_tags_for_resource_with_backoff(client, topic_arn))
+
+
+def describe_topic(client, topic_arn, tags=None):
+    """
+    Returns the attributes, subscriptions and tags of a topic owned by this account, and a list of warnings.
+
+    Unlike get_info() errors are raised rather than failing the module, so that it can be used from worker threads.
+    As with get_info(), being denied access to the tags or subscriptions isn't an error, a warning
+    is returned instead for the caller to pass to module.warn().
+    tags may be passed if they've already been retrieved.
+    """
+    warnings = []
+    info = camel_dict_to_snake_dict(_get_topic_attributes_with_backoff(client, topic_arn))
+    info["delivery_policy"] = info.pop("effective_delivery_policy", None)
+    try:
+        subscriptions = _list_topic_subscriptions_with_backoff(client, topic_arn)
+    except is_boto3_error_code("AuthorizationError"):
+        try:
+            subscriptions = [sub for sub in _list_subscriptions_with_backoff(client) if sub["TopicArn"] == topic_arn]
+        except is_boto3_error_code("AuthorizationError"):
+            warnings.append(f"Permission denied accessing subscriptions of topic {topic_arn}")
+            subscriptions = []
+    info["subscriptions"] = [camel_dict_to_snake_dict(sub) for sub in subscriptions]
+    if tags is None:
+        try:
+            tags = list_topic_tags(client, topic_arn)
+        except is_boto3_error_code("AuthorizationError"):
+            warnings.append(f"Permission denied accessing tags of topic {topic_arn}")
+            tags = {}
+    info["tags"] = tags
+    return info, warnings
+
+
 def update_tags(client, module, topic_arn):
     if module.params.get("tags") is None:
         return False
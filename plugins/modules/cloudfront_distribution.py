@@ -623,6 +623,23 @@ options:
       default: 1800
       type: int
 
+    distribution_cache_path:
+      description:
+        - Path of a local file used to cache the IDs of distributions by I(caller_reference) and by alias between runs.
+        - Finding a distribution by I(caller_reference) otherwise requires fetching the configuration of every
+          distribution until a match is found. A cached ID is always checked against the distribution before it's used.
+      type: path
+      version_added: 12.0.0
+
+    distribution_cache_ttl:
+      description:
+        - The number of seconds the index of distributions by alias stored in I(distribution_cache_path) is used for
+          before the distributions are listed again.
+        - Aliases which aren't in the cached index are always looked up in a fresh listing of the distributions.
+      type: int
+      default: 3600
+      version_added: 12.0.0
+
 extends_documentation_fragment:
   - amazon.aws.common.modules
   - amazon.aws.region.modules
@@ -1916,6 +1933,8 @@ web_acl_id:
 import datetime
 import re
 from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import as_completed
 
 try:
     import botocore
@@ -1928,14 +1947,20 @@ from ansible.module_utils.common.dict_transformations import camel_dict_to_snake
 from ansible.module_utils.common.dict_transformations import recursive_diff
 from ansible.module_utils.common.dict_transformations import snake_dict_to_camel_dict
 
+from ansible_collections.amazon.aws.plugins.module_utils.botocore import is_boto3_error_code
 from ansible_collections.amazon.aws.plugins.module_utils.cloudfront_facts import CloudFrontFactsServiceManager
 from ansible_collections.amazon.aws.plugins.module_utils.retries import AWSRetry
 from ansible_collections.amazon.aws.plugins.module_utils.tagging import ansible_dict_to_boto3_tag_list
 from ansible_collections.amazon.aws.plugins.module_utils.tagging import boto3_tag_list_to_ansible_dict
 from ansible_collections.amazon.aws.plugins.module_utils.tagging import compare_aws_tags
 
+from ansible_collections.community.aws.plugins.module_utils.cloudfront import DistributionAliasLookup
+from ansible_collections.community.aws.plugins.module_utils.cloudfront import DistributionIndexCache
 from ansible_collections.community.aws.plugins.module_utils.modules import AnsibleCommunityAWSModule as AnsibleAWSModule
 
+# The number of distribution configurations fetched concurrently when searching by caller reference
+CALLER_REFERENCE_LOOKUP_WORKERS = 8
+
 
 def change_dict_key_name(dictionary, old_key, new_key):
     if old_key in dictionary:
@@ -2046,6 +2071,11 @@ class CloudFrontValidationManager(object):
     def __init__(self, module):
         self.__cloudfront_facts_mgr = CloudFrontFactsServiceManager(module)
         self.module = module
+        self.__distribution_index = DistributionIndexCache(
+            module.params.get("distribution_cache_path"), module.params.get("distribution_cache_ttl")
+        )
+        self.__distribution_index.load()
+        self.__alias_lookup = DistributionAliasLookup(self.__cloudfront_facts_mgr, self.__distribution_index)
         self.__default_distribution_enabled = True
         self.__default_http_port = 80
         self.__default_https_port = 443
@@ -2791,24 +2821,88 @@ class CloudFrontValidationManager(object):
 
     def validate_distribution_from_caller_reference(self, caller_reference):
         try:
-            distributions = self.__cloudfront_facts_mgr.list_distributions(keyed=False)
-            distribution_name = "Distribution"
-            distribution_config_name = "DistributionConfig"
-            distribution_ids = [dist.get("Id") for dist in distributions]
-            for distribution_id in distribution_ids:
-                distribution = self.__cloudfront_facts_mgr.get_distribution(id=distribution_id)
+            # The index is populated with every configuration we fetch, repeated lookups during
+            # this run (or later runs, when it's persisted) only need to check the distribution.
+            distribution_id = self.__distribution_index.get_caller_reference(caller_reference)
+            if distribution_id is not None:
+                distribution = self.get_distribution_matching_caller_reference(distribution_id, caller_reference)
                 if distribution is not None:
-                    distribution_config = distribution[distribution_name].get(distribution_config_name)
-                    if (
-                        distribution_config is not None
-                        and distribution_config.get("CallerReference") == caller_reference
-                    ):
-                        distribution[distribution_name][distribution_config_name] = distribution_config
-                        return distribution
+                    return distribution
+                self.__distribution_index.discard_caller_reference(caller_reference)
+
+            distribution_id = self.find_distribution_id_from_caller_reference(caller_reference)
+            if distribution_id is not None:
+                return self.get_distribution_matching_caller_reference(distribution_id, caller_reference)
 
         except Exception as e:
             self.module.fail_json_aws(e, msg="Error validating distribution from caller reference")
 
+    def get_distribution_matching_caller_reference(self, distribution_id, caller_reference):
+        try:
+            distribution = self.__cloudfront_facts_mgr.get_distribution(id=distribution_id, fail_if_error=False)
+        except is_boto3_error_code("NoSuchDistribution"):
+            return None
+        distribution_config = distribution["Distribution"].get("DistributionConfig")
+        if distribution_config is None or distribution_config.get("CallerReference") != caller_reference:
+            return None
+        return distribution
+
+    def find_distribution_id_from_caller_reference(self, caller_reference):
+        """
+        Fetches the configurations of the distributions concurrently, stopping once the caller reference is found.
+        """
+        known_ids = set(self.__distribution_index.caller_references.values())
+        distribution_ids = [
+            dist.get("Id")
+            for dist in self.__cloudfront_facts_mgr.list_distributions(keyed=False)
+            if dist.get("Id") not in known_ids
+        ]
+        if not distribution_ids:
+            return None
+
+        found = None
+        with ThreadPoolExecutor(max_workers=CALLER_REFERENCE_LOOKUP_WORKERS) as executor:
+            futures = {
+                executor.submit(self.get_caller_reference, distribution_id): distribution_id
+                for distribution_id in distribution_ids
+            }
+            try:
+                for future in as_completed(futures):
+                    if future.result() == caller_reference:
+                        found = futures[future]
+                        break
+            finally:
+                for future in futures:
+                    future.cancel()
+
+        # Index everything we fetched, so that later lookups can skip these distributions
+        for future, distribution_id in futures.items():
+            if future.done() and not future.cancelled() and future.exception() is None:
+                self.__distribution_index.set_caller_reference(future.result(), distribution_id)
+        return found
+
+    def get_caller_reference(self, distribution_id):
+        try:
+            config = self.__cloudfront_facts_mgr.get_distribution_config(id=distribution_id, fail_if_error=False)
+        except is_boto3_error_code("NoSuchDistribution"):
+            return None
+        return config.get("DistributionConfig", {}).get("CallerReference")
+
+    def add_distribution_to_index(self, caller_reference, distribution_id):
+        self.__distribution_index.set_caller_reference(caller_reference, distribution_id)
+
+    def remove_distribution_from_index(self, caller_reference):
+        self.__distribution_index.discard_caller_reference(caller_reference)
+
+    def discard_alias_index(self):
+        self.__alias_lookup.discard()
+
+    def save_distribution_index(self):
+        try:
+            self.__distribution_index.save()
+        except OSError as e:
+            self.module.warn(f"Unable to write the distribution cache {self.__distribution_index.path}: {to_native(e)}")
+
     def validate_distribution_from_aliases_caller_reference(self, distribution_id, aliases, caller_reference):
         try:
             if caller_reference is not None:
@@ -2825,13 +2919,7 @@ class CloudFrontValidationManager(object):
             )
 
     def validate_distribution_id_from_alias(self, aliases):
-        distributions = self.__cloudfront_facts_mgr.list_distributions(keyed=False)
-        if distributions:
-            for distribution in distributions:
-                distribution_aliases = distribution.get("Aliases", {}).get("Items", [])
-                if set(aliases) & set(distribution_aliases):
-                    return distribution["Id"]
-        return None
+        return self.__alias_lookup.lookup(aliases)
 
     def wait_until_processed(self, client, wait_timeout, distribution_id, caller_reference):
         if distribution_id is None:
@@ -2958,6 +3046,8 @@ def main():
         default_origin_path=dict(),
         wait=dict(default=False, type="bool"),
         wait_timeout=dict(default=1800, type="int"),
+        distribution_cache_path=dict(type="path"),
+        distribution_cache_ttl=dict(type="int", default=3600),
     )
 
     result = {}
@@ -3021,6 +3111,7 @@ def main():
     delete = state == "absent" and distribution
 
     if not (update or create or delete):
+        validation_mgr.save_distribution_index()
         module.exit_json(changed=False)
 
     config = {}
@@ -3075,6 +3166,10 @@ def main():
     if create:
         config["CallerReference"] = validation_mgr.validate_caller_reference(caller_reference)
         result = create_distribution(client, module, config, ansible_dict_to_boto3_tag_list(tags or {}))
+        # waiting on the new distribution doesn't need to look it up again
+        distribution_id = result["Id"]
+        validation_mgr.add_distribution_to_index(config["CallerReference"], distribution_id)
+        validation_mgr.discard_alias_index()
         result = camel_dict_to_snake_dict(result)
         duplicate_keys_for_deprecation(result)
         result["tags"] = list_tags_for_resource(client, module, result["arn"])
@@ -3090,11 +3185,15 @@ def main():
         # e_tag = distribution['ETag']
         result = delete_distribution(client, module, distribution)
         result.pop("ResponseMetadata", None)
+        validation_mgr.remove_distribution_from_index(config.get("CallerReference"))
+        validation_mgr.discard_alias_index()
 
     if update:
         changed = config != distribution["Distribution"]["DistributionConfig"]
         if changed:
             result = update_distribution(client, module, config, distribution_id, e_tag)
+            if config.get("Aliases") != distribution["Distribution"]["DistributionConfig"].get("Aliases"):
+                validation_mgr.discard_alias_index()
         else:
             result = distribution["Distribution"]
         existing_tags = list_tags_for_resource(client, module, result["ARN"])
@@ -3116,6 +3215,8 @@ def main():
         result.update(result["distribution_config"])
         del result["distribution_config"]
 
+    validation_mgr.save_distribution_index()
+
     module.exit_json(changed=changed, **result)
 
 
@@ -139,6 +139,22 @@ options:
         required: false
         default: false
         type: bool
+    distribution_cache_path:
+        description:
+          - Path of a local file used to cache the index of distributions by alias used to find the distribution
+            for I(domain_name_alias) between runs.
+          - The same file can be shared with M(community.aws.cloudfront_distribution).
+        required: false
+        type: path
+        version_added: 12.0.0
+    distribution_cache_ttl:
+        description:
+          - The number of seconds the index of distributions by alias stored in I(distribution_cache_path) is used for
+            before the distributions are listed again.
+        required: false
+        default: 3600
+        type: int
+        version_added: 12.0.0
 
 extends_documentation_fragment:
   - amazon.aws.common.modules
@@ -242,8 +258,12 @@ result:
     type: dict
 """
 
+from ansible.module_utils.common.text.converters import to_native
+
 from ansible_collections.amazon.aws.plugins.module_utils.cloudfront_facts import CloudFrontFactsServiceManager
 
+from ansible_collections.community.aws.plugins.module_utils.cloudfront import DistributionAliasLookup
+from ansible_collections.community.aws.plugins.module_utils.cloudfront import DistributionIndexCache
 from ansible_collections.community.aws.plugins.module_utils.modules import AnsibleCommunityAWSModule as AnsibleAWSModule
 
 
@@ -258,6 +278,30 @@ def set_facts_for_distribution_id_and_alias(details, facts, distribution_id, ali
     return facts
 
 
+def get_distribution_id_from_alias(module, service_mgr, domain_name_alias):
+    distribution_index = DistributionIndexCache(
+        module.params.get("distribution_cache_path"), module.params.get("distribution_cache_ttl")
+    )
+    distribution_index.load()
+    distribution_id = DistributionAliasLookup(service_mgr, distribution_index).lookup([domain_name_alias])
+    try:
+        distribution_index.save()
+    except OSError as e:
+        module.warn(f"Unable to write the distribution cache {distribution_index.path}: {to_native(e)}")
+    if distribution_id is None:
+        # The index only covers web distributions, and the lookup has already listed all of them
+        distribution_id = get_streaming_distribution_id_from_alias(service_mgr, domain_name_alias)
+    return distribution_id
+
+
+def get_streaming_distribution_id_from_alias(service_mgr, domain_name_alias):
+    for distribution in service_mgr.list_streaming_distributions(keyed=False):
+        aliases = distribution["Aliases"].get("Items", [])
+        if any(str(alias).lower() == domain_name_alias.lower() for alias in aliases):
+            return distribution["Id"]
+    return None
+
+
 def main():
     argument_spec = dict(
         distribution_id=dict(required=False, type="str"),
@@ -278,6 +322,8 @@ def main():
         list_invalidations=dict(required=False, default=False, type="bool"),
         list_streaming_distributions=dict(required=False, default=False, type="bool"),
         summary=dict(required=False, default=False, type="bool"),
+        distribution_cache_path=dict(required=False, type="path"),
+        distribution_cache_ttl=dict(required=False, default=3600, type="int"),
     )
 
     module = AnsibleAWSModule(argument_spec=argument_spec, supports_check_mode=True)
@@ -345,7 +391,7 @@ def main():
 
     # get distribution id from domain name alias
     if require_distribution_id and distribution_id is None:
-        distribution_id = service_mgr.get_distribution_id_from_domain_name(domain_name_alias)
+        distribution_id = get_distribution_id_from_alias(module, service_mgr, domain_name_alias)
         if not distribution_id:
             module.fail_json(msg="Error unable to source a distribution id from domain_name_alias")
 
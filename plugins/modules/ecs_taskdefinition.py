@@ -46,7 +46,8 @@ options:
         description:
             - A list of containers definitions.
             - See U(https://boto3.amazonaws.com/v1/documentation/api/latest/reference/services/ecs.html) for a complete list of parameters.
-        required: True
+            - Required when I(state=present).
+        required: False
         type: list
         elements: dict
         suboptions:
@@ -648,6 +649,45 @@ options:
                 type: str
                 required: false
                 choices: ['LINUX', 'WINDOWS_SERVER_2019_FULL', 'WINDOWS_SERVER_2019_CORE', 'WINDOWS_SERVER_2022_FULL', 'WINDOWS_SERVER_2022_CORE']
+    task_definition_cache_path:
+        version_added: 12.0.0
+        description:
+            - Path of a local file used to remember which revision matched a requested task definition between runs.
+            - When the same definition is requested again only that revision is described, rather than
+              searching the ACTIVE revisions of the family for a match.
+            - A cached revision which is no longer ACTIVE is ignored.
+            - Entries are kept per account and region, the account ID is looked up using C(sts:GetCallerIdentity)
+              (or C(iam:GetUser)).
+        required: false
+        type: path
+    max_concurrency:
+        version_added: 12.0.0
+        description:
+            - When the newest ACTIVE revision of the family doesn't match the requested task definition,
+              the maximum number of older revisions to describe concurrently while searching for a match.
+            - With I(keep_revisions), the maximum number of concurrent deregistration and deletion calls.
+        required: false
+        type: int
+        default: 10
+    keep_revisions:
+        version_added: 12.0.0
+        description:
+            - With I(state=absent), deregister all but the newest I(keep_revisions) ACTIVE revisions of I(family).
+            - The revisions of the family are only listed once, the summary of the cleanup is returned in RV(cleanup_summary).
+            - Can only be used with I(state=absent).
+            - Mutually exclusive with I(arn) and I(revision).
+            - Must be at least 1.
+        required: false
+        type: int
+    delete_revisions:
+        version_added: 12.0.0
+        description:
+            - With I(keep_revisions), also delete the revisions which are deregistered, along with
+              any revisions of I(family) which were already INACTIVE.
+            - Deleted revisions can't be used to run tasks or update services anymore.
+        required: false
+        type: bool
+        default: false
 extends_documentation_fragment:
     - amazon.aws.common.modules
     - amazon.aws.region.modules
@@ -789,39 +829,108 @@ EXAMPLES = r"""
           startPeriod: 15
           timeout: 15
     state: present
+
+# Deregister and delete all but the 10 most recent revisions of a family
+- name: Clean up old revisions
+  community.aws.ecs_taskdefinition:
+    family: nginx
+    keep_revisions: 10
+    delete_revisions: true
+    state: absent
 """
 
 RETURN = r"""
 taskdefinition:
     description: a reflection of the input parameters
     type: dict
-    returned: always
+    returned: when I(keep_revisions) isn't set
+cleanup_summary:
+    description: A summary of the revisions cleaned up with I(keep_revisions).
+    type: dict
+    returned: when I(keep_revisions) is set
+    version_added: 12.0.0
+    contains:
+        kept:
+            description: The number of ACTIVE revisions which were kept.
+            type: int
+            sample: 10
+        deregistered:
+            description: The number of revisions which were (or in check mode would have been) deregistered.
+            type: int
+            sample: 250
+        deleted:
+            description: The number of revisions which were (or in check mode would have been) deleted.
+            type: int
+            sample: 1200
+        failed:
+            description: The number of revisions which couldn't be deregistered or deleted.
+            type: int
+            sample: 0
+        elapsed:
+            description: The time taken by the cleanup, in seconds.
+            type: float
+            sample: 12.5
+failed_revisions:
+    description: The revisions which couldn't be deregistered or deleted.
+    type: list
+    elements: dict
+    returned: when some revisions couldn't be deregistered or deleted
+    version_added: 12.0.0
+    contains:
+        arn:
+            description: The ARN of the revision.
+            type: str
+        reason:
+            description: Why the revision couldn't be deregistered or deleted.
+            type: str
 """
 
+import itertools
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 try:
     import botocore
 except ImportError:
     pass  # caught by AnsibleAWSModule
 
+from ansible.module_utils.common.text.converters import to_native
+
+from ansible_collections.amazon.aws.plugins.module_utils.botocore import is_boto3_error_code
+from ansible_collections.amazon.aws.plugins.module_utils.iam import get_aws_account_info
 from ansible_collections.amazon.aws.plugins.module_utils.retries import AWSRetry
 
+from ansible_collections.community.aws.plugins.module_utils.ecs import TaskDefinitionCache
+from ansible_collections.community.aws.plugins.module_utils.ecs import task_definition_family
+from ansible_collections.community.aws.plugins.module_utils.ecs import task_definition_revision
 from ansible_collections.community.aws.plugins.module_utils.modules import AnsibleCommunityAWSModule as AnsibleAWSModule
 
+# The most task definitions DeleteTaskDefinitions accepts in a single call
+DELETE_BATCH_SIZE = 10
+
 
 class EcsTaskManager:
     """Handles ECS Tasks"""
 
-    def __init__(self, module):
+    def __init__(self, module, max_concurrency=10):
         self.module = module
+        self.max_concurrency = max_concurrency
 
         self.ecs = module.client("ecs", AWSRetry.jittered_backoff())
 
-    def describe_task(self, task_name):
+    def _describe_task(self, task_name):
+        """Returns the task definition, None if it doesn't exist.  Other errors are raised."""
         try:
             response = self.ecs.describe_task_definition(aws_retry=True, taskDefinition=task_name)
-            return response["taskDefinition"]
-        except (botocore.exceptions.ClientError, botocore.exceptions.BotoCoreError):
+        except is_boto3_error_code(["ClientException", "InvalidParameterException"]):
             return None
+        return response["taskDefinition"]
+
+    def describe_task(self, task_name):
+        try:
+            return self._describe_task(task_name)
+        except (botocore.exceptions.ClientError, botocore.exceptions.BotoCoreError) as e:
+            self.module.fail_json_aws(e, msg=f"Failed to describe task definition {task_name}")
 
     def register_task(
         self,
@@ -906,40 +1015,106 @@ class EcsTaskManager:
 
         return response["taskDefinition"]
 
-    def describe_task_definitions(self, family):
-        data = {"taskDefinitionArns": [], "nextToken": None}
-
-        def fetch():
-            # Boto3 is weird about params passed, so only pass nextToken if we have a value
-            params = {"familyPrefix": family}
-
-            if data["nextToken"]:
-                params["nextToken"] = data["nextToken"]
-
+    def list_task_definition_arns(self, family, status="ACTIVE", sort="DESC"):
+        """
+        Yields the ARNs of the revisions of family (newest first by default), fetching the pages as they're needed.
+        """
+        # Boto3 is weird about params passed, so only pass nextToken if we have a value
+        params = {"familyPrefix": family, "status": status, "sort": sort}
+        while True:
             result = self.ecs.list_task_definitions(aws_retry=True, **params)
-            data["taskDefinitionArns"] += result["taskDefinitionArns"]
-            data["nextToken"] = result.get("nextToken", None)
-            return data["nextToken"] is not None
-
-        # Fetch all the arns, possibly across multiple pages
-        while fetch():
-            pass
-
-        # Return the full descriptions of the task definitions, sorted ascending by revision
-        return list(
-            sorted(
-                [
-                    self.ecs.describe_task_definition(aws_retry=True, taskDefinition=arn)["taskDefinition"]
-                    for arn in data["taskDefinitionArns"]
-                ],
-                key=lambda td: td["revision"],
-            )
-        )
+            for arn in result["taskDefinitionArns"]:
+                # familyPrefix also matches any other family starting with the same name
+                if task_definition_family(arn) == family:
+                    yield arn
+            if not result.get("nextToken"):
+                return
+            params["nextToken"] = result["nextToken"]
+
+    def get_latest_revision(self, family):
+        latest = next(self.list_task_definition_arns(family), None)
+        return task_definition_revision(latest) if latest else None
+
+    def find_task_definition(self, family, matches):
+        """
+        Returns the newest ACTIVE revision of family for which matches(task_definition) is true, None if there isn't one.
+
+        The newest revision is described on its own since that's usually the one which matches,
+        older revisions are then described max_concurrency at a time until one matches.
+        """
+        arns = self.list_task_definition_arns(family)
+        batch_size = 1
+        try:
+            with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+                while True:
+                    batch = list(itertools.islice(arns, batch_size))
+                    if not batch:
+                        return None
+                    for td in executor.map(self._describe_task, batch):
+                        if td is not None and matches(td):
+                            return td
+                    batch_size = self.max_concurrency
+        # A revision we failed to describe may well be the matching one, don't register a duplicate
+        except (botocore.exceptions.ClientError, botocore.exceptions.BotoCoreError) as e:
+            self.module.fail_json_aws(e, msg=f"Failed to search the task definitions of {family}")
 
     def deregister_task(self, taskArn):
         response = self.ecs.deregister_task_definition(aws_retry=True, taskDefinition=taskArn)
         return response["taskDefinition"]
 
+    def delete_tasks(self, taskArns):
+        """Deletes up to DELETE_BATCH_SIZE INACTIVE task definitions, returns the failures."""
+        response = self.ecs.delete_task_definitions(aws_retry=True, taskDefinitions=taskArns)
+        return [
+            {"arn": failure.get("arn"), "reason": failure.get("reason")} for failure in response.get("failures", [])
+        ]
+
+    def cleanup_revisions(self, family, keep, delete=False, check_mode=False):
+        """
+        Deregisters all but the newest keep ACTIVE revisions of family (and deletes them if delete is set).
+
+        Returns a summary of the cleanup and a list of the revisions which couldn't be deregistered or deleted.
+        """
+        start = time.time()
+        active = list(self.list_task_definition_arns(family))
+        doomed = active[keep:]
+        inactive = list(self.list_task_definition_arns(family, status="INACTIVE")) if delete else []
+        deregistered = doomed
+        to_delete = doomed + inactive if delete else []
+        failed = []
+        delete_failures = []
+
+        if not check_mode:
+            with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+                deregistrations = [executor.submit(self.deregister_task, arn) for arn in doomed]
+                deregistered = []
+                for arn, future in zip(doomed, deregistrations):
+                    try:
+                        future.result()
+                        deregistered.append(arn)
+                    except (botocore.exceptions.ClientError, botocore.exceptions.BotoCoreError) as e:
+                        failed.append({"arn": arn, "reason": to_native(e)})
+
+                # Only INACTIVE revisions can be deleted
+                to_delete = deregistered + inactive if delete else []
+                batches = [to_delete[i : i + DELETE_BATCH_SIZE] for i in range(0, len(to_delete), DELETE_BATCH_SIZE)]
+                deletions = [executor.submit(self.delete_tasks, batch) for batch in batches]
+                for batch, future in zip(batches, deletions):
+                    try:
+                        delete_failures.extend(future.result())
+                    except (botocore.exceptions.ClientError, botocore.exceptions.BotoCoreError) as e:
+                        delete_failures.extend({"arn": arn, "reason": to_native(e)} for arn in batch)
+                failed.extend(delete_failures)
+
+        summary = dict(
+            kept=len(active) - len(doomed),
+            deregistered=len(deregistered),
+            deleted=len(to_delete) - len(delete_failures),
+            failed=len(failed),
+            elapsed=round(time.time() - start, 3),
+        )
+        return summary, failed
+
 
 def main():
     argument_spec = dict(
@@ -948,7 +1123,7 @@ def main():
         family=dict(required=False, type="str"),
         revision=dict(required=False, type="int"),
         force_create=dict(required=False, default=False, type="bool"),
-        containers=dict(required=True, type="list", elements="dict"),
+        containers=dict(required=False, type="list", elements="dict"),
         network_mode=dict(
             required=False, default="bridge", choices=["default", "bridge", "host", "none", "awsvpc"], type="str"
         ),
@@ -982,16 +1157,29 @@ def main():
                 ),
             ),
         ),
+        task_definition_cache_path=dict(required=False, type="path"),
+        max_concurrency=dict(required=False, default=10, type="int"),
+        keep_revisions=dict(required=False, type="int"),
+        delete_revisions=dict(required=False, default=False, type="bool"),
     )
 
     module = AnsibleAWSModule(
         argument_spec=argument_spec,
         supports_check_mode=True,
-        required_if=[("launch_type", "FARGATE", ["cpu", "memory"])],
+        required_if=[("launch_type", "FARGATE", ["cpu", "memory"]), ("state", "present", ["containers"])],
+        mutually_exclusive=[["keep_revisions", "arn"], ["keep_revisions", "revision"]],
+        required_by={"keep_revisions": "family"},
     )
 
+    if module.params["max_concurrency"] < 1:
+        module.fail_json(msg="max_concurrency must be at least 1")
+
+    if module.params["keep_revisions"] is not None and module.params["state"] != "absent":
+        module.fail_json(msg="keep_revisions can only be used with state=absent")
+
     task_to_describe = None
-    task_mgr = EcsTaskManager(module)
+    task_mgr = EcsTaskManager(module, module.params["max_concurrency"])
+    task_definition_cache = TaskDefinitionCache(module.params["task_definition_cache_path"])
     results = dict(changed=False)
 
     if module.params["state"] == "present":
@@ -1049,15 +1237,14 @@ def main():
                 module.fail_json(msg="extraHosts parameter is not supported when the awsvpc network mode is used.")
 
         family = module.params["family"]
-        existing_definitions_in_family = task_mgr.describe_task_definitions(module.params["family"])
+        fingerprint = None
 
         if "revision" in module.params and module.params["revision"]:
             # The definition specifies revision. We must guarantee that an active revision of that number will result from this.
             revision = int(module.params["revision"])
 
             # A revision has been explicitly specified. Attempt to locate a matching revision
-            tasks_defs_for_revision = [td for td in existing_definitions_in_family if td["revision"] == revision]
-            existing = tasks_defs_for_revision[0] if len(tasks_defs_for_revision) > 0 else None
+            existing = task_mgr.describe_task(f"{family}:{revision}")
 
             if existing and existing["status"] != "ACTIVE":
                 # We cannot reactivate an inactive revision
@@ -1065,17 +1252,21 @@ def main():
                     msg=f"A task in family '{family}' already exists for revision {int(revision)}, but it is inactive"
                 )
             elif not existing:
-                if not existing_definitions_in_family and revision != 1:
+                latest_revision = task_mgr.get_latest_revision(family)
+                if latest_revision is None and revision != 1:
                     module.fail_json(
                         msg=f"You have specified a revision of {int(revision)} but a created revision would be 1"
                     )
-                elif existing_definitions_in_family and existing_definitions_in_family[-1]["revision"] + 1 != revision:
+                elif latest_revision is not None and latest_revision + 1 != revision:
                     module.fail_json(
                         msg=(
                             f"You have specified a revision of {int(revision)} but a created revision would be"
-                            f" {int(existing_definitions_in_family[-1]['revision'] + 1)}"
+                            f" {int(latest_revision + 1)}"
                         )
                     )
+        elif module.params.get("force_create"):
+            # A new revision's registered whether or not one already matches
+            existing = None
         else:
             existing = None
 
@@ -1121,18 +1312,18 @@ def main():
                 requested_launch_type,
                 existing_task_definition,
             ):
-                if td["status"] != "ACTIVE":
+                if existing_task_definition["status"] != "ACTIVE":
                     return None
 
-                if requested_task_role_arn != td.get("taskRoleArn", ""):
+                if requested_task_role_arn != existing_task_definition.get("taskRoleArn", ""):
                     return None
 
-                if requested_launch_type is not None and requested_launch_type not in td.get(
+                if requested_launch_type is not None and requested_launch_type not in existing_task_definition.get(
                     "requiresCompatibilities", []
                 ):
                     return None
 
-                existing_volumes = td.get("volumes", []) or []
+                existing_volumes = existing_task_definition.get("volumes", []) or []
 
                 if len(requested_volumes) != len(existing_volumes):
                     # Nope.
@@ -1150,7 +1341,7 @@ def main():
                         if not found:
                             return None
 
-                existing_containers = td.get("containerDefinitions", []) or []
+                existing_containers = existing_task_definition.get("containerDefinitions", []) or []
 
                 if len(requested_containers) != len(existing_containers):
                     # Nope.
@@ -1169,18 +1360,40 @@ def main():
 
                 return existing_task_definition
 
-            # No revision explicitly specified. Attempt to find an active, matching revision that has all the properties requested
-            for td in existing_definitions_in_family:
-                requested_volumes = module.params["volumes"] or []
-                requested_containers = module.params["containers"] or []
-                requested_task_role_arn = module.params["task_role_arn"]
-                requested_launch_type = module.params["launch_type"]
-                existing = _task_definition_matches(
+            requested_volumes = module.params["volumes"] or []
+            requested_containers = module.params["containers"] or []
+            requested_task_role_arn = module.params["task_role_arn"]
+            requested_launch_type = module.params["launch_type"]
+
+            def _matches(td):
+                return _task_definition_matches(
                     requested_volumes, requested_containers, requested_task_role_arn, requested_launch_type, td
                 )
 
-                if existing:
-                    break
+            # The revision which matched the same request last time (if it's still active) saves searching for one
+            cached_arn = None
+            if task_definition_cache.path:
+                task_definition_cache.load()
+                account_id, _partition = get_aws_account_info(module)
+                fingerprint = TaskDefinitionCache.fingerprint(
+                    account_id=account_id,
+                    region=module.region,
+                    family=family,
+                    volumes=requested_volumes,
+                    containers=requested_containers,
+                    task_role_arn=requested_task_role_arn,
+                    launch_type=requested_launch_type,
+                )
+                cached_arn = task_definition_cache.get(fingerprint)
+            if cached_arn:
+                existing = task_mgr.describe_task(cached_arn)
+                if not existing or existing["status"] != "ACTIVE":
+                    existing = None
+                    task_definition_cache.discard(fingerprint)
+
+            # No revision explicitly specified. Attempt to find an active, matching revision that has all the properties requested
+            if not existing:
+                existing = task_mgr.find_task_definition(family, _matches)
 
         if existing and not module.params.get("force_create"):
             # Awesome. Have an existing one. Nothing to do.
@@ -1204,6 +1417,36 @@ def main():
                 )
             results["changed"] = True
 
+        if fingerprint and "taskdefinition" in results:
+            task_definition_cache.set(fingerprint, results["taskdefinition"]["taskDefinitionArn"])
+            try:
+                task_definition_cache.save()
+            except OSError as e:
+                module.warn(f"Unable to write the task definition cache {task_definition_cache.path}: {to_native(e)}")
+
+    elif module.params["state"] == "absent" and module.params["keep_revisions"] is not None:
+        # Deregister (and delete) all but the newest revisions of the family
+        if module.params["keep_revisions"] < 1:
+            module.fail_json(msg="keep_revisions must be at least 1")
+
+        try:
+            summary, failed = task_mgr.cleanup_revisions(
+                module.params["family"],
+                module.params["keep_revisions"],
+                delete=module.params["delete_revisions"],
+                check_mode=module.check_mode,
+            )
+        except (botocore.exceptions.ClientError, botocore.exceptions.BotoCoreError) as e:
+            module.fail_json_aws(
+                e, msg=f"Failed to list the revisions of task definition family {module.params['family']}"
+            )
+
+        results["changed"] = bool(summary["deregistered"] or summary["deleted"])
+        results["cleanup_summary"] = summary
+        if failed:
+            results["failed_revisions"] = failed
+            module.fail_json(msg=f"Failed to clean up {len(failed)} revisions", **results)
+
     elif module.params["state"] == "absent":
         # When de-registering a task definition, we can specify the ARN OR the family and revision.
         if module.params["state"] == "absent":
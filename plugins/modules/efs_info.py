@@ -33,9 +33,30 @@ options:
       description:
       - List of targets on which to filter the returned results.
       - Result must match all of the specified targets, each of which can be a security group ID, a subnet ID or an IP address.
+      - The mount targets (and their security groups if needed) are retrieved to filter the results even when
+        I(include_mount_targets=false) or I(include_security_groups=false).
       type: list
       elements: str
       default: []
+    include_mount_targets:
+      description:
+      - Whether to retrieve the mount targets of each file system.
+      type: bool
+      default: true
+      version_added: 12.0.0
+    include_security_groups:
+      description:
+      - Whether to retrieve the security groups of each mount target.
+      - Requires one call per mount target, ignored when I(include_mount_targets=false).
+      type: bool
+      default: true
+      version_added: 12.0.0
+    max_concurrency:
+      description:
+      - The maximum number of concurrent calls used to retrieve the mount targets and security groups.
+      type: int
+      default: 10
+      version_added: 12.0.0
 extends_documentation_fragment:
 - amazon.aws.common.modules
 - amazon.aws.region.modules
@@ -61,6 +82,11 @@ EXAMPLES = r"""
       - sg-4d3c2b1a
   register: result
 
+- name: List all file systems without their mount targets
+  community.aws.efs_info:
+    include_mount_targets: false
+  register: result
+
 - ansible.builtin.debug:
     msg: "{{ result['efs'] }}"
 """
@@ -97,8 +123,10 @@ filesystem_address:
     type: str
     sample: fs-xxxxxxxx.efs.us-west-2.amazonaws.com:/
 mount_targets:
-    description: list of mount targets
-    returned: always
+    description:
+    - list of mount targets
+    - The C(security_groups) of the mount targets are only returned when I(include_security_groups=true).
+    returned: when I(include_mount_targets=true) or I(targets) is set
     type: list
     sample:
         [
@@ -168,6 +196,7 @@ tags:
 
 
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 
 try:
     import botocore
@@ -189,7 +218,7 @@ class EFSConnection(object):
     STATE_DELETING = "deleting"
     STATE_DELETED = "deleted"
 
-    def __init__(self, module):
+    def __init__(self, module, max_concurrency=10):
         try:
             self.connection = module.client("efs")
             self.module = module
@@ -197,6 +226,7 @@ class EFSConnection(object):
             module.fail_json(msg=f"Failed to connect to AWS: {to_native(e)}")
 
         self.region = module.region
+        self.max_concurrency = max_concurrency
 
     @AWSRetry.exponential_backoff(catch_extra_error_codes=["ThrottlingException"])
     def list_file_systems(self, **kwargs):
@@ -233,9 +263,13 @@ class EFSConnection(object):
 
     def get_mount_targets_data(self, file_systems):
         for item in file_systems:
-            if item["life_cycle_state"] == self.STATE_AVAILABLE:
+            item["mount_targets"] = []
+        available = [item for item in file_systems if item["life_cycle_state"] == self.STATE_AVAILABLE]
+        with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+            futures = [executor.submit(self.get_mount_targets, item["file_system_id"]) for item in available]
+            for item, future in zip(available, futures):
                 try:
-                    mount_targets = self.get_mount_targets(item["file_system_id"])
+                    mount_targets = future.result()
                 except (botocore.exceptions.ClientError, botocore.exceptions.BotoCoreError) as e:
                     self.module.fail_json_aws(e, msg="Couldn't get EFS targets")
                 for mt in mount_targets:
@@ -243,19 +277,17 @@ class EFSConnection(object):
         return file_systems
 
     def get_security_groups_data(self, file_systems):
-        for item in file_systems:
-            if item["life_cycle_state"] == self.STATE_AVAILABLE:
-                for target in item["mount_targets"]:
-                    if target["life_cycle_state"] == self.STATE_AVAILABLE:
-                        try:
-                            target["security_groups"] = self.get_security_groups(target["mount_target_id"])
-                        except (botocore.exceptions.ClientError, botocore.exceptions.BotoCoreError) as e:
-                            self.module.fail_json_aws(e, msg="Couldn't get EFS security groups")
-                    else:
-                        target["security_groups"] = []
-            else:
-                item["tags"] = {}
-                item["mount_targets"] = []
+        targets = [target for item in file_systems for target in item["mount_targets"]]
+        for target in targets:
+            target["security_groups"] = []
+        available = [target for target in targets if target["life_cycle_state"] == self.STATE_AVAILABLE]
+        with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+            futures = [executor.submit(self.get_security_groups, target["mount_target_id"]) for target in available]
+            for target, future in zip(available, futures):
+                try:
+                    target["security_groups"] = future.result()
+                except (botocore.exceptions.ClientError, botocore.exceptions.BotoCoreError) as e:
+                    self.module.fail_json_aws(e, msg="Couldn't get EFS security groups")
         return file_systems
 
     def get_file_systems(self, file_system_id=None, creation_token=None):
@@ -284,15 +316,19 @@ class EFSConnection(object):
 
             if "Timestamp" in item["SizeInBytes"]:
                 item["SizeInBytes"]["Timestamp"] = str(item["SizeInBytes"]["Timestamp"])
+            tags = item.pop("Tags", None)
             result = camel_dict_to_snake_dict(item)
             result["tags"] = {}
-            result["mount_targets"] = []
             # Set tags *after* doing camel to snake
             if result["life_cycle_state"] == self.STATE_AVAILABLE:
-                try:
-                    result["tags"] = self.get_tags(result["file_system_id"])
-                except (botocore.exceptions.ClientError, botocore.exceptions.BotoCoreError) as e:
-                    self.module.fail_json_aws(e, msg="Couldn't get EFS tags")
+                # The tags are included in the description of the file system, no need to look them up again
+                if tags is not None:
+                    result["tags"] = boto3_tag_list_to_ansible_dict(tags)
+                else:
+                    try:
+                        result["tags"] = self.get_tags(result["file_system_id"])
+                    except (botocore.exceptions.ClientError, botocore.exceptions.BotoCoreError) as e:
+                        self.module.fail_json_aws(e, msg="Couldn't get EFS tags")
             results.append(result)
         return results
 
@@ -362,29 +398,50 @@ def main():
         name=dict(aliases=["creation_token"]),
         tags=dict(type="dict", default={}),
         targets=dict(type="list", default=[], elements="str"),
+        include_mount_targets=dict(type="bool", default=True),
+        include_security_groups=dict(type="bool", default=True),
+        max_concurrency=dict(type="int", default=10),
     )
 
     module = AnsibleAWSModule(argument_spec=argument_spec, supports_check_mode=True)
 
-    connection = EFSConnection(module)
+    if module.params.get("max_concurrency") < 1:
+        module.fail_json(msg="max_concurrency must be at least 1")
+
+    connection = EFSConnection(module, module.params.get("max_concurrency"))
 
     name = module.params.get("name")
     fs_id = module.params.get("id")
     tags = module.params.get("tags")
     targets = module.params.get("targets")
+    include_mount_targets = module.params.get("include_mount_targets")
+    include_security_groups = include_mount_targets and module.params.get("include_security_groups")
 
     file_systems_info = connection.get_file_systems(fs_id, name)
 
     if tags:
         file_systems_info = [item for item in file_systems_info if has_tags(item["tags"], tags)]
 
-    file_systems_info = connection.get_mount_targets_data(file_systems_info)
-    file_systems_info = connection.get_security_groups_data(file_systems_info)
-
     if targets:
         targets = [(item, prefix_to_attr(item)) for item in targets]
+
+    # The mount targets and their security groups are needed to filter on targets
+    filter_security_groups = any(attr == "security_groups" for item, attr in targets)
+    if include_mount_targets or targets:
+        file_systems_info = connection.get_mount_targets_data(file_systems_info)
+    if include_security_groups or filter_security_groups:
+        file_systems_info = connection.get_security_groups_data(file_systems_info)
+
+    if targets:
         file_systems_info = [item for item in file_systems_info if has_targets(item["mount_targets"], targets)]
 
+    for item in file_systems_info:
+        if not include_mount_targets:
+            item.pop("mount_targets", None)
+        elif not include_security_groups:
+            for target in item["mount_targets"]:
+                target.pop("security_groups", None)
+
     module.exit_json(changed=False, efs=file_systems_info)
 
 
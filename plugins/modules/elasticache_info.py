@@ -15,6 +15,26 @@ options:
     description:
       - The name of an ElastiCache cluster.
     type: str
+  include_tags:
+    description:
+      - Whether to retrieve the tags of each cluster.
+      - The tags are retrieved with one call per cluster, made by up to I(max_concurrency) concurrent workers.
+    type: bool
+    default: true
+    version_added: 12.0.0
+  include_replication_group:
+    description:
+      - Whether to retrieve the details of the replication group of each cluster.
+      - The replication groups are all described at once and shared by the clusters which belong to them.
+    type: bool
+    default: true
+    version_added: 12.0.0
+  max_concurrency:
+    description:
+      - The maximum number of concurrent calls used to retrieve the tags of the clusters.
+    type: int
+    default: 10
+    version_added: 12.0.0
 author:
   - Will Thames (@willthames)
 extends_documentation_fragment:
@@ -30,6 +50,11 @@ EXAMPLES = r"""
 - name: obtain all information for a single ElastiCache cluster
   community.aws.elasticache_info:
     name: test_elasticache
+
+- name: quickly list the ElastiCache clusters of a large fleet without their tags or replication groups
+  community.aws.elasticache_info:
+    include_tags: false
+    include_replication_group: false
 """
 
 RETURN = r"""
@@ -200,7 +225,7 @@ elasticache_clusters:
     replication_group:
       description: Informations about the associated replication group.
       version_added: 4.1.0
-      returned: if replication is enabled
+      returned: if replication is enabled and I(include_replication_group=true)
       type: dict
       contains:
         arn:
@@ -395,13 +420,15 @@ elasticache_clusters:
           sample: active
     tags:
       description: Tags applied to the ElastiCache cluster
-      returned: always
+      returned: when I(include_tags=true)
       type: dict
       sample:
         Application: web
         Environment: test
 """
 
+from concurrent.futures import ThreadPoolExecutor
+
 try:
     import botocore
 except ImportError:
@@ -431,13 +458,16 @@ def describe_cache_clusters_with_backoff(client, cluster_id=None):
 
 
 @AWSRetry.exponential_backoff()
-def describe_replication_group_with_backoff(client, replication_group_id):
+def describe_replication_groups_with_backoff(client, replication_group_id=None):
+    paginator = client.get_paginator("describe_replication_groups")
+    params = dict()
+    if replication_group_id:
+        params["ReplicationGroupId"] = replication_group_id
     try:
-        response = client.describe_replication_groups(ReplicationGroupId=replication_group_id)
+        response = paginator.paginate(**params).build_full_result()
     except is_boto3_error_code("ReplicationGroupNotFoundFault"):
-        return None
-
-    return response["ReplicationGroups"][0]
+        return []
+    return response["ReplicationGroups"]
 
 
 @AWSRetry.exponential_backoff()
@@ -445,48 +475,93 @@ def get_elasticache_tags_with_backoff(client, cluster_id):
     return client.list_tags_for_resource(ResourceName=cluster_id)["TagList"]
 
 
-def get_elasticache_clusters(client, module):
-    region = module.region
+def get_replication_groups(client, module, replication_group_ids):
+    """
+    Returns the replication groups in replication_group_ids keyed by ID.
+
+    A single group is described on its own, otherwise all of the groups are listed at once
+    rather than describing the same group again for each of its nodes.
+    """
+    if not replication_group_ids:
+        return {}
+    replication_group_id = None
+    if len(replication_group_ids) == 1:
+        replication_group_id = next(iter(replication_group_ids))
     try:
-        clusters = describe_cache_clusters_with_backoff(client, cluster_id=module.params.get("name"))
+        replication_groups = describe_replication_groups_with_backoff(client, replication_group_id)
     except (botocore.exceptions.ClientError, botocore.exceptions.BotoCoreError) as e:
-        module.fail_json_aws(e, msg="Couldn't obtain cache cluster info")
+        module.fail_json_aws(e, msg="Couldn't obtain replication group info")
+    return {
+        group["ReplicationGroupId"]: camel_dict_to_snake_dict(group)
+        for group in replication_groups
+        if group["ReplicationGroupId"] in replication_group_ids
+    }
 
+
+def add_elasticache_tags(client, module, clusters):
+    """Adds the tags to each of the clusters, using up to max_concurrency concurrent calls."""
+    region = module.region
     account_id, partition = get_aws_account_info(module)
     results = []
-    for cluster in clusters:
-        cluster = camel_dict_to_snake_dict(cluster)
-        arn = f"arn:{partition}:elasticache:{region}:{account_id}:cluster:{cluster['cache_cluster_id']}"
-        try:
-            tags = get_elasticache_tags_with_backoff(client, arn)
-        except is_boto3_error_code("CacheClusterNotFound"):
-            # e.g: Cluster was listed but is in deleting state
-            continue
-        except (botocore.exceptions.ClientError, botocore.exceptions.BotoCoreError) as e:
-            module.fail_json_aws(e, msg=f"Couldn't get tags for cluster {cluster['cache_cluster_id']}")
-
-        cluster["tags"] = boto3_tag_list_to_ansible_dict(tags)
-
-        if cluster.get("replication_group_id", None):
+    with ThreadPoolExecutor(max_workers=module.params.get("max_concurrency")) as executor:
+        tag_lists = [
+            executor.submit(
+                get_elasticache_tags_with_backoff,
+                client,
+                f"arn:{partition}:elasticache:{region}:{account_id}:cluster:{cluster['cache_cluster_id']}",
+            )
+            for cluster in clusters
+        ]
+        for cluster, tags in zip(clusters, tag_lists):
             try:
-                replication_group = describe_replication_group_with_backoff(client, cluster["replication_group_id"])
+                tags = tags.result()
+            except is_boto3_error_code("CacheClusterNotFound"):
+                # e.g: Cluster was listed but is in deleting state
+                continue
             except (botocore.exceptions.ClientError, botocore.exceptions.BotoCoreError) as e:
-                module.fail_json_aws(e, msg="Couldn't obtain replication group info")
+                module.fail_json_aws(e, msg=f"Couldn't get tags for cluster {cluster['cache_cluster_id']}")
 
-            if replication_group is not None:
-                replication_group = camel_dict_to_snake_dict(replication_group)
-                cluster["replication_group"] = replication_group
-
-        results.append(cluster)
+            cluster["tags"] = boto3_tag_list_to_ansible_dict(tags)
+            results.append(cluster)
     return results
 
 
+def get_elasticache_clusters(client, module):
+    try:
+        clusters = describe_cache_clusters_with_backoff(client, cluster_id=module.params.get("name"))
+    except (botocore.exceptions.ClientError, botocore.exceptions.BotoCoreError) as e:
+        module.fail_json_aws(e, msg="Couldn't obtain cache cluster info")
+
+    # Clusters which are being deleted are skipped, whether or not we look up their tags
+    clusters = [
+        camel_dict_to_snake_dict(cluster) for cluster in clusters if cluster.get("CacheClusterStatus") != "deleting"
+    ]
+
+    if module.params.get("include_tags"):
+        clusters = add_elasticache_tags(client, module, clusters)
+
+    if module.params.get("include_replication_group"):
+        replication_group_ids = set(c["replication_group_id"] for c in clusters if c.get("replication_group_id"))
+        replication_groups = get_replication_groups(client, module, replication_group_ids)
+        for cluster in clusters:
+            if cluster.get("replication_group_id") in replication_groups:
+                cluster["replication_group"] = replication_groups[cluster["replication_group_id"]]
+
+    return clusters
+
+
 def main():
     argument_spec = dict(
         name=dict(required=False),
+        include_tags=dict(type="bool", default=True),
+        include_replication_group=dict(type="bool", default=True),
+        max_concurrency=dict(type="int", default=10),
     )
     module = AnsibleAWSModule(argument_spec=argument_spec, supports_check_mode=True)
 
+    if module.params.get("max_concurrency") < 1:
+        module.fail_json(msg="max_concurrency must be at least 1")
+
     client = module.client("elasticache")
 
     module.exit_json(elasticache_clusters=get_elasticache_clusters(client, module))
@@ -12,19 +12,36 @@ short_description: Gathers which target groups a target is associated with.
 description:
   - This module will search through every target group in a region to find
     which ones have registered a given instance ID or IP.
+  - Target groups which can't contain the instances (Lambda and ALB target groups,
+    and instance target groups in other VPCs) are skipped.
 author:
   - "Yaakov Kuperman (@yaakov-github)"
 options:
   instance_id:
     description:
       - What instance ID to get information for.
+      - Exactly one of I(instance_id) and I(instance_ids) must be set.
     type: str
-    required: true
+  instance_ids:
+    description:
+      - A list of instance IDs to get information for.
+      - The target groups are only searched once for all of the instances, the results are
+        returned in RV(target_groups_by_instance).
+      - Exactly one of I(instance_id) and I(instance_ids) must be set.
+    type: list
+    elements: str
+    version_added: 12.0.0
   get_unused_target_groups:
     description:
       - Whether or not to get target groups not used by any load balancers.
     type: bool
     default: true
+  max_concurrency:
+    description:
+      - The maximum number of target groups to describe the health of concurrently.
+    type: int
+    default: 10
+    version_added: 12.0.0
 
 extends_documentation_fragment:
   - amazon.aws.common.modules
@@ -124,12 +141,37 @@ EXAMPLES = r"""
            {%endif%}
            {%endfor%}
   loop: "{{target_info.instance_target_groups}}"
+
+- name: Find the target groups of several instances at once
+  community.aws.elb_target_info:
+    instance_ids:
+      - i-0123456789abcdef0
+      - i-0123456789abcdef1
+    max_concurrency: 20
+  register: target_info
 """
 
 RETURN = r"""
+target_groups_by_instance:
+    description:
+      - The target groups to which each instance is registered, keyed by instance ID.
+      - Each value is a list of target groups, as in RV(instance_target_groups).
+    returned: when I(instance_ids) is set
+    type: dict
+    version_added: 12.0.0
+    sample:
+        i-0123456789abcdef0:
+            - target_group_arn: "arn:aws:elasticloadbalancing:eu-west-1:123456789012:targetgroup/target-group/deadbeefdeadbeef"
+              target_group_type: instance
+              targets:
+                  - target_id: i-0123456789abcdef0
+                    target_port: 80
+                    target_az: null
+                    target_health:
+                        state: healthy
 instance_target_groups:
     description: a list of target groups to which the instance is registered to
-    returned: always
+    returned: when I(instance_id) is set
     type: complex
     contains:
         target_group_arn:
@@ -203,6 +245,8 @@ instance_target_groups:
                             type: str
 """
 
+from concurrent.futures import ThreadPoolExecutor
+
 try:
     from botocore.exceptions import BotoCoreError
     from botocore.exceptions import ClientError
@@ -212,10 +256,14 @@ except ImportError:
 
 from ansible.module_utils.common.dict_transformations import camel_dict_to_snake_dict
 
+from ansible_collections.amazon.aws.plugins.module_utils.botocore import is_boto3_error_code
 from ansible_collections.amazon.aws.plugins.module_utils.retries import AWSRetry
 
 from ansible_collections.community.aws.plugins.module_utils.modules import AnsibleCommunityAWSModule as AnsibleAWSModule
 
+# Only these types of target group can contain an instance (or one of its IPs)
+INSTANCE_TARGET_TYPES = ("instance", "ip")
+
 
 class Target(object):
     """Models a target in a target group"""
@@ -252,7 +300,7 @@ class TargetGroup(object):
 
 
 class TargetInfoGatherer(object):
-    def __init__(self, module, instance_id, get_unused_target_groups):
+    def __init__(self, module, instance_ids, get_unused_target_groups, max_concurrency=10):
         self.module = module
         try:
             self.ec2 = self.module.client("ec2", retry_decorator=AWSRetry.jittered_backoff(retries=10))
@@ -264,42 +312,47 @@ class TargetInfoGatherer(object):
         except (BotoCoreError, ClientError) as e:
             self.module.fail_json_aws(e, msg="Could not connect to elbv2")
 
-        self.instance_id = instance_id
+        self.instance_ids = instance_ids
         self.get_unused_target_groups = get_unused_target_groups
-        self.tgs = self._get_target_groups()
+        self.max_concurrency = max_concurrency
+        self.tgs_by_instance = self._get_target_groups()
 
-    def _get_instance_ips(self):
-        """Fetch all IPs associated with this instance so that we can determine
-        whether or not an instance is in an IP-based target group"""
+    def _get_instances(self):
+        """Fetch the VPC and all the IPs associated with each instance so that we
+        can determine whether or not an instance is in an IP-based target group"""
         try:
-            # get ahold of the instance in the API
-            reservations = self.ec2.describe_instances(InstanceIds=[self.instance_id], aws_retry=True)["Reservations"]
+            # get ahold of the instances in the API
+            reservations = self.ec2.describe_instances(InstanceIds=self.instance_ids, aws_retry=True)["Reservations"]
         except (BotoCoreError, ClientError) as e:
-            # typically this will happen if the instance doesn't exist
+            # typically this will happen if an instance doesn't exist
             self.module.fail_json_aws(
                 e,
-                msg=f"Could not get instance info for instance '{self.instance_id}'",
+                msg=f"Could not get instance info for instances {', '.join(self.instance_ids)}",
             )
 
-        if len(reservations) < 1:
-            self.module.fail_json(msg=f"Instance ID {self.instance_id} could not be found")
-
-        instance = reservations[0]["Instances"][0]
-
-        # IPs are represented in a few places in the API, this should
-        # account for all of them
-        ips = set()
-        ips.add(instance["PrivateIpAddress"])
-        for nic in instance["NetworkInterfaces"]:
-            ips.add(nic["PrivateIpAddress"])
-            for ip in nic["PrivateIpAddresses"]:
-                ips.add(ip["PrivateIpAddress"])
-
-        return list(ips)
-
-    def _get_target_group_objects(self):
-        """helper function to build a list of TargetGroup objects based on
-        the AWS API"""
+        instances = {}
+        for reservation in reservations:
+            for instance in reservation["Instances"]:
+                # IPs are represented in a few places in the API, this should
+                # account for all of them
+                ips = set()
+                ips.add(instance.get("PrivateIpAddress"))
+                for nic in instance.get("NetworkInterfaces", []):
+                    ips.add(nic.get("PrivateIpAddress"))
+                    for ip in nic.get("PrivateIpAddresses", []):
+                        ips.add(ip["PrivateIpAddress"])
+                ips.discard(None)
+                instances[instance["InstanceId"]] = {"vpc_id": instance.get("VpcId"), "ips": ips}
+
+        missing = [instance_id for instance_id in self.instance_ids if instance_id not in instances]
+        if missing:
+            self.module.fail_json(msg=f"Instance ID {', '.join(missing)} could not be found")
+
+        return instances
+
+    def _get_target_group_descriptions(self):
+        """helper function to list the target groups which could contain
+        the instances"""
         try:
             paginator = self.elbv2.get_paginator("describe_target_groups")
             tg_response = paginator.paginate().build_full_result()
@@ -309,85 +362,136 @@ class TargetInfoGatherer(object):
                 msg="Could not describe target groups",
             )
 
-        # build list of TargetGroup objects representing every target group in
-        # the system
+        vpc_ids = set(instance["vpc_id"] for instance in self.instances.values())
         target_groups = []
         for each_tg in tg_response["TargetGroups"]:
             if not self.get_unused_target_groups and len(each_tg["LoadBalancerArns"]) < 1:
                 # only collect target groups that actually are connected
                 # to LBs
                 continue
-
-            target_groups.append(
-                TargetGroup(
-                    target_group_arn=each_tg["TargetGroupArn"],
-                    target_group_type=each_tg["TargetType"],
-                )
-            )
+            if each_tg["TargetType"] not in INSTANCE_TARGET_TYPES:
+                continue
+            # Instances can only be registered with target groups in their own VPC,
+            # IPs on the other hand may be reachable from another (peered) VPC.
+            if each_tg["TargetType"] == "instance" and each_tg.get("VpcId") not in vpc_ids:
+                continue
+            target_groups.append(each_tg)
         return target_groups
 
+    def _describe_target_health(self, target_group_arn):
+        try:
+            return self.elbv2.describe_target_health(TargetGroupArn=target_group_arn, aws_retry=True)[
+                "TargetHealthDescriptions"
+            ]
+        except is_boto3_error_code("TargetGroupNotFound"):
+            # The target group was deleted since we listed them
+            return []
+
+    def _match_target(self, target, target_group):
+        """Returns the IDs of the instances the target points to"""
+        if target["Id"] in self.instances:
+            return [target["Id"]]
+        matches = [instance_id for instance_id, instance in self.instances.items() if target["Id"] in instance["ips"]]
+        # Private IPs are only unique within a VPC
+        if len(matches) > 1:
+            in_vpc = [
+                instance_id for instance_id in matches if self.instances[instance_id]["vpc_id"] == target_group["VpcId"]
+            ]
+            matches = in_vpc or matches
+        return matches
+
     def _get_target_descriptions(self, target_groups):
         """Helper function to build a list of all the target descriptions
-        for this target in a target group"""
-        # Build a list of all the target groups pointing to this instance
+        for each instance in a target group"""
+        # Build a list of all the target groups pointing to each instance
         # based on the previous list
-        tgs = set()
-        # Loop through all the target groups
-        for tg in target_groups:
-            try:
-                # Get the list of targets for that target group
-                response = self.elbv2.describe_target_health(TargetGroupArn=tg.target_group_arn, aws_retry=True)
-            except (BotoCoreError, ClientError) as e:
-                self.module.fail_json_aws(
-                    e, msg="Could not describe target " + f"health for target group {tg.target_group_arn}"
-                )
-
-            for t in response["TargetHealthDescriptions"]:
-                # If the target group has this instance as a target, add to
-                # list. This logic also accounts for the possibility of a
-                # target being in the target group multiple times with
-                # overridden ports
-                if t["Target"]["Id"] == self.instance_id or t["Target"]["Id"] in self.instance_ips:
-                    # The 'AvailabilityZone' parameter is a weird one, see the
-                    # API docs for more.  Basically it's only supposed to be
-                    # there under very specific circumstances, so we need
-                    # to account for that
-                    az = t["Target"]["AvailabilityZone"] if "AvailabilityZone" in t["Target"] else None
-
-                    tg.add_target(t["Target"]["Id"], t["Target"]["Port"], az, t["TargetHealth"])
-                    # since tgs is a set, each target group will be added only
-                    # once, even though we call add on each successful match
-                    tgs.add(tg)
-        return list(tgs)
+        tgs = {instance_id: {} for instance_id in self.instance_ids}
+        # Get the list of targets for each target group concurrently
+        with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+            target_healths = [
+                executor.submit(self._describe_target_health, tg["TargetGroupArn"]) for tg in target_groups
+            ]
+            for tg, target_health in zip(target_groups, target_healths):
+                try:
+                    descriptions = target_health.result()
+                except (BotoCoreError, ClientError) as e:
+                    self.module.fail_json_aws(
+                        e, msg="Could not describe target " + f"health for target group {tg['TargetGroupArn']}"
+                    )
+
+                for t in descriptions:
+                    # If the target group has one of the instances as a target, add
+                    # to its list. This logic also accounts for the possibility of a
+                    # target being in the target group multiple times with
+                    # overridden ports
+                    for instance_id in self._match_target(t["Target"], tg):
+                        # The 'AvailabilityZone' parameter is a weird one, see the
+                        # API docs for more.  Basically it's only supposed to be
+                        # there under very specific circumstances, so we need
+                        # to account for that
+                        az = t["Target"]["AvailabilityZone"] if "AvailabilityZone" in t["Target"] else None
+
+                        # each target group will be added only once per instance,
+                        # even though we add a target on each successful match
+                        if tg["TargetGroupArn"] not in tgs[instance_id]:
+                            tgs[instance_id][tg["TargetGroupArn"]] = TargetGroup(
+                                target_group_arn=tg["TargetGroupArn"],
+                                target_group_type=tg["TargetType"],
+                            )
+                        tgs[instance_id][tg["TargetGroupArn"]].add_target(
+                            t["Target"]["Id"], t["Target"]["Port"], az, t["TargetHealth"]
+                        )
+        return {instance_id: list(instance_tgs.values()) for instance_id, instance_tgs in tgs.items()}
 
     def _get_target_groups(self):
-        # do this first since we need the IPs later on in this function
-        self.instance_ips = self._get_instance_ips()
+        # do this first since we need the VPCs and IPs later on in this function
+        self.instances = self._get_instances()
 
         # build list of target groups
-        target_groups = self._get_target_group_objects()
+        target_groups = self._get_target_group_descriptions()
         return self._get_target_descriptions(target_groups)
 
 
 def main():
     argument_spec = dict(
-        instance_id={"required": True, "type": "str"},
+        instance_id={"required": False, "type": "str"},
+        instance_ids={"required": False, "type": "list", "elements": "str"},
         get_unused_target_groups={"required": False, "default": True, "type": "bool"},
+        max_concurrency={"required": False, "default": 10, "type": "int"},
     )
 
     module = AnsibleAWSModule(
         argument_spec=argument_spec,
         supports_check_mode=True,
+        mutually_exclusive=[["instance_id", "instance_ids"]],
+        required_one_of=[["instance_id", "instance_ids"]],
     )
 
     instance_id = module.params["instance_id"]
+    instance_ids = module.params["instance_ids"]
     get_unused_target_groups = module.params["get_unused_target_groups"]
+    max_concurrency = module.params["max_concurrency"]
+
+    if max_concurrency < 1:
+        module.fail_json(msg="max_concurrency must be at least 1")
+    if instance_ids is not None and not instance_ids:
+        module.fail_json(msg="instance_ids must not be empty")
+
+    if instance_id:
+        instance_ids = [instance_id]
+    # de-duplicate, keeping the order
+    instance_ids = list(dict.fromkeys(instance_ids))
 
-    tg_gatherer = TargetInfoGatherer(module, instance_id, get_unused_target_groups)
+    tg_gatherer = TargetInfoGatherer(module, instance_ids, get_unused_target_groups, max_concurrency)
 
-    instance_target_groups = [each.to_dict() for each in tg_gatherer.tgs]
+    if instance_id:
+        instance_target_groups = [each.to_dict() for each in tg_gatherer.tgs_by_instance[instance_id]]
+        module.exit_json(instance_target_groups=instance_target_groups)
 
-    module.exit_json(instance_target_groups=instance_target_groups)
+    target_groups_by_instance = {
+        each_instance: [each.to_dict() for each in tgs] for each_instance, tgs in tg_gatherer.tgs_by_instance.items()
+    }
+    module.exit_json(target_groups_by_instance=target_groups_by_instance)
 
 
 if __name__ == "__main__":
@@ -26,6 +26,11 @@ options:
     description:
       - The number of shards you want to have with this stream.
       - This is required when I(state=present)
+      - Each C(UpdateShardCount) call can at most double or halve the number of open shards.  Larger
+        changes are made in several steps, waiting for the stream to become C(ACTIVE) between steps,
+        regardless of I(wait).  I(wait_timeout) applies to each step.
+      - AWS only allows the number of shards of a stream to be updated 10 times in a rolling 24 hour period.
+        Changes needing more steps than this fail without any change being made.
     type: int
   retention_period:
     description:
@@ -112,6 +117,15 @@ EXAMPLES = r"""
     wait_timeout: 600
   register: test_stream
 
+# Resharding from 10 to 100 shards is made in 4 steps (20, 40, 80 and 100 shards)
+- name: Scale Kinesis Stream test-stream up to 100 shards
+  community.aws.kinesis_stream:
+    name: test-stream
+    shards: 100
+    wait: true
+    wait_timeout: 600
+  register: test_stream
+
 # Basic delete example:
 - name: Delete Kinesis Stream test-stream and wait for it to finish deleting.
   community.aws.kinesis_stream:
@@ -177,10 +191,39 @@ tags:
       "Name": "Splunk",
       "Env": "development"
   }
+scaling_steps:
+  description:
+    - The steps used to change the number of shards of the stream.
+    - In check mode the steps which would be used.
+  returned: when the number of shards is changed.
+  type: list
+  elements: dict
+  version_added: 12.0.0
+  contains:
+    current_shard_count:
+      description: The number of open shards before the step.
+      type: int
+      sample: 10
+    target_shard_count:
+      description: The number of open shards requested by the step.
+      type: int
+      sample: 20
+    status:
+      description:
+        - The status of the step.
+        - C(planned) steps haven't been started (yet).
+        - C(started) steps have been requested but haven't been seen to complete.
+        - C(failed) steps were rejected by AWS.
+      type: str
+      choices: ['planned', 'started', 'completed', 'failed']
+      sample: "completed"
 """
 
 import time
 
+# UpdateShardCount can be called at most 10 times per stream in a rolling 24 hour period
+SHARD_SCALING_QUOTA = 10
+
 try:
     import botocore
 except ImportError:
@@ -224,12 +267,43 @@ def get_tags(client, stream_name):
     return success, err_msg, boto3_tag_list_to_ansible_dict(results)
 
 
-def find_stream(client, stream_name):
+def list_shards(client, stream_name):
+    """Retrieve all the shards of a Kinesis Stream.
+    Args:
+        client (botocore.client.EC2): Boto3 client.
+        stream_name (str): Name of the Kinesis stream.
+
+    Basic Usage:
+        >>> client = boto3.client('kinesis')
+        >>> stream_name = 'test-stream'
+        >>> list_shards(client, stream_name)
+
+    Returns:
+        List
+    """
+    shards = list()
+    # StreamName can't be passed along with NextToken
+    params = {"StreamName": stream_name}
+    while True:
+        response = client.list_shards(**params)
+        shards.extend(response["Shards"])
+        if not response.get("NextToken"):
+            return shards
+        params = {"NextToken": response["NextToken"]}
+
+
+def find_stream(client, stream_name, shards=True):
     """Retrieve a Kinesis Stream.
     Args:
         client (botocore.client.EC2): Boto3 client.
         stream_name (str): Name of the Kinesis stream.
 
+    Kwargs:
+        shards (bool): Also retrieve the shards of the stream.
+            Without them only OpenShardsCount is known, which saves listing
+            every shard of large streams just to check their status.
+            default=True
+
     Basic Usage:
         >>> client = boto3.client('kinesis')
         >>> stream_name = 'test-stream'
@@ -243,20 +317,19 @@ def find_stream(client, stream_name):
         "StreamName": stream_name,
     }
     results = dict()
-    has_more_shards = True
-    shards = list()
     try:
-        while has_more_shards:
-            results = client.describe_stream(**params)["StreamDescription"]
-            shards.extend(results.pop("Shards"))
-            has_more_shards = results["HasMoreShards"]
-            if has_more_shards:
-                params["ExclusiveStartShardId"] = shards[-1]["ShardId"]
-        results["Shards"] = shards
-        num_closed_shards = len([s for s in shards if "EndingSequenceNumber" in s["SequenceNumberRange"]])
-        results["OpenShardsCount"] = len(shards) - num_closed_shards
-        results["ClosedShardsCount"] = num_closed_shards
-        results["ShardsCount"] = len(shards)
+        results = client.describe_stream_summary(**params)["StreamDescriptionSummary"]
+        # Keep the keys returned by DescribeStream
+        results["OpenShardsCount"] = results.pop("OpenShardCount")
+        results.pop("ConsumerCount", None)
+        if shards:
+            stream_shards = list_shards(client, stream_name)
+            results["Shards"] = stream_shards
+            results["HasMoreShards"] = False
+            num_closed_shards = len([s for s in stream_shards if "EndingSequenceNumber" in s["SequenceNumberRange"]])
+            results["OpenShardsCount"] = len(stream_shards) - num_closed_shards
+            results["ClosedShardsCount"] = num_closed_shards
+            results["ShardsCount"] = len(stream_shards)
         success = True
     except botocore.exceptions.ClientError as e:
         err_msg = to_native(e)
@@ -293,7 +366,7 @@ def wait_for_status(client, stream_name, status, wait_timeout=300, check_mode=Fa
 
     while wait_timeout > time.time():
         try:
-            find_success, find_msg, stream = find_stream(client, stream_name)
+            find_success, find_msg, stream = find_stream(client, stream_name, shards=False)
             if check_mode:
                 status_achieved = True
                 break
@@ -588,8 +661,34 @@ def retention_action(client, stream_name, retention_period=24, action="increase"
     return success, err_msg
 
 
-def update_shard_count(client, stream_name, number_of_shards=1, check_mode=False):
+def plan_shard_scaling(current_shards, target_shards):
+    """Plan the steps needed to scale a Kinesis stream from current_shards to target_shards.
+    Each UpdateShardCount call can at most double or halve the number of open shards.
+
+    Basic Usage:
+        >>> plan_shard_scaling(10, 100)
+        [20, 40, 80, 100]
+
+    Returns:
+        List
+    """
+    steps = list()
+    shards = current_shards
+    while shards != target_shards:
+        if target_shards > shards:
+            shards = min(target_shards, shards * 2)
+        else:
+            shards = max(target_shards, (shards + 1) // 2)
+        steps.append(shards)
+    return steps
+
+
+def update_shard_count(
+    client, stream_name, number_of_shards=1, current_shards=None, wait=False, wait_timeout=300, check_mode=False
+):
     """Increase or Decrease the number of shards in the Kinesis stream.
+    Changes of more than double or half the number of open shards are made
+    in several steps, waiting for the stream to become ACTIVE between steps.
     Args:
         client (botocore.client.EC2): Boto3 client.
         stream_name (str): The name of the kinesis stream.
@@ -597,6 +696,12 @@ def update_shard_count(client, stream_name, number_of_shards=1, check_mode=False
     Kwargs:
         number_of_shards (int): Number of shards this stream will use.
             default=1
+        current_shards (int): Number of open shards the stream currently has.
+            default=None (update the shard count in a single step)
+        wait (bool): Wait until the last step has completed.
+            default=False
+        wait_timeout (int): How long to wait for each step to complete.
+            default=300
         check_mode (bool): This will pass DryRun as one of the parameters to the aws api.
             default=False
 
@@ -607,19 +712,54 @@ def update_shard_count(client, stream_name, number_of_shards=1, check_mode=False
         >>> update_shard_count(client, stream_name, number_of_shards)
 
     Returns:
-        Tuple (bool, str)
+        Tuple (bool, str, list)
     """
-    success = True
-    err_msg = ""
-    params = {"StreamName": stream_name, "ScalingType": "UNIFORM_SCALING"}
-    if not check_mode:
-        params["TargetShardCount"] = number_of_shards
+    if current_shards is None:
+        scaling_steps = [dict(current_shard_count=None, target_shard_count=number_of_shards, status="planned")]
+    else:
+        scaling_steps = list()
+        for target_shards in plan_shard_scaling(current_shards, number_of_shards):
+            scaling_steps.append(
+                dict(current_shard_count=current_shards, target_shard_count=target_shards, status="planned")
+            )
+            current_shards = target_shards
+
+    if len(scaling_steps) > SHARD_SCALING_QUOTA:
+        err_msg = (
+            f"Updating the number of shards for {stream_name} to {number_of_shards} needs {len(scaling_steps)}"
+            f" steps, more than the {SHARD_SCALING_QUOTA} updates allowed in a 24 hour period"
+        )
+        return False, err_msg, scaling_steps
+
+    if check_mode:
+        return True, "", scaling_steps
+
+    for step_number, step in enumerate(scaling_steps, start=1):
+        params = {
+            "StreamName": stream_name,
+            "ScalingType": "UNIFORM_SCALING",
+            "TargetShardCount": step["target_shard_count"],
+        }
         try:
             client.update_shard_count(**params)
         except botocore.exceptions.ClientError as e:
-            return False, str(e)
+            step["status"] = "failed"
+            return False, str(e), scaling_steps
+        step["status"] = "started"
+
+        # The next update can only be made once the stream is ACTIVE again
+        if step_number == len(scaling_steps) and not wait:
+            break
+        wait_success, wait_msg, stream = wait_for_status(client, stream_name, "ACTIVE", wait_timeout)
+        if not wait_success:
+            err_msg = (
+                f"Step {step_number} of {len(scaling_steps)} updating the number of shards for {stream_name}"
+                f" to {step['target_shard_count']} did not complete: {wait_msg}"
+            )
+            return False, err_msg, scaling_steps
+        step["status"] = "completed"
 
-    return success, err_msg
+    return True, "", scaling_steps
 
 
 def update(
@@ -668,18 +808,19 @@ def update(
                    number_of_shards, retention_period )
 
     Returns:
-        Tuple (bool, bool, str)
+        Tuple (bool, bool, str, list)
     """
     success = True
     changed = False
     err_msg = ""
+    scaling_steps = list()
     if retention_period:
         if wait:
             wait_success, wait_msg, current_stream = wait_for_status(
                 client, stream_name, "ACTIVE", wait_timeout, check_mode=check_mode
             )
             if not wait_success:
-                return wait_success, False, wait_msg
+                return wait_success, False, wait_msg, scaling_steps
 
         if current_stream.get("StreamStatus") == "ACTIVE":
             retention_changed = False
@@ -707,39 +848,42 @@ def update(
                     client, stream_name, "ACTIVE", wait_timeout, check_mode=check_mode
                 )
                 if not wait_success:
-                    return wait_success, False, wait_msg
+                    return wait_success, False, wait_msg, scaling_steps
             elif changed and not wait:
-                stream_found, stream_msg, current_stream = find_stream(client, stream_name)
+                stream_found, stream_msg, current_stream = find_stream(client, stream_name, shards=False)
                 if stream_found:
                     if current_stream["StreamStatus"] != "ACTIVE":
                         err_msg = f"Retention Period for {stream_name} is in the process of updating"
-                        return success, changed, err_msg
+                        return success, changed, err_msg, scaling_steps
         else:
             err_msg = (
                 "StreamStatus has to be ACTIVE in order to modify the retention period."
                 f" Current status is {current_stream.get('StreamStatus', 'UNKNOWN')}"
             )
-            return success, changed, err_msg
+            return success, changed, err_msg, scaling_steps
 
     if current_stream["OpenShardsCount"] != number_of_shards:
-        success, err_msg = update_shard_count(client, stream_name, number_of_shards, check_mode=check_mode)
+        success, err_msg, scaling_steps = update_shard_count(
+            client,
+            stream_name,
+            number_of_shards,
+            current_shards=current_stream["OpenShardsCount"],
+            wait=wait,
+            wait_timeout=wait_timeout,
+            check_mode=check_mode,
+        )
 
         if not success:
-            return success, changed, err_msg
+            changed |= any(step["status"] in ("started", "completed") for step in scaling_steps)
+            return success, changed, err_msg, scaling_steps
 
         changed = True
 
-        if wait:
-            wait_success, wait_msg, current_stream = wait_for_status(
-                client, stream_name, "ACTIVE", wait_timeout, check_mode=check_mode
-            )
-            if not wait_success:
-                return wait_success, changed, wait_msg
-        else:
-            stream_found, stream_msg, current_stream = find_stream(client, stream_name)
+        if not wait:
+            stream_found, stream_msg, current_stream = find_stream(client, stream_name, shards=False)
             if stream_found and current_stream["StreamStatus"] != "ACTIVE":
                 err_msg = f"Number of shards for {stream_name} is in the process of updating"
-                return success, changed, err_msg
+                return success, changed, err_msg, scaling_steps
 
     if tags:
         tag_success, tag_changed, err_msg = update_tags(client, stream_name, tags, check_mode=check_mode)
@@ -753,7 +897,7 @@ def update(
     elif success and not changed:
         err_msg = f"Kinesis Stream {stream_name} did not change."
 
-    return success, changed, err_msg
+    return success, changed, err_msg, scaling_steps
 
 
 def create_stream(
@@ -799,8 +943,9 @@ def create_stream(
     changed = False
     err_msg = ""
     results = dict()
+    scaling_steps = list()
 
-    stream_found, stream_msg, current_stream = find_stream(client, stream_name)
+    stream_found, stream_msg, current_stream = find_stream(client, stream_name, shards=False)
 
     if stream_found and current_stream.get("StreamStatus") == "DELETING" and wait:
         wait_success, wait_msg, current_stream = wait_for_status(
@@ -808,7 +953,7 @@ def create_stream(
         )
 
     if stream_found and current_stream.get("StreamStatus") != "DELETING":
-        success, changed, err_msg = update(
+        success, changed, err_msg, scaling_steps = update(
             client,
             current_stream,
             stream_name,
@@ -846,7 +991,7 @@ def create_stream(
                 if not success:
                     return success, changed, err_msg, results
 
-            stream_found, stream_msg, current_stream = find_stream(client, stream_name)
+            stream_found, stream_msg, current_stream = find_stream(client, stream_name, shards=False)
             if retention_period and current_stream.get("StreamStatus") == "ACTIVE":
                 changed, err_msg = retention_action(
                     client, stream_name, retention_period, action="increase", check_mode=check_mode
@@ -875,6 +1020,9 @@ def create_stream(
         results = camel_dict_to_snake_dict(results)
         results["tags"] = current_tags
 
+    if scaling_steps:
+        results["scaling_steps"] = scaling_steps
+
     return success, changed, err_msg, results
 
 
@@ -904,7 +1052,7 @@ def delete_stream(client, stream_name, wait=False, wait_timeout=300, check_mode=
     changed = False
     err_msg = ""
     results = dict()
-    stream_found, stream_msg, current_stream = find_stream(client, stream_name)
+    stream_found, stream_msg, current_stream = find_stream(client, stream_name, shards=False)
     if stream_found:
         success, err_msg = stream_action(client, stream_name, action="delete", check_mode=check_mode)
         if success:
@@ -959,7 +1107,7 @@ def start_stream_encryption(
     err_msg = ""
 
     results = dict()
-    stream_found, stream_msg, current_stream = find_stream(client, stream_name)
+    stream_found, stream_msg, current_stream = find_stream(client, stream_name, shards=False)
     if stream_found:
         if current_stream.get("EncryptionType") == encryption_type and current_stream.get("KeyId") == key_id:
             changed = False
@@ -1033,7 +1181,7 @@ def stop_stream_encryption(
     err_msg = ""
 
     results = dict()
-    stream_found, stream_msg, current_stream = find_stream(client, stream_name)
+    stream_found, stream_msg, current_stream = find_stream(client, stream_name, shards=False)
     if stream_found:
         if current_stream.get("EncryptionType") == "KMS":
             success, err_msg = stream_encryption_action(
@@ -24,10 +24,17 @@ options:
     - Difference determination method to allow changes-only syncing. Unlike rsync, files are not patched- they are fully skipped or fully uploaded.
     - date_size will upload if file sizes don't match or if local file modified date is newer than s3's version
     - checksum will compare etag values based on s3's implementation of chunked md5s.
+      The part size used for objects uploaded by other tools is inferred from their etag and size.
+    - crc32c and sha256 upload files with the matching S3 additional checksum and compare the checksums.
+      Unlike etags these checksums are also correct for objects encrypted with SSE-KMS, and crc32c is much cheaper to calculate.
+      Existing objects without a checksum of this type are uploaded again.
+    - crc32c requires the C(awscrt) python library.
     - force will always upload all files.
+    - With date_size, checksum, crc32c and sha256 the details of the remote objects are retrieved with a single listing of I(key_prefix).
+      If listing the bucket is denied, the module falls back to a C(HEAD) request per file.
     required: false
     default: 'date_size'
-    choices: [ 'force', 'checksum', 'date_size' ]
+    choices: [ 'force', 'checksum', 'date_size', 'crc32c', 'sha256' ]
     type: str
   bucket:
     description:
@@ -80,6 +87,8 @@ options:
     - Shell pattern-style file matching.
     - Used after include to remove files (for instance, skip C("*.txt"))
     - For multiple patterns, comma-separate them.
+    - Patterns ending with C(/) match directory names, matching directories are skipped entirely
+      (for instance, C(".*,.git/,node_modules/")).
     required: false
     default: ".*"
     type: str
@@ -109,9 +118,58 @@ options:
   delete:
     description:
     - Remove remote files that exist in bucket but are not present in the file root.
+    - The files are removed in batches of up to 1000 keys, using up to I(max_concurrency) concurrent requests.
+      Keys which fail to be removed because of a transient error are retried.
     required: false
     default: false
     type: bool
+  max_concurrency:
+    description:
+    - Maximum number of concurrent requests used to upload files.
+    - A single pool of workers is shared between all of the files, so many small files are uploaded in parallel
+      and the parts of large files are also uploaded in parallel.
+    - The same number of concurrent requests is used to fetch the remote checksums with I(file_change_strategy=crc32c) or C(sha256),
+      or the details of each object when listing the bucket is denied.
+    required: false
+    default: 10
+    type: int
+    version_added: 12.0.0
+  etag_cache_path:
+    description:
+    - Path of a local file used to cache the calculated ETags between runs.
+    - A cached ETag is reused while the size, modification time, inode and part size of the file are unchanged,
+      so unchanged files are not read again when I(file_change_strategy) is C(checksum), C(crc32c) or C(sha256).
+    - Entries for files which no longer exist are removed from the cache automatically.
+    - If the cache is stored within I(file_root) make sure it is excluded using I(exclude), otherwise it will be uploaded.
+    required: false
+    type: path
+    version_added: 12.0.0
+  summary_only:
+    description:
+    - Only return a summary of the number of files (and bytes) processed, uploaded and removed,
+      rather than the file listing of every stage.
+    - Files are streamed through the stages one at a time instead of building a list for each stage,
+      which greatly reduces the memory used (and the size of the result) for very large trees.
+    - Files which failed to upload are still returned in RV(failed_uploads).
+    required: false
+    default: false
+    type: bool
+    version_added: 12.0.0
+  multipart_threshold:
+    description:
+    - Size (in bytes) from which files are uploaded using a multipart upload.
+    required: false
+    default: 8388608
+    type: int
+    version_added: 12.0.0
+  multipart_chunksize:
+    description:
+    - Size (in bytes) of each part when a file is uploaded using a multipart upload.
+    - The same part size is used when calculating the local ETag with I(file_change_strategy=checksum).
+    required: false
+    default: 8388608
+    type: int
+    version_added: 12.0.0
 
 author:
 - Ted Timmons (@tedder)
@@ -147,17 +205,39 @@ EXAMPLES = r"""
       .json: application/text
     key_prefix: config_files/web
     file_change_strategy: force
+    max_concurrency: 20
+    multipart_chunksize: 16777216
     permission: public-read
     cache_control: "public, max-age=31536000"
     storage_class: "GLACIER"
     include: "*"
     exclude: "*.txt,.*"
+
+- name: sync a very large tree, only returning a summary
+  community.aws.s3_sync:
+    bucket: tedder
+    file_root: /srv/static
+    summary_only: true
+    delete: true
+
+- name: upload using CRC32C checksums for change detection (for example with SSE-KMS encrypted buckets)
+  community.aws.s3_sync:
+    bucket: tedder
+    file_root: roles/s3/files
+    file_change_strategy: crc32c
+
+- name: checksum based upload, caching the local ETags between runs
+  community.aws.s3_sync:
+    bucket: tedder
+    file_root: roles/s3/files
+    file_change_strategy: checksum
+    etag_cache_path: ~/.cache/s3_sync/roles-s3-files.json
 """
 
 RETURN = r"""
 filelist_initial:
   description: file listing (dicts) from initial globbing
-  returned: always
+  returned: when I(summary_only=false)
   type: list
   sample: [{
                 "bytes": 151,
@@ -166,8 +246,12 @@ filelist_initial:
                 "modified_epoch": 1477416706
            }]
 filelist_local_etag:
-  description: file listing (dicts) including calculated local etag
-  returned: always
+  description:
+  - file listing (dicts) including information about previously-uploaded versions.
+  - With I(file_change_strategy=checksum) this includes the calculated local etag, with C(crc32c) or C(sha256)
+    the calculated local checksum (C(local_checksum)). These are only calculated for files which already exist
+    in S3 with the same size.
+  returned: when I(summary_only=false)
   type: list
   sample: [{
                 "bytes": 151,
@@ -179,7 +263,7 @@ filelist_local_etag:
            }]
 filelist_s3:
   description: file listing (dicts) including information about previously-uploaded versions
-  returned: always
+  returned: when I(summary_only=false)
   type: list
   sample: [{
                 "bytes": 151,
@@ -191,7 +275,7 @@ filelist_s3:
            }]
 filelist_typed:
   description: file listing (dicts) with calculated or overridden mime types
-  returned: always
+  returned: when I(summary_only=false)
   type: list
   sample: [{
                 "bytes": 151,
@@ -202,7 +286,7 @@ filelist_typed:
            }]
 filelist_actionable:
   description: file listing (dicts) of files that will be uploaded after the strategy decision
-  returned: always
+  returned: when I(summary_only=false)
   type: list
   sample: [{
                 "bytes": 151,
@@ -216,7 +300,7 @@ filelist_actionable:
            }]
 uploads:
   description: file listing (dicts) of files that were actually uploaded
-  returned: always
+  returned: when I(summary_only=false)
   type: list
   sample: [{
                 "bytes": 151,
@@ -226,14 +310,124 @@ uploads:
                 "whysize": "151 / 151",
                 "whytime": "1477931637 / 1477931489"
            }]
-
+summary:
+  description: Counts of the files processed by each stage.
+  returned: when I(summary_only=true)
+  type: dict
+  version_added: 12.0.0
+  contains:
+    files:
+      description: Number of local files found.
+      type: int
+      sample: 80231
+    bytes:
+      description: Total size of the local files found.
+      type: int
+      sample: 1523411234
+    actionable:
+      description: Number of files which needed uploading after the strategy decision.
+      type: int
+      sample: 12
+    uploaded:
+      description: Number of files which were uploaded.
+      type: int
+      sample: 12
+    uploaded_bytes:
+      description: Total size of the files which were uploaded.
+      type: int
+      sample: 312345
+    failed:
+      description: Number of files which failed to upload.
+      type: int
+      sample: 0
+    removed:
+      description: Number of remote files which were removed.
+      type: int
+      returned: when I(delete=true)
+      sample: 3
+etag_cache:
+  description: Statistics about the use of the local ETag cache.
+  returned: when I(etag_cache_path) is set and I(file_change_strategy) is C(checksum), C(crc32c) or C(sha256)
+  type: dict
+  version_added: 12.0.0
+  contains:
+    hits:
+      description: Number of ETags retrieved from the cache.
+      type: int
+      sample: 1520
+    misses:
+      description: Number of ETags which had to be calculated.
+      type: int
+      sample: 3
+  sample: {"hits": 1520, "misses": 3}
+removed:
+  description: List of the remote keys which were removed.
+  returned: when I(delete=true) and I(summary_only=false)
+  type: list
+  elements: str
+  sample: ["s3sync/old-policy.json"]
+delete_summary:
+  description: Statistics about the removal of remote files.
+  returned: when I(delete=true)
+  type: dict
+  version_added: 12.0.0
+  contains:
+    removed:
+      description: Number of remote files which were removed.
+      type: int
+      sample: 120354
+    bytes:
+      description: Total size of the remote files which were removed.
+      type: int
+      sample: 4523411234
+    failed:
+      description: Number of remote files which could not be removed.
+      type: int
+      sample: 0
+    batches:
+      description: Number of C(DeleteObjects) batches.
+      type: int
+      sample: 121
+    elapsed:
+      description: Time taken (in seconds) to list and remove the remote files.
+      type: float
+      sample: 18.312
+failed_deletes:
+  description: The remote keys which could not be removed, including the error encountered.
+  returned: when one or more files could not be removed
+  type: list
+  elements: dict
+  version_added: 12.0.0
+  sample: [{
+                "code": "AccessDenied",
+                "key": "s3sync/policy.json",
+                "message": "Access Denied"
+           }]
+failed_uploads:
+  description: file listing (dicts) of files that could not be uploaded, including the error encountered.
+  returned: when one or more uploads failed
+  type: list
+  version_added: 12.0.0
+  sample: [{
+                "bytes": 151,
+                "chopped_path": "policy.json",
+                "error": "An error occurred (AccessDenied) when calling the PutObject operation: Access Denied",
+                "fullpath": "roles/cf/files/policy.json",
+                "s3_path": "s3sync/policy.json"
+           }]
 """
 
+import collections
+import concurrent.futures
 import datetime
 import fnmatch
+import json
 import mimetypes
 import os
+import re
 import stat as osstat  # os.stat constants
+import tempfile
+import time
 
 try:
     from dateutil import tz
@@ -244,20 +438,53 @@ except ImportError:
 
 try:
     import botocore
+    from boto3.s3.transfer import TransferConfig
+    from boto3.s3.transfer import create_transfer_manager
 except ImportError:
     pass  # Handled by AnsibleAWSModule
 
+from ansible.module_utils._text import to_native
 from ansible.module_utils._text import to_text
 
 from ansible_collections.amazon.aws.plugins.module_utils.botocore import is_boto3_error_code
 
+from ansible_collections.community.aws.plugins.module_utils.etag import DEFAULT_CHUNK_SIZE
+from ansible_collections.community.aws.plugins.module_utils.etag import HAS_AWSCRT
+from ansible_collections.community.aws.plugins.module_utils.etag import calculate_multipart_checksums
 from ansible_collections.community.aws.plugins.module_utils.etag import calculate_multipart_etag
+from ansible_collections.community.aws.plugins.module_utils.etag import calculate_multipart_etags
+from ansible_collections.community.aws.plugins.module_utils.etag import candidate_chunk_sizes
+from ansible_collections.community.aws.plugins.module_utils.etag import multipart_etag_parts
+from ansible_collections.community.aws.plugins.module_utils.etag import select_etag
 from ansible_collections.community.aws.plugins.module_utils.modules import AnsibleCommunityAWSModule as AnsibleAWSModule
 
+# file_change_strategy -> S3 additional checksum algorithm
+CHECKSUM_STRATEGIES = {"crc32c": "CRC32C", "sha256": "SHA256"}
 
-def gather_files(fileroot, include=None, exclude=None):
-    ret = []
+# DeleteObjects accepts up to 1000 keys per call
+DELETE_BATCH_SIZE = 1000
+# DeleteObjects error codes (for the request or a single key) which are worth retrying
+DELETE_RETRY_CODES = ("InternalError", "ServiceUnavailable", "SlowDown", "RequestTimeout")
+DELETE_ATTEMPTS = 3
+DELETE_RETRY_DELAY = 0.5
+
+
+class ChecksumFailure(Exception):
+    def __init__(self, exc):
+        self.exc = exc
+        super().__init__(self)
 
+
+def compile_patterns(patterns):
+    """Compile a list of shell patterns into the match method of a single regular expression.
+
+    Returns None if there are no patterns."""
+    if not patterns:
+        return None
+    return re.compile("|".join(fnmatch.translate(os.path.normcase(pattern)) for pattern in patterns)).match
+
+
+def iter_files(fileroot, include=None, exclude=None):
     if os.path.isfile(fileroot):
         fullpath = fileroot
         fstat = os.stat(fullpath)
@@ -265,117 +492,373 @@ def gather_files(fileroot, include=None, exclude=None):
         chopped_path = path_array[-1]
         f_size = fstat[osstat.ST_SIZE]
         f_modified_epoch = fstat[osstat.ST_MTIME]
-        ret.append(
-            {
-                "fullpath": fullpath,
-                "chopped_path": chopped_path,
-                "modified_epoch": f_modified_epoch,
-                "bytes": f_size,
+        yield {
+            "fullpath": fullpath,
+            "chopped_path": chopped_path,
+            "modified_epoch": f_modified_epoch,
+            "bytes": f_size,
+        }
+        return
+
+    include_match = compile_patterns(include.split(",") if include else [])
+    file_excludes = []
+    dir_excludes = []
+    for pattern in exclude.split(",") if exclude else []:
+        # "name/" excludes directories, they're pruned rather than walked
+        if pattern.endswith("/"):
+            dir_excludes.append(pattern[:-1])
+        else:
+            file_excludes.append(pattern)
+    exclude_match = compile_patterns(file_excludes)
+    exclude_dir_match = compile_patterns(dir_excludes)
+
+    # Walk the tree top-down (like os.walk), re-using the DirEntry objects from os.scandir
+    pending = [(fileroot, "")]
+    while pending:
+        dirpath, chopped_dir = pending.pop()
+        try:
+            with os.scandir(dirpath) as it:
+                entries = list(it)
+        # like os.walk, ignore directories we can't read
+        except OSError:
+            continue
+
+        subdirs = []
+        for entry in entries:
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                is_dir = False
+            if is_dir:
+                # like os.walk, don't follow symlinks to directories
+                if entry.is_symlink() or (exclude_dir_match and exclude_dir_match(os.path.normcase(entry.name))):
+                    continue
+                subdirs.append((entry.path, chopped_dir + entry.name + os.sep))
+                continue
+
+            name = os.path.normcase(entry.name)
+            # include/exclude
+            if include_match and not include_match(name):
+                # not on the include list, so we don't want it.
+                continue
+            if exclude_match and exclude_match(name):
+                # skip it, even if previously included.
+                continue
+
+            fstat = entry.stat()
+            yield {
+                "fullpath": entry.path,
+                "chopped_path": chopped_dir + entry.name,
+                "modified_epoch": fstat[osstat.ST_MTIME],
+                "bytes": fstat[osstat.ST_SIZE],
             }
-        )
 
-    else:
-        for dirpath, dirnames, filenames in os.walk(fileroot):
-            for fn in filenames:
-                fullpath = os.path.join(dirpath, fn)
-                # include/exclude
-                if include:
-                    found = False
-                    for x in include.split(","):
-                        if fnmatch.fnmatch(fn, x):
-                            found = True
-                    if not found:
-                        # not on the include list, so we don't want it.
-                        continue
-
-                if exclude:
-                    found = False
-                    for x in exclude.split(","):
-                        if fnmatch.fnmatch(fn, x):
-                            found = True
-                    if found:
-                        # skip it, even if previously included.
-                        continue
-
-                chopped_path = os.path.relpath(fullpath, start=fileroot)
-                fstat = os.stat(fullpath)
-                f_size = fstat[osstat.ST_SIZE]
-                f_modified_epoch = fstat[osstat.ST_MTIME]
-                ret.append(
-                    {
-                        "fullpath": fullpath,
-                        "chopped_path": chopped_path,
-                        "modified_epoch": f_modified_epoch,
-                        "bytes": f_size,
-                    }
-                )
-            # dirpath = path *to* the directory
-            # dirnames = subdirs *in* our directory
-            # filenames
-    return ret
+        # depth first, in the order the directories were listed
+        pending.extend(reversed(subdirs))
+
+
+def gather_files(fileroot, include=None, exclude=None):
+    return list(iter_files(fileroot, include=include, exclude=exclude))
+
+
+def set_s3_path(entry, key_prefix=""):
+    entry["s3_path"] = os.path.join(key_prefix, entry["chopped_path"])
+    return entry
 
 
 def calculate_s3_path(filelist, key_prefix=""):
-    ret = []
-    for fileentry in filelist:
-        # don't modify the input dict
-        retentry = fileentry.copy()
-        retentry["s3_path"] = os.path.join(key_prefix, fileentry["chopped_path"])
-        ret.append(retentry)
-    return ret
+    # don't modify the input dicts
+    return [set_s3_path(fileentry.copy(), key_prefix) for fileentry in filelist]
+
+
+class LocalEtagCache:
+    """On-disk cache of calculated local ETags.
+
+    Entries are keyed on the absolute path of the file and are only reused while the size,
+    modification time (in nanoseconds) and inode all match.  Each entry holds the etags
+    (and additional checksums) calculated for one or more chunk sizes.
+    """
+
+    VERSION = 1
+
+    def __init__(self, path):
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self._entries = {}
+        self._seen = {}
+
+    def load(self):
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        # A missing or corrupt cache just means we start again from scratch
+        except (OSError, ValueError):
+            return
+        if isinstance(data, dict) and data.get("version") == self.VERSION:
+            self._entries = data.get("entries") or {}
+
+    def checksum(self, fullpath, chunk_sizes, remote=None, algorithm="md5"):
+        # stat before reading, if the file changes while we hash it the next run won't match
+        fstat = os.stat(fullpath)
+        key = os.path.abspath(fullpath)
+        fingerprint = {
+            "size": fstat.st_size,
+            "mtime_ns": fstat.st_mtime_ns,
+            "inode": fstat.st_ino,
+        }
+        entry = self._entries.get(key)
+        values = {}
+        if entry and all(entry.get(k) == v for k, v in fingerprint.items()):
+            values = dict(entry.get("checksums", {}))
+
+        keys = {c: _checksum_cache_key(algorithm, c, remote) for c in chunk_sizes}
+        candidates = {c: values[k] for c, k in keys.items() if k in values}
+        missing = [c for c in chunk_sizes if c not in candidates]
+        if missing and remote not in candidates.values():
+            self.misses += 1
+            for c, value in calculate_checksums(fullpath, missing, remote, algorithm).items():
+                values[keys[c]] = candidates[c] = value
+        else:
+            self.hits += 1
+        self._seen[key] = dict(fingerprint, checksums=values)
+        return select_etag(candidates, chunk_sizes, remote)
+
+    def save(self, fileroot):
+        """Write the cache, evicting stale entries.
+
+        Entries below fileroot which weren't used during this run belong to files which have been removed
+        (or excluded).  Entries elsewhere may belong to other syncs sharing the cache, they're only
+        dropped once the file no longer exists."""
+        root = os.path.join(os.path.abspath(fileroot), "")
+        entries = {}
+        for key, entry in self._entries.items():
+            if key.startswith(root) or not os.path.exists(key):
+                continue
+            entries[key] = entry
+        entries.update(self._seen)
+
+        cache_dir = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(cache_dir, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, prefix=".s3_sync_etag_cache")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"version": self.VERSION, "entries": entries}, f)
+            os.replace(tmp_path, self.path)
+        except Exception:
+            os.unlink(tmp_path)
+            raise
+
+
+def _is_composite(algorithm, remote):
+    # etags of multipart uploads are always composite, additional checksums may cover the full object
+    if algorithm == "md5":
+        return True
+    return remote is not None and multipart_etag_parts(remote) is not None
+
+
+def _checksum_cache_key(algorithm, chunk_size, remote=None):
+    if algorithm == "md5":
+        return f"md5:{chunk_size}"
+    return f"{algorithm}:{chunk_size}:{'composite' if _is_composite(algorithm, remote) else 'full'}"
 
 
-def calculate_local_etag(filelist, key_prefix=""):
+def calculate_checksums(fullpath, chunk_sizes, remote=None, algorithm="md5"):
+    """Calculate the etag (md5) or additional checksum of a file for each of the chunk sizes.
+
+    Raises ChecksumFailure if the hash isn't available (for example md5 in FIPS mode)."""
+    try:
+        if algorithm != "md5":
+            return calculate_multipart_checksums(
+                fullpath, chunk_sizes, algorithm, composite=_is_composite(algorithm, remote)
+            )
+        if len(chunk_sizes) == 1:
+            return {chunk_sizes[0]: calculate_multipart_etag(fullpath, chunk_sizes[0])}
+        return calculate_multipart_etags(fullpath, chunk_sizes)
+    except ValueError as e:
+        raise ChecksumFailure(e) from e
+
+
+def calculate_local_etag(
+    filelist,
+    key_prefix="",
+    chunk_size=DEFAULT_CHUNK_SIZE,
+    multipart_threshold=None,
+    etag_cache=None,
+    lazy=False,
+    algorithm="md5",
+):
     """Really, "calculate md5", but since AWS uses their own format, we'll just call
-    it a "local etag". TODO optimization: only calculate if remote key exists."""
-    ret = []
-    for fileentry in filelist:
-        # don't modify the input dict
-        retentry = fileentry.copy()
-        retentry["local_etag"] = calculate_multipart_etag(fileentry["fullpath"])
-        ret.append(retentry)
-    return ret
+    it a "local etag".
+
+    With lazy=True the etag is only calculated when the remote key exists with the same size,
+    missing keys and keys with a different size will be uploaded regardless of the etag.
+    The part size used for the remote object is inferred from its etag, so objects uploaded
+    by other tools (with different part sizes) can still match.
+
+    With algorithm set to crc32c or sha256 the S3 additional checksum is calculated (as local_checksum)
+    instead, and compared with the remote checksum of the same type."""
+    # don't modify the input dicts
+    return [
+        set_local_etag(
+            fileentry.copy(),
+            chunk_size=chunk_size,
+            multipart_threshold=multipart_threshold,
+            etag_cache=etag_cache,
+            lazy=lazy,
+            algorithm=algorithm,
+        )
+        for fileentry in filelist
+    ]
+
+
+def set_local_etag(
+    entry, chunk_size=DEFAULT_CHUNK_SIZE, multipart_threshold=None, etag_cache=None, lazy=False, algorithm="md5"
+):
+    remote = None
+    if lazy:
+        s3_head = entry.get("s3_head")
+        if not s3_head or s3_head["ContentLength"] != entry["bytes"]:
+            return entry
+        remote = _remote_checksum(s3_head, algorithm)
+        if remote is None:
+            # There's nothing to compare with, it will be uploaded anyway
+            return entry
+    file_chunk_size = chunk_size
+    # files below the threshold are uploaded in a single part, so their ETag is a plain md5
+    if multipart_threshold and entry["bytes"] < multipart_threshold:
+        file_chunk_size = max(chunk_size, multipart_threshold)
+    chunk_sizes = [file_chunk_size]
+    if remote is not None:
+        # If no part size is consistent with the remote etag (for example SSE-KMS) it can't match anyway
+        chunk_sizes = candidate_chunk_sizes(remote, entry["bytes"], chunk_size) or chunk_sizes
+    result_key = "local_etag" if algorithm == "md5" else "local_checksum"
+    if etag_cache is not None:
+        entry[result_key] = etag_cache.checksum(entry["fullpath"], chunk_sizes, remote, algorithm)
+    else:
+        checksums = calculate_checksums(entry["fullpath"], chunk_sizes, remote, algorithm)
+        entry[result_key] = select_etag(checksums, chunk_sizes, remote)
+    return entry
 
 
 def determine_mimetypes(filelist, override_map):
-    ret = []
-    for fileentry in filelist:
-        retentry = fileentry.copy()
-        localfile = fileentry["fullpath"]
-
-        # reminder: file extension is '.txt', not 'txt'.
-        file_extension = os.path.splitext(localfile)[1]
-        if override_map and override_map.get(file_extension):
-            # override? use it.
-            retentry["mime_type"] = override_map[file_extension]
-        else:
-            # else sniff it
-            retentry["mime_type"], retentry["encoding"] = mimetypes.guess_type(localfile, strict=False)
+    # don't modify the input dicts
+    return [set_mime_type(fileentry.copy(), override_map) for fileentry in filelist]
+
+
+def set_mime_type(entry, override_map):
+    localfile = entry["fullpath"]
+
+    # reminder: file extension is '.txt', not 'txt'.
+    file_extension = os.path.splitext(localfile)[1]
+    if override_map and override_map.get(file_extension):
+        # override? use it.
+        entry["mime_type"] = override_map[file_extension]
+    else:
+        # else sniff it
+        entry["mime_type"], entry["encoding"] = mimetypes.guess_type(localfile, strict=False)
+
+    # might be None or '' from one of the above. Not a great type but better than nothing.
+    if not entry["mime_type"]:
+        entry["mime_type"] = "application/octet-stream"
+
+    return entry
+
+
+def list_s3_objects(s3, bucket, key_prefix=""):
+    """Build an index of the remote objects under key_prefix, keyed by S3 key.
+
+    The values mimic the fields of a head_object response that the strategies care about,
+    so that a single paginated listing can replace one HEAD request per local file.
+    Returns None if we're not permitted to list the bucket."""
+    index = {}
+    paginator = s3.get_paginator("list_objects_v2")
+    try:
+        for page in paginator.paginate(Bucket=bucket, Prefix=key_prefix):
+            for obj in page.get("Contents", []):
+                index[obj["Key"]] = {
+                    "ETag": obj["ETag"],
+                    "ContentLength": obj["Size"],
+                    "LastModified": obj["LastModified"],
+                    # only the algorithms are listed, not the checksums themselves
+                    "ChecksumAlgorithm": obj.get("ChecksumAlgorithm", []),
+                }
+    # 403 (Denied) - Sometimes we can write (and HEAD) but not list, fall back to head_s3
+    except is_boto3_error_code(["AccessDenied", "403"]):
+        return None
+    return index
+
 
-        # might be None or '' from one of the above. Not a great type but better than nothing.
-        if not retentry["mime_type"]:
-            retentry["mime_type"] = "application/octet-stream"
+def index_s3(s3index, s3keys):
+    return [index_entry(s3index, entry.copy()) for entry in s3keys]
 
-        ret.append(retentry)
 
-    return ret
+def index_entry(s3index, entry):
+    s3_head = s3index.get(to_text(entry["s3_path"]))
+    if s3_head is not None:
+        entry["s3_head"] = s3_head
+    return entry
 
 
-def head_s3(s3, bucket, s3keys):
-    retkeys = []
-    for entry in s3keys:
-        retentry = entry.copy()
+def _remote_checksum(s3_head, algorithm):
+    if algorithm == "md5":
+        return s3_head["ETag"]
+    checksum = s3_head.get(f"Checksum{CHECKSUM_STRATEGIES[algorithm]}")
+    # Composite checksums are normally returned as "<checksum>-<parts>", but not every API (or implementation)
+    # includes the number of parts, take it from the etag of the multipart upload.
+    parts = multipart_etag_parts(s3_head.get("ETag", ""))
+    if checksum and "-" not in checksum and parts and s3_head.get("ChecksumType") != "FULL_OBJECT":
+        checksum = f"{checksum}-{parts}"
+    return checksum
+
+
+def head_s3(s3, bucket, s3keys, checksum_mode=False, max_concurrency=1):
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max(max_concurrency, 1)) as executor:
+        return list(
+            executor.map(lambda entry: head_entry(s3, bucket, entry.copy(), checksum_mode=checksum_mode), s3keys)
+        )
+
+
+def head_entry(s3, bucket, entry, checksum_mode=False):
+    args = {}
+    if checksum_mode:
+        args["ChecksumMode"] = "ENABLED"
+    try:
+        entry["s3_head"] = s3.head_object(Bucket=bucket, Key=entry["s3_path"], **args)
+    # 404 (Missing) - File doesn't exist, we'll need to upload
+    # 403 (Denied) - Sometimes we can write but not read, assume we'll need to upload
+    except is_boto3_error_code(["404", "403"]):
+        pass
+    return entry
+
+
+def fetch_remote_checksums(s3, bucket, s3keys, algorithm, max_concurrency=1):
+    """Listing objects doesn't return their additional checksums, so fetch them with a HEAD request.
+
+    Only objects which have a checksum of the right type and the same size as the local file are checked,
+    everything else will be uploaded anyway.  The requests are made by a bounded pool of workers."""
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max(max_concurrency, 1)) as executor:
+        return list(executor.map(lambda entry: fetch_remote_checksum(s3, bucket, entry, algorithm), s3keys))
+
+
+def fetch_remote_checksum(s3, bucket, entry, algorithm):
+    s3_head = entry.get("s3_head")
+    if (
+        s3_head
+        and s3_head["ContentLength"] == entry["bytes"]
+        and CHECKSUM_STRATEGIES[algorithm] in s3_head.get("ChecksumAlgorithm", [])
+    ):
+        entry = entry.copy()
         try:
-            retentry["s3_head"] = s3.head_object(Bucket=bucket, Key=entry["s3_path"])
-        # 404 (Missing) - File doesn't exist, we'll need to upload
-        # 403 (Denied) - Sometimes we can write but not read, assume we'll need to upload
+            head = s3.head_object(Bucket=bucket, Key=entry["s3_path"], ChecksumMode="ENABLED")
+            entry["s3_head"] = dict(s3_head, **{k: v for k, v in head.items() if k.startswith("Checksum")})
+        # The object has gone away since we listed it, or we can't read it
         except is_boto3_error_code(["404", "403"]):
             pass
-        retkeys.append(retentry)
-    return retkeys
+    return entry
 
 
-def filter_list(s3, bucket, s3filelist, strategy):
+def lookup_s3(s3, bucket, s3filelist, strategy, s3index=None, max_concurrency=1):
     keeplist = list(s3filelist)
 
     for e in keeplist:
@@ -383,89 +866,402 @@ def filter_list(s3, bucket, s3filelist, strategy):
 
     # init/fetch info from S3 if we're going to use it for comparisons
     if not strategy == "force":
-        keeplist = head_s3(s3, bucket, s3filelist)
+        if s3index is not None:
+            keeplist = index_s3(s3index, s3filelist)
+            if strategy in CHECKSUM_STRATEGIES:
+                keeplist = fetch_remote_checksums(s3, bucket, keeplist, strategy, max_concurrency=max_concurrency)
+        else:
+            keeplist = head_s3(
+                s3,
+                bucket,
+                s3filelist,
+                checksum_mode=strategy in CHECKSUM_STRATEGIES,
+                max_concurrency=max_concurrency,
+            )
 
-    # now actually run the strategies
+    return keeplist
+
+
+def lookup_entry(s3, bucket, entry, strategy, s3index=None):
+    """Single entry version of lookup_s3(), modifies the entry in place."""
+    entry["_strategy"] = strategy
+    if strategy == "force":
+        return entry
+    if s3index is None:
+        return head_entry(s3, bucket, entry, checksum_mode=strategy in CHECKSUM_STRATEGIES)
+    index_entry(s3index, entry)
+    if strategy in CHECKSUM_STRATEGIES:
+        entry.update(fetch_remote_checksum(s3, bucket, entry, strategy))
+    return entry
+
+
+def iter_lookups(s3, bucket, entries, strategy, s3index=None, max_concurrency=1):
+    """Generator version of lookup_entry(), yields the entries in order.
+
+    When a request is needed for each entry the lookups are made by a bounded pool of workers,
+    entries may itself be a generator and only a limited number of lookups are waiting to be collected."""
+    if strategy == "force" or (s3index is not None and strategy not in CHECKSUM_STRATEGIES):
+        for entry in entries:
+            yield lookup_entry(s3, bucket, entry, strategy, s3index=s3index)
+        return
+
+    max_pending = max(max_concurrency, 1) * 10
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max(max_concurrency, 1)) as executor:
+        lookups = collections.deque()
+        for entry in entries:
+            lookups.append(executor.submit(lookup_entry, s3, bucket, entry, strategy, s3index=s3index))
+            if len(lookups) >= max_pending:
+                yield lookups.popleft().result()
+
+        while lookups:
+            yield lookups.popleft().result()
+
+
+def filter_list(s3, bucket, s3filelist, strategy, s3index=None):
+    keeplist = lookup_s3(s3, bucket, s3filelist, strategy, s3index=s3index)
+    return apply_strategy(keeplist, strategy)
+
+
+def apply_strategy(keeplist, strategy):
+    for entry in keeplist:
+        flag_skip(entry, strategy)
+
+    # prune 'please skip' entries, if any.
+    return [x for x in keeplist if not x.get("skip_flag")]
+
+
+def flag_skip(entry, strategy):
+    """Run the strategy against a single entry, setting skip_flag if it doesn't need to be uploaded."""
     if strategy == "checksum":
-        for entry in keeplist:
-            if entry.get("s3_head"):
-                # since we have a remote s3 object, compare the values.
-                if entry["s3_head"]["ETag"] == entry["local_etag"]:
-                    # files match, so remove the entry
-                    entry["skip_flag"] = True
-                else:
-                    # file etags don't match, keep the entry.
-                    pass
-            else:  # we don't have an etag, so we'll keep it.
+        if entry.get("s3_head"):
+            # since we have a remote s3 object, compare the values.
+            if entry["s3_head"]["ETag"] == entry.get("local_etag"):
+                # files match, so remove the entry
+                entry["skip_flag"] = True
+            else:
+                # file etags don't match, keep the entry.
                 pass
+        else:  # we don't have an etag, so we'll keep it.
+            pass
+    elif strategy in CHECKSUM_STRATEGIES:
+        s3_head = entry.get("s3_head")
+        # no remote object, or it doesn't have a checksum of this type, keep it.
+        if s3_head and entry.get("local_checksum"):
+            if _remote_checksum(s3_head, strategy) == entry["local_checksum"]:
+                entry["skip_flag"] = True
     elif strategy == "date_size":
-        for entry in keeplist:
-            if entry.get("s3_head"):
-                # fstat = entry['stat']
-                local_modified_epoch = entry["modified_epoch"]
-                local_size = entry["bytes"]
+        if entry.get("s3_head"):
+            # fstat = entry['stat']
+            local_modified_epoch = entry["modified_epoch"]
+            local_size = entry["bytes"]
 
-                # py2's datetime doesn't have a timestamp() field, so we have to revert to something more awkward.
-                # remote_modified_epoch = entry['s3_head']['LastModified'].timestamp()
-                remote_modified_datetime = entry["s3_head"]["LastModified"]
-                delta = remote_modified_datetime - datetime.datetime(1970, 1, 1, tzinfo=tz.tzutc())
-                remote_modified_epoch = delta.seconds + (delta.days * 86400)
+            # py2's datetime doesn't have a timestamp() field, so we have to revert to something more awkward.
+            # remote_modified_epoch = entry['s3_head']['LastModified'].timestamp()
+            remote_modified_datetime = entry["s3_head"]["LastModified"]
+            delta = remote_modified_datetime - datetime.datetime(1970, 1, 1, tzinfo=tz.tzutc())
+            remote_modified_epoch = delta.seconds + (delta.days * 86400)
 
-                remote_size = entry["s3_head"]["ContentLength"]
+            remote_size = entry["s3_head"]["ContentLength"]
 
-                entry["whytime"] = f"{local_modified_epoch} / {remote_modified_epoch}"
-                entry["whysize"] = f"{local_size} / {remote_size}"
+            entry["whytime"] = f"{local_modified_epoch} / {remote_modified_epoch}"
+            entry["whysize"] = f"{local_size} / {remote_size}"
 
-                if local_modified_epoch <= remote_modified_epoch and local_size == remote_size:
-                    entry["skip_flag"] = True
-            else:
-                entry["why"] = "no s3_head"
+            if local_modified_epoch <= remote_modified_epoch and local_size == remote_size:
+                entry["skip_flag"] = True
+        else:
+            entry["why"] = "no s3_head"
     # else: probably 'force'. Basically we don't skip with any with other strategies.
     else:
         pass
 
-    # prune 'please skip' entries, if any.
-    return [x for x in keeplist if not x.get("skip_flag")]
+    return entry.get("skip_flag", False)
+
+
+def build_transfer_config(params):
+    return TransferConfig(
+        max_concurrency=params["max_concurrency"],
+        multipart_threshold=params["multipart_threshold"],
+        multipart_chunksize=params["multipart_chunksize"],
+    )
 
 
-def upload_files(s3, bucket, filelist, params):
+def upload_files(s3, bucket, filelist, params, transfer_config=None):
+    """Upload the files through a single transfer manager.
+
+    The manager's bounded pool of workers is shared between all of the files (and their parts).
+    Returns a tuple of the entries which were uploaded and the entries which failed."""
     ret = []
-    for entry in filelist:
-        args = {"ContentType": entry["mime_type"]}
-        if params.get("permission"):
-            args["ACL"] = params["permission"]
-        if params.get("cache_control"):
-            args["CacheControl"] = params["cache_control"]
-        if params.get("storage_class"):
-            args["StorageClass"] = params["storage_class"]
-        # if this fails exception is caught in main()
-        s3.upload_file(entry["fullpath"], bucket, entry["s3_path"], ExtraArgs=args, Callback=None, Config=None)
-        ret.append(entry)
-    return ret
-
-
-def remove_files(s3, sourcelist, params):
-    bucket = params.get("bucket")
-    key_prefix = params.get("key_prefix")
+    failed = []
+    for entry, error in iter_uploads(s3, bucket, filelist, params, transfer_config=transfer_config):
+        if error is None:
+            ret.append(entry)
+        else:
+            failedentry = entry.copy()
+            failedentry["error"] = error
+            failed.append(failedentry)
+    return ret, failed
+
+
+def iter_uploads(s3, bucket, filelist, params, transfer_config=None):
+    """Generator version of upload_files(), yields (entry, error) tuples in the order of filelist.
+
+    filelist may itself be a generator, the number of transfers waiting to be collected is bounded
+    so that we don't hold on to every entry in memory."""
+    if transfer_config is None:
+        transfer_config = TransferConfig()
+    max_pending = max(transfer_config.max_concurrency, 1) * 10
+
+    with create_transfer_manager(s3, transfer_config) as manager:
+        transfers = collections.deque()
+        for entry in filelist:
+            args = {"ContentType": entry["mime_type"]}
+            if params.get("permission"):
+                args["ACL"] = params["permission"]
+            if params.get("cache_control"):
+                args["CacheControl"] = params["cache_control"]
+            if params.get("storage_class"):
+                args["StorageClass"] = params["storage_class"]
+            if params.get("file_change_strategy") in CHECKSUM_STRATEGIES:
+                args["ChecksumAlgorithm"] = CHECKSUM_STRATEGIES[params["file_change_strategy"]]
+            future = manager.upload(entry["fullpath"], bucket, entry["s3_path"], extra_args=args)
+            transfers.append((entry, future))
+            if len(transfers) >= max_pending:
+                yield _transfer_result(*transfers.popleft())
+
+        while transfers:
+            yield _transfer_result(*transfers.popleft())
+
+
+def _transfer_result(entry, future):
+    try:
+        future.result()
+    except (botocore.exceptions.ClientError, botocore.exceptions.BotoCoreError, OSError) as e:
+        return entry, to_native(e)
+    return entry, None
+
+
+def iter_remote_objects(s3, bucket, key_prefix="", s3index=None):
+    """Yield (key, size) tuples for the remote objects under key_prefix.
+
+    Uses the index when we have one, otherwise the listing is streamed page by page
+    rather than building the full result first."""
+    if s3index is not None:
+        for key, s3_head in s3index.items():
+            yield key, s3_head["ContentLength"]
+        return
     paginator = s3.get_paginator("list_objects_v2")
-    current_keys = set(
-        x["Key"] for x in paginator.paginate(Bucket=bucket, Prefix=key_prefix).build_full_result().get("Contents", [])
-    )
+    for page in paginator.paginate(Bucket=bucket, Prefix=key_prefix):
+        for obj in page.get("Contents", []):
+            yield obj["Key"], obj["Size"]
+
+
+def _is_retryable_delete_error(error):
+    if error.response.get("Error", {}).get("Code") in DELETE_RETRY_CODES:
+        return True
+    return error.response.get("ResponseMetadata", {}).get("HTTPStatusCode", 0) >= 500
+
+
+def delete_batch(s3, bucket, batch, attempts=DELETE_ATTEMPTS):
+    """Delete a batch of (key, size) tuples with a single DeleteObjects call.
+
+    Keys which fail with a transient error are retried, as is the whole call if the request itself
+    is throttled or fails with a server error, up to attempts calls in total.
+    Returns a tuple of the deleted (key, size) tuples and the keys which could not be deleted."""
+    deleted = []
+    failed = []
+    pending = dict(batch)
+    for attempt in range(attempts):
+        if attempt:
+            time.sleep(DELETE_RETRY_DELAY * 2 ** (attempt - 1))
+        try:
+            response = s3.delete_objects(
+                Bucket=bucket,
+                Delete={"Objects": [{"Key": key} for key in pending], "Quiet": True},
+            )
+        except botocore.exceptions.ClientError as e:
+            if attempt + 1 < attempts and _is_retryable_delete_error(e):
+                continue
+            raise
+        # In quiet mode only the keys which couldn't be deleted are returned
+        errors = {error["Key"]: error for error in response.get("Errors", [])}
+        retry = {}
+        for key, size in pending.items():
+            error = errors.get(key)
+            if error is None:
+                deleted.append((key, size))
+            elif error.get("Code") in DELETE_RETRY_CODES and attempt + 1 < attempts:
+                retry[key] = size
+            else:
+                failed.append({"key": key, "code": error.get("Code"), "message": error.get("Message")})
+        pending = retry
+        if not pending:
+            break
+    return deleted, failed
+
+
+def iter_deletes(s3, bucket, key_prefix, keep_keys, max_concurrency=1, s3index=None):
+    """Delete the remote objects under key_prefix which aren't in keep_keys.
+
+    Batches of up to 1000 keys are deleted by a bounded pool of workers while the listing is still being read.
+    Yields the (deleted, failed) tuple returned by delete_batch() for each batch."""
+    max_pending = max(max_concurrency, 1) * 2
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max(max_concurrency, 1)) as executor:
+        batches = collections.deque()
+        batch = []
+        for key, size in iter_remote_objects(s3, bucket, key_prefix, s3index=s3index):
+            if key in keep_keys:
+                continue
+            batch.append((key, size))
+            if len(batch) < DELETE_BATCH_SIZE:
+                continue
+            batches.append(executor.submit(delete_batch, s3, bucket, batch))
+            batch = []
+            if len(batches) >= max_pending:
+                yield batches.popleft().result()
+        if batch:
+            batches.append(executor.submit(delete_batch, s3, bucket, batch))
+
+        while batches:
+            yield batches.popleft().result()
+
+
+def remove_files(s3, sourcelist, params, s3index=None, keep_removed=True):
+    """Remove the remote objects which are not in sourcelist.
+
+    Returns a tuple of the removed keys (None unless keep_removed), the summary of the removal
+    and the keys which could not be removed."""
     keep_keys = set(to_text(source_file["s3_path"]) for source_file in sourcelist)
-    delete_keys = list(current_keys - keep_keys)
+    removed = [] if keep_removed else None
+    failed_deletes = []
+    summary = {"removed": 0, "bytes": 0, "failed": 0, "batches": 0}
+
+    start = time.monotonic()
+    deletes = iter_deletes(
+        s3,
+        params.get("bucket"),
+        params.get("key_prefix"),
+        keep_keys,
+        max_concurrency=params.get("max_concurrency") or 1,
+        s3index=s3index,
+    )
+    for deleted, failed in deletes:
+        summary["batches"] += 1
+        summary["removed"] += len(deleted)
+        summary["bytes"] += sum(size for _key, size in deleted)
+        if keep_removed:
+            removed.extend(key for key, _size in deleted)
+        failed_deletes.extend(failed)
+    summary["failed"] = len(failed_deletes)
+    summary["elapsed"] = round(time.monotonic() - start, 3)
+
+    return removed, summary, failed_deletes
+
+
+def push_files(module, s3, result, s3index=None, etag_cache=None):
+    """Run each stage over the complete file list, keeping the listing of every stage in the result.
 
-    # can delete 1000 objects at a time
-    groups_of_keys = [delete_keys[i:i + 1000] for i in range(0, len(delete_keys), 1000)]  # fmt:skip
-    for keys in groups_of_keys:
-        s3.delete_objects(Bucket=bucket, Delete={"Objects": [{"Key": key} for key in keys]})
+    Returns a tuple of the number of files uploaded, the number of files which needed uploading,
+    the failed uploads and the list of local files."""
+    params = module.params
+    strategy = params["file_change_strategy"]
 
-    return delete_keys
+    result["filelist_initial"] = gather_files(params["file_root"], exclude=params["exclude"], include=params["include"])
+    result["filelist_typed"] = determine_mimetypes(result["filelist_initial"], params.get("mime_map"))
+    result["filelist_s3"] = calculate_s3_path(result["filelist_typed"], params["key_prefix"])
+    filelist_remote = lookup_s3(
+        s3,
+        params["bucket"],
+        result["filelist_s3"],
+        strategy,
+        s3index=s3index,
+        max_concurrency=params["max_concurrency"],
+    )
+
+    if strategy == "checksum" or strategy in CHECKSUM_STRATEGIES:
+        result["filelist_local_etag"] = calculate_local_etag(
+            filelist_remote,
+            chunk_size=params["multipart_chunksize"],
+            multipart_threshold=params["multipart_threshold"],
+            etag_cache=etag_cache,
+            lazy=True,
+            algorithm="md5" if strategy == "checksum" else strategy,
+        )
+    else:
+        result["filelist_local_etag"] = filelist_remote
+
+    result["filelist_actionable"] = apply_strategy(result["filelist_local_etag"], strategy)
+    result["uploads"], failed_uploads = upload_files(
+        s3, params["bucket"], result["filelist_actionable"], params, transfer_config=build_transfer_config(params)
+    )
+    return len(result["uploads"]), len(result["filelist_actionable"]), failed_uploads, result["filelist_local_etag"]
+
+
+def stream_files(module, s3, result, s3index=None, etag_cache=None):
+    """Stream the files through the stages one at a time, only keeping summary counts in the result.
+
+    This avoids holding a copy of every entry for every stage, which matters for very large trees.
+    Returns the same tuple as push_files(), the list of local files only contains the S3 keys."""
+    params = module.params
+    strategy = params["file_change_strategy"]
+    summary = result["summary"] = {
+        "files": 0,
+        "bytes": 0,
+        "actionable": 0,
+        "uploaded": 0,
+        "uploaded_bytes": 0,
+        "failed": 0,
+    }
+    keep_keys = set()
+
+    def local_files():
+        for entry in iter_files(params["file_root"], exclude=params["exclude"], include=params["include"]):
+            set_mime_type(entry, params.get("mime_map"))
+            set_s3_path(entry, params["key_prefix"])
+            keep_keys.add(to_text(entry["s3_path"]))
+            summary["files"] += 1
+            summary["bytes"] += entry["bytes"]
+            yield entry
+
+    def actionable_files():
+        lookups = iter_lookups(
+            s3, params["bucket"], local_files(), strategy, s3index=s3index, max_concurrency=params["max_concurrency"]
+        )
+        for entry in lookups:
+            if strategy == "checksum" or strategy in CHECKSUM_STRATEGIES:
+                set_local_etag(
+                    entry,
+                    chunk_size=params["multipart_chunksize"],
+                    multipart_threshold=params["multipart_threshold"],
+                    etag_cache=etag_cache,
+                    lazy=True,
+                    algorithm="md5" if strategy == "checksum" else strategy,
+                )
+            if flag_skip(entry, strategy):
+                continue
+            summary["actionable"] += 1
+            yield entry
+
+    failed_uploads = []
+    uploads = iter_uploads(
+        s3, params["bucket"], actionable_files(), params, transfer_config=build_transfer_config(params)
+    )
+    for entry, error in uploads:
+        if error is None:
+            summary["uploaded"] += 1
+            summary["uploaded_bytes"] += entry["bytes"]
+        else:
+            entry["error"] = error
+            failed_uploads.append(entry)
+    summary["failed"] = len(failed_uploads)
+
+    sourcelist = [{"s3_path": key} for key in keep_keys]
+    return summary["uploaded"], summary["actionable"], failed_uploads, sourcelist
 
 
 def main():
     argument_spec = dict(
         mode=dict(choices=["push"], default="push"),
-        file_change_strategy=dict(choices=["force", "date_size", "checksum"], default="date_size"),
+        file_change_strategy=dict(choices=["force", "date_size", "checksum", "crc32c", "sha256"], default="date_size"),
         bucket=dict(required=True),
         key_prefix=dict(required=False, default="", no_log=False),
         file_root=dict(required=True, type="path"),
@@ -486,6 +1282,11 @@ def main():
         include=dict(required=False, default="*"),
         cache_control=dict(required=False, default=""),
         delete=dict(required=False, type="bool", default=False),
+        max_concurrency=dict(required=False, type="int", default=10),
+        etag_cache_path=dict(required=False, type="path"),
+        summary_only=dict(required=False, type="bool", default=False),
+        multipart_threshold=dict(required=False, type="int", default=8 * 1024 * 1024),
+        multipart_chunksize=dict(required=False, type="int", default=8 * 1024 * 1024),
         storage_class=dict(
             required=False,
             default="STANDARD",
@@ -510,8 +1311,15 @@ def main():
     if not HAS_DATEUTIL:
         module.fail_json(msg="dateutil required for this module")
 
+    if module.params["file_change_strategy"] == "crc32c" and not HAS_AWSCRT:
+        module.fail_json(msg="awscrt required for file_change_strategy=crc32c")
+
+    if module.params["max_concurrency"] < 1:
+        module.fail_json(msg="max_concurrency must be at least 1")
+
     result = {}
     mode = module.params["mode"]
+    strategy = module.params["file_change_strategy"]
 
     try:
         s3 = module.client("s3")
@@ -520,30 +1328,69 @@ def main():
 
     if mode == "push":
         try:
-            result["filelist_initial"] = gather_files(
-                module.params["file_root"], exclude=module.params["exclude"], include=module.params["include"]
-            )
-            result["filelist_typed"] = determine_mimetypes(result["filelist_initial"], module.params.get("mime_map"))
-            result["filelist_s3"] = calculate_s3_path(result["filelist_typed"], module.params["key_prefix"])
+            # Fetch the remote details first, so that we only need to calculate checksums for files
+            # that exist remotely with a matching size.
+            # One listing serves both the change detection and the removal of stale keys.  The force
+            # strategy doesn't need the index, so any removal streams the listing instead.
+            s3index = None
+            if strategy != "force":
+                s3index = list_s3_objects(s3, module.params["bucket"], module.params["key_prefix"])
+
+            etag_cache = None
+            if module.params["etag_cache_path"] and (strategy == "checksum" or strategy in CHECKSUM_STRATEGIES):
+                etag_cache = LocalEtagCache(module.params["etag_cache_path"])
+                etag_cache.load()
+
             try:
-                result["filelist_local_etag"] = calculate_local_etag(result["filelist_s3"])
-            except ValueError as e:
-                if module.params["file_change_strategy"] == "checksum":
-                    module.fail_json_aws(
-                        e,
-                        "Unable to calculate checksum.  If running in FIPS mode, you may need to use another file_change_strategy",
+                if module.params["summary_only"]:
+                    uploaded, actionable, failed_uploads, sourcelist = stream_files(
+                        module, s3, result, s3index, etag_cache
                     )
-                result["filelist_local_etag"] = result["filelist_s3"].copy()
-            result["filelist_actionable"] = filter_list(
-                s3, module.params["bucket"], result["filelist_local_etag"], module.params["file_change_strategy"]
-            )
-            result["uploads"] = upload_files(s3, module.params["bucket"], result["filelist_actionable"], module.params)
+                else:
+                    uploaded, actionable, failed_uploads, sourcelist = push_files(
+                        module, s3, result, s3index, etag_cache
+                    )
+            except ChecksumFailure as e:
+                module.fail_json_aws(
+                    e.exc,
+                    "Unable to calculate checksum.  If running in FIPS mode, you may need to use another file_change_strategy",
+                )
 
+            if etag_cache is not None:
+                try:
+                    etag_cache.save(module.params["file_root"])
+                except OSError as e:
+                    module.warn(f"Unable to write the ETag cache {module.params['etag_cache_path']}: {to_native(e)}")
+                result["etag_cache"] = {"hits": etag_cache.hits, "misses": etag_cache.misses}
+
+            if failed_uploads:
+                result["failed_uploads"] = failed_uploads
+                module.fail_json(
+                    msg=f"Failed to upload {len(failed_uploads)} of {actionable} files",
+                    changed=bool(uploaded),
+                    **result,
+                )
+
+            removed = 0
             if module.params["delete"]:
-                result["removed"] = remove_files(s3, result["filelist_local_etag"], module.params)
+                removed_keys, result["delete_summary"], failed_deletes = remove_files(
+                    s3, sourcelist, module.params, s3index=s3index, keep_removed=not module.params["summary_only"]
+                )
+                removed = result["delete_summary"]["removed"]
+                if module.params["summary_only"]:
+                    result["summary"]["removed"] = removed
+                else:
+                    result["removed"] = removed_keys
+                if failed_deletes:
+                    result["failed_deletes"] = failed_deletes
+                    module.fail_json(
+                        msg=f"Failed to remove {len(failed_deletes)} of {removed + len(failed_deletes)} objects",
+                        changed=bool(uploaded or removed),
+                        **result,
+                    )
 
             # mark changed if we actually upload something.
-            if result.get("uploads") or result.get("removed"):
+            if uploaded or removed:
                 result["changed"] = True
             # result.update(filelist=actionable_filelist)
         except (botocore.exceptions.ClientError, botocore.exceptions.BotoCoreError) as e:
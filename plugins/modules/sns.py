@@ -160,7 +160,9 @@ try:
 except ImportError:
     pass  # Handled by AnsibleAWSModule
 
+
 from ansible_collections.community.aws.plugins.module_utils.modules import AnsibleCommunityAWSModule as AnsibleAWSModule
+from ansible_collections.community.aws.plugins.module_utils.sns import get_account_info
 from ansible_collections.community.aws.plugins.module_utils.sns import topic_arn_lookup
 
 
@@ -222,7 +224,8 @@ def main():
         # Short names can't contain ':' so we'll assume this is the full ARN
         sns_kwargs["TopicArn"] = topic
     else:
-        sns_kwargs["TopicArn"] = topic_arn_lookup(client, module, topic)
+        account_id, partition = get_account_info(module)
+        sns_kwargs["TopicArn"] = topic_arn_lookup(client, module, topic, account_id, partition)
 
     if not sns_kwargs["TopicArn"]:
         module.fail_json(msg=f"Could not find topic: {topic}")
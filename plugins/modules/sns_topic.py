@@ -346,10 +346,11 @@ from ansible_collections.amazon.aws.plugins.module_utils.transformation import s
 from ansible_collections.community.aws.plugins.module_utils.modules import AnsibleCommunityAWSModule as AnsibleAWSModule
 from ansible_collections.community.aws.plugins.module_utils.sns import canonicalize_endpoint
 from ansible_collections.community.aws.plugins.module_utils.sns import compare_delivery_policies
+from ansible_collections.community.aws.plugins.module_utils.sns import get_account_info
 from ansible_collections.community.aws.plugins.module_utils.sns import get_info
 from ansible_collections.community.aws.plugins.module_utils.sns import list_topic_subscriptions
-from ansible_collections.community.aws.plugins.module_utils.sns import list_topics
 from ansible_collections.community.aws.plugins.module_utils.sns import topic_arn_lookup
+from ansible_collections.community.aws.plugins.module_utils.sns import topic_exists
 from ansible_collections.community.aws.plugins.module_utils.sns import update_tags
 
 
@@ -374,6 +375,7 @@ class SnsTopicManager(object):
     ):
         self.connection = module.client("sns")
         self.module = module
+        self.account_id, self.partition = get_account_info(module)
         self.name = name
         self.topic_type = topic_type
         self.state = state
@@ -587,7 +589,7 @@ class SnsTopicManager(object):
         self.populate_topic_arn()
         if not self.topic_arn:
             changed = self._create_topic()
-        if self.topic_arn in list_topics(self.connection, self.module):
+        if topic_exists(self.connection, self.module, self.topic_arn, self.account_id):
             changed |= self._set_topic_attrs()
         elif self.display_name or self.policy or self.delivery_policy:
             self.module.fail_json(
@@ -595,7 +597,7 @@ class SnsTopicManager(object):
             )
         changed |= self._set_topic_subs()
         self._init_desired_subscription_attributes()
-        if self.topic_arn in list_topics(self.connection, self.module):
+        if topic_exists(self.connection, self.module, self.topic_arn, self.account_id):
             changed |= self._set_topic_subs_attributes()
         elif any(self.desired_subscription_attributes.values()):
             self.module.fail_json(msg="Cannot set subscription attributes for SNS topics not owned by this account")
@@ -608,7 +610,7 @@ class SnsTopicManager(object):
         changed = False
         self.populate_topic_arn()
         if self.topic_arn:
-            if self.topic_arn not in list_topics(self.connection, self.module):
+            if not topic_exists(self.connection, self.module, self.topic_arn, self.account_id):
                 self.module.fail_json(
                     msg="Cannot use state=absent with third party ARN. Use subscribers=[] to unsubscribe"
                 )
@@ -624,7 +626,7 @@ class SnsTopicManager(object):
         name = self.name
         if self.topic_type == "fifo" and not name.endswith(".fifo"):
             name += ".fifo"
-        self.topic_arn = topic_arn_lookup(self.connection, self.module, name)
+        self.topic_arn = topic_arn_lookup(self.connection, self.module, name, self.account_id, self.partition)
 
 
 def main():
@@ -707,7 +709,7 @@ def main():
     sns_facts = dict(
         changed=changed,
         sns_arn=sns_topic.topic_arn,
-        sns_topic=get_info(sns_topic.connection, module, sns_topic.topic_arn),
+        sns_topic=get_info(sns_topic.connection, module, sns_topic.topic_arn, sns_topic.account_id),
     )
 
     module.exit_json(**sns_facts)
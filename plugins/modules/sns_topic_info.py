@@ -17,6 +17,32 @@ options:
         description: The ARN of the AWS SNS topic for which you wish to find subscriptions or list attributes.
         required: false
         type: str
+    details:
+        description:
+        - When I(topic_arn) isn't set, return the attributes, subscriptions and tags of every topic
+          rather than only the ARNs of the topics.
+        - The topics are described concurrently, while they're still being listed.
+        type: bool
+        default: false
+        version_added: 12.0.0
+    names:
+        description:
+        - When I(topic_arn) isn't set, only return the topics with a name matching one of these shell-style patterns.
+        type: list
+        elements: str
+        version_added: 12.0.0
+    tags:
+        description:
+        - When I(topic_arn) isn't set, only return the topics which have all of these tags.
+        - The tags of each topic are retrieved concurrently.
+        type: dict
+        version_added: 12.0.0
+    max_concurrency:
+        description:
+        - The maximum number of topics to describe concurrently, when I(details=true) or I(tags) is set.
+        type: int
+        default: 10
+        version_added: 12.0.0
 extends_documentation_fragment:
 - amazon.aws.common.modules
 - amazon.aws.region.modules
@@ -32,12 +58,25 @@ EXAMPLES = r"""
   community.aws.sns_topic_info:
     topic_arn: "{{ sns_arn }}"
   register: sns_topic_info
+
+- name: get the attributes, subscriptions and tags of all the production alert topics
+  community.aws.sns_topic_info:
+    details: true
+    names:
+      - "alerts-*"
+    tags:
+      Environment: production
+    max_concurrency: 20
+  register: sns_topics
 """
 
 RETURN = r"""
 result:
   description:
     - The result contaning the details of one or all AWS SNS topics.
+    - When I(topic_arn) isn't set and neither is I(details), a list of topic ARNs.
+    - With I(details=true) a list of the details of each topic, in this case I(sns_topic) only contains
+      the attributes, I(subscriptions) and I(tags) of the topic.
   returned: success
   type: list
   contains:
@@ -125,6 +164,12 @@ result:
                 returned: when topic is owned by this AWS account
                 type: str
                 sample: arn:aws:sns:us-east-2:123456789012:ansible-test-dummy-topic
+            tags:
+                description: The tags of the topic.
+                returned: always
+                type: dict
+                sample: {"Environment": "production"}
+                version_added: 12.0.0
             topic_type:
                 description: The type of topic.
                 type: str
@@ -132,36 +177,126 @@ result:
 """
 
 
+import collections
+import fnmatch
+from concurrent.futures import ThreadPoolExecutor
+
 try:
     import botocore
 except ImportError:
     pass  # handled by AnsibleAWSModule
 
+from ansible_collections.amazon.aws.plugins.module_utils.botocore import is_boto3_error_code
 from ansible_collections.amazon.aws.plugins.module_utils.retries import AWSRetry
 
 from ansible_collections.community.aws.plugins.module_utils.modules import AnsibleCommunityAWSModule as AnsibleAWSModule
+from ansible_collections.community.aws.plugins.module_utils.sns import describe_topic
+from ansible_collections.community.aws.plugins.module_utils.sns import get_account_info
 from ansible_collections.community.aws.plugins.module_utils.sns import get_info
-from ansible_collections.community.aws.plugins.module_utils.sns import list_topics
+from ansible_collections.community.aws.plugins.module_utils.sns import iter_topics
+from ansible_collections.community.aws.plugins.module_utils.sns import list_topic_tags
+
+
+def match_names(topic_arn, names):
+    if not names:
+        return True
+    # topic names cannot have colons
+    name = topic_arn.split(":")[-1]
+    return any(fnmatch.fnmatchcase(name, pattern) for pattern in names)
+
+
+def match_tags(tags, desired_tags):
+    return all(tags.get(key) == value for key, value in desired_tags.items())
+
+
+def describe(connection, topic_arn, details, desired_tags):
+    """
+    Returns the details of a topic (or only the ARN if details is false),
+    None if it doesn't have the desired tags or was deleted since it was listed,
+    and a list of warnings for the main thread to report.
+    """
+    try:
+        tags = None
+        if desired_tags:
+            try:
+                tags = list_topic_tags(connection, topic_arn)
+            except is_boto3_error_code("AuthorizationError"):
+                return None, [f"Permission denied accessing tags of topic {topic_arn}, skipping it"]
+            if not match_tags(tags, desired_tags):
+                return None, []
+        if not details:
+            return topic_arn, []
+        topic, warnings = describe_topic(connection, topic_arn, tags=tags)
+        return dict(sns_arn=topic_arn, sns_topic=topic), warnings
+    except is_boto3_error_code("NotFound"):
+        return None, []
+
+
+def describe_topics(connection, topic_arns, details, desired_tags, max_concurrency):
+    """
+    Describes the topics using a pool of max_concurrency workers, yielding the results in the order of topic_arns.
+
+    topic_arns may be a generator, the number of pending results is bounded so the listing
+    is consumed as the topics are described.
+    """
+    max_pending = max_concurrency * 10
+    with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+        pending = collections.deque()
+        for topic_arn in topic_arns:
+            pending.append((topic_arn, executor.submit(describe, connection, topic_arn, details, desired_tags)))
+            if len(pending) >= max_pending:
+                yield pending.popleft()
+        while pending:
+            yield pending.popleft()
+
+
+def list_topic_details(connection, module):
+    topic_arns = (arn for arn in iter_topics(connection, module) if match_names(arn, module.params["names"]))
+    if not module.params["details"] and not module.params["tags"]:
+        return list(topic_arns)
+
+    results = []
+    topics = describe_topics(
+        connection, topic_arns, module.params["details"], module.params["tags"], module.params["max_concurrency"]
+    )
+    for topic_arn, future in topics:
+        try:
+            result, warnings = future.result()
+        except (botocore.exceptions.ClientError, botocore.exceptions.BotoCoreError) as e:
+            module.fail_json_aws(e, msg=f"Couldn't describe topic {topic_arn}")
+        for warning in warnings:
+            module.warn(warning)
+        if result is not None:
+            results.append(result)
+    return results
 
 
 def main():
     argument_spec = dict(
         topic_arn=dict(type="str", required=False),
+        details=dict(type="bool", default=False),
+        names=dict(type="list", elements="str"),
+        tags=dict(type="dict"),
+        max_concurrency=dict(type="int", default=10),
     )
 
     module = AnsibleAWSModule(argument_spec=argument_spec, supports_check_mode=True)
 
     topic_arn = module.params.get("topic_arn")
 
+    if module.params["max_concurrency"] < 1:
+        module.fail_json(msg="max_concurrency must be at least 1")
+
     try:
         connection = module.client("sns", retry_decorator=AWSRetry.jittered_backoff())
     except (botocore.exceptions.ClientError, botocore.exceptions.BotoCoreError) as e:
         module.fail_json_aws(e, msg="Failed to connect to AWS.")
 
     if topic_arn:
-        results = dict(sns_arn=topic_arn, sns_topic=get_info(connection, module, topic_arn))
+        account_id, _partition = get_account_info(module)
+        results = dict(sns_arn=topic_arn, sns_topic=get_info(connection, module, topic_arn, account_id))
     else:
-        results = list_topics(connection, module)
+        results = list_topic_details(connection, module)
 
     module.exit_json(result=results)
 
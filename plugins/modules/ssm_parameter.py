@@ -17,7 +17,8 @@ options:
   name:
     description:
       - Parameter key name.
-    required: true
+      - Exactly one of I(name) and I(parameters) is required.
+    required: false
     type: str
   description:
     description:
@@ -74,6 +75,67 @@ options:
     default: Standard
     type: str
     version_added: 1.5.0
+  parameters:
+    description:
+      - Manage several parameters at once.
+      - Options not set for a parameter default to the value of the matching top level option.
+      - The current values are read with C(GetParameters) (10 parameters per call), descriptions with
+        C(DescribeParameters) (50 parameters per call) and parameters are deleted with C(DeleteParameters)
+        (10 parameters per call).  C(PutParameter) and tagging calls are made by up to I(max_concurrency)
+        concurrent workers.
+      - Unlike I(name), the module doesn't wait for created or updated parameters to become visible.
+      - Mutually exclusive with I(name).
+    required: false
+    type: list
+    elements: dict
+    version_added: 12.0.0
+    suboptions:
+      name:
+        description:
+          - Parameter key name.
+        required: true
+        type: str
+      description:
+        description:
+          - Parameter key description.
+        type: str
+      value:
+        description:
+          - Parameter value.
+        type: str
+      state:
+        description:
+          - Whether the parameter should exist or not.
+        choices: ['present', 'absent']
+        type: str
+      string_type:
+        description:
+          - Parameter String type.
+        choices: ['String', 'StringList', 'SecureString']
+        type: str
+        aliases: ['type']
+      key_id:
+        description:
+          - AWS KMS key to encrypt C(SecureString) parameters with.
+        type: str
+      tier:
+        description:
+          - Parameter store tier type.
+        choices: ['Standard', 'Advanced', 'Intelligent-Tiering']
+        type: str
+      tags:
+        description:
+          - A dictionary of tags to apply to the parameter.
+          - Tags are purged according to the top level I(purge_tags) option.
+        type: dict
+  max_concurrency:
+    description:
+      - The maximum number of concurrent calls used to update the parameters in I(parameters).
+      - C(PutParameter) is limited to a few calls per second by default, higher values mostly lead to
+        throttled (and retried) calls.
+    type: int
+    default: 3
+    version_added: 12.0.0
 seealso:
   - ref: amazon.aws.aws_ssm lookup <ansible_collections.amazon.aws.aws_ssm_lookup>
     description: The documentation for the C(amazon.aws.aws_ssm) lookup plugin.
@@ -162,6 +224,19 @@ EXAMPLES = r"""
   community.aws.ssm_parameter:
     name: "Hello"
     tags: {}
+
+- name: Manage many parameters in a single task
+  community.aws.ssm_parameter:
+    tags:
+      Environment: "dev"
+    parameters:
+      - name: "/app/dev/db_host"
+        value: "db.example.com"
+      - name: "/app/dev/db_password"
+        string_type: "SecureString"
+        value: "{{ db_password }}"
+      - name: "/app/dev/legacy_setting"
+        state: absent
 """
 
 RETURN = r"""
@@ -239,9 +314,35 @@ parameter_metadata:
       returned: when the parameter has tags
       example: {'MyTagName': 'Some Value'}
       version_added: 5.3.0
+parameters:
+  type: list
+  elements: dict
+  description:
+    - The result for each of the parameters in I(parameters), in the same order.
+  returned: when I(parameters) is set
+  version_added: 12.0.0
+  contains:
+    name:
+      type: str
+      description: Parameter key name.
+      example: /app/dev/db_host
+    state:
+      type: str
+      description: Whether the parameter should exist or not.
+      example: present
+    changed:
+      type: bool
+      description: Whether the parameter (or its tags) were changed.
+      example: true
+    version:
+      type: int
+      description: The version of the parameter created by the update.
+      returned: when the value of the parameter was updated
+      example: 3
 """
 
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 try:
     import botocore
@@ -536,15 +637,223 @@ def delete_parameter(client, module):
     return True, response
 
 
+# Limits on the number of names accepted by the batched calls
+GET_PARAMETERS_BATCH_SIZE = 10
+DESCRIBE_PARAMETERS_BATCH_SIZE = 50
+DELETE_PARAMETERS_BATCH_SIZE = 10
+
+
+def _batches(items, size):
+    for i in range(0, len(items), size):
+        yield items[i : i + size]
+
+
+def get_parameters(client, names):
+    """Returns the current parameters by name, names of parameters which don't exist are omitted."""
+    parameters = {}
+    for batch in _batches(names, GET_PARAMETERS_BATCH_SIZE):
+        response = client.get_parameters(aws_retry=True, Names=batch, WithDecryption=True)
+        for parameter in response["Parameters"]:
+            parameters[parameter["Name"]] = parameter
+    return parameters
+
+
+@AWSRetry.jittered_backoff()
+def _describe_parameters(client, **args):
+    paginator = client.get_paginator("describe_parameters")
+    return paginator.paginate(**args).build_full_result()["Parameters"]
+
+
+def describe_parameters(client, names):
+    """Returns the metadata (without tags) of the parameters by name."""
+    parameters = {}
+    for batch in _batches(names, DESCRIBE_PARAMETERS_BATCH_SIZE):
+        for parameter in _describe_parameters(
+            client, ParameterFilters=[{"Key": "Name", "Option": "Equals", "Values": batch}]
+        ):
+            parameters[parameter["Name"]] = parameter
+    return parameters
+
+
+def _parameter_spec(module, parameter):
+    """Fills in the options of an entry of parameters from the top level options."""
+    spec = dict(parameter)
+    for option in ("description", "value", "state", "string_type", "key_id", "tier", "tags"):
+        if spec.get(option) is None:
+            spec[option] = module.params.get(option)
+    return spec
+
+
+def _put_parameter_args(module, spec, existing_parameter, existing_metadata):
+    """Returns the arguments for PutParameter, None if the parameter doesn't need updating."""
+    overwrite_value = module.params.get("overwrite_value")
+
+    args = dict(Name=spec["name"], Type=spec["string_type"], Tier=spec["tier"])
+    args.update(Overwrite=overwrite_value in ("always", "changed"))
+    if spec["value"] is not None:
+        args.update(Value=spec["value"])
+    if spec["description"]:
+        args.update(Description=spec["description"])
+    if spec["string_type"] == "SecureString":
+        args.update(KeyId=spec["key_id"])
+
+    if not existing_parameter:
+        # Add tags in initial creation request
+        if spec["tags"]:
+            args.update(Tags=ansible_dict_to_boto3_tag_list(spec["tags"]))
+            # Overwrite=True conflicts with tags and is not needed for new param
+            args.update(Overwrite=False)
+        return args
+
+    if "Value" not in args:
+        args["Value"] = existing_parameter["Value"]
+
+    if overwrite_value == "always":
+        return args
+    if overwrite_value == "changed":
+        if existing_parameter["Type"] != args["Type"] or existing_parameter["Value"] != args["Value"]:
+            return args
+        if args.get("Description") and existing_metadata.get("Description") != args["Description"]:
+            return args
+    return None
+
+
+def _update_parameter(client, module, spec, put_args, update_tags):
+    """Updates a single parameter and (optionally) its tags.
+
+    Runs in a worker thread, errors are raised for the caller to report.
+    """
+    result = dict(changed=False)
+    if put_args is not None:
+        result["changed"] = True
+        if not module.check_mode:
+            response = client.put_parameter(aws_retry=True, **put_args)
+            result["version"] = response.get("Version")
+
+    if update_tags:
+        tags = client.list_tags_for_resource(aws_retry=True, ResourceType="Parameter", ResourceId=spec["name"])
+        current_tags = boto3_tag_list_to_ansible_dict(tags["TagList"])
+        tags_to_add, tags_to_remove = compare_aws_tags(current_tags, spec["tags"], module.params.get("purge_tags"))
+        if tags_to_add or tags_to_remove:
+            result["changed"] = True
+        if module.check_mode:
+            return result
+        if tags_to_add:
+            client.add_tags_to_resource(
+                aws_retry=True,
+                ResourceType="Parameter",
+                ResourceId=spec["name"],
+                Tags=ansible_dict_to_boto3_tag_list(tags_to_add),
+            )
+        if tags_to_remove:
+            client.remove_tags_from_resource(
+                aws_retry=True, ResourceType="Parameter", ResourceId=spec["name"], TagKeys=tags_to_remove
+            )
+
+    return result
+
+
+def bulk_update_parameters(client, module):
+    specs = [_parameter_spec(module, parameter) for parameter in module.params.get("parameters")]
+    names = [spec["name"] for spec in specs]
+    if len(set(names)) != len(names):
+        module.fail_json(msg="Each parameter may only be listed once in parameters")
+
+    try:
+        existing_parameters = get_parameters(client, names)
+    except (botocore.exceptions.ClientError, botocore.exceptions.BotoCoreError) as e:
+        module.fail_json_aws(e, msg="fetching parameters")
+
+    # Descriptions aren't returned by GetParameters, only describe the parameters where they matter
+    describe_names = [
+        spec["name"]
+        for spec in specs
+        if spec["state"] == "present" and spec["description"] and spec["name"] in existing_parameters
+    ]
+    existing_metadata = {}
+    if describe_names and module.params.get("overwrite_value") == "changed":
+        try:
+            existing_metadata = describe_parameters(client, describe_names)
+        except (botocore.exceptions.ClientError, botocore.exceptions.BotoCoreError) as e:
+            module.fail_json_aws(e, msg="getting description values")
+
+    results = [dict(name=spec["name"], state=spec["state"], changed=False) for spec in specs]
+
+    to_delete = [spec["name"] for spec in specs if spec["state"] == "absent"]
+    if module.check_mode:
+        deleted = set(name for name in to_delete if name in existing_parameters)
+    else:
+        # Every name is sent, GetParameters doesn't return the parameters we're not allowed to read,
+        # DeleteParameters reports the parameters which don't exist as InvalidParameters
+        deleted = set()
+        for batch in _batches(to_delete, DELETE_PARAMETERS_BATCH_SIZE):
+            try:
+                response = client.delete_parameters(aws_retry=True, Names=batch)
+            except (botocore.exceptions.ClientError, botocore.exceptions.BotoCoreError) as e:
+                module.fail_json_aws(e, msg="deleting parameters")
+            deleted.update(response.get("DeletedParameters", []))
+
+    updates = []
+    for spec, result in zip(specs, results):
+        if spec["state"] == "absent":
+            result["changed"] = spec["name"] in deleted
+            continue
+        existing_parameter = existing_parameters.get(spec["name"])
+        put_args = _put_parameter_args(module, spec, existing_parameter, existing_metadata.get(spec["name"], {}))
+        # Tags of new parameters are set by PutParameter, existing tags are left alone with overwrite_value=never
+        update_tags = (
+            existing_parameter is not None
+            and spec["tags"] is not None
+            and module.params.get("overwrite_value") != "never"
+        )
+        if put_args is not None or update_tags:
+            updates.append((spec, result, put_args, update_tags))
+
+    failure = None
+    with ThreadPoolExecutor(max_workers=module.params.get("max_concurrency")) as executor:
+        futures = [
+            (spec, result, executor.submit(_update_parameter, client, module, spec, put_args, update_tags))
+            for spec, result, put_args, update_tags in updates
+        ]
+        for spec, result, future in futures:
+            try:
+                result.update(future.result())
+            except (botocore.exceptions.ClientError, botocore.exceptions.BotoCoreError) as e:
+                failure = (spec, e)
+                break
+        if failure:
+            # Don't start any more updates, those already running are left to finish
+            for spec, result, future in futures:
+                future.cancel()
+
+    if failure:
+        # Report the updates which were made before the failure
+        for spec, result, future in futures:
+            if not future.cancelled() and future.exception() is None:
+                result.update(future.result())
+        spec, e = failure
+        changed = any(result["changed"] for result in results)
+        module.fail_json_aws(e, msg=f"setting parameter {spec['name']}", changed=changed, parameters=results)
+
+    return any(result["changed"] for result in results), results
+
+
 def setup_client(module):
-    retry_decorator = AWSRetry.jittered_backoff()
+    if module.params.get("parameters"):
+        # SSM has low rate limits (PutParameter is limited to a few calls per second by default),
+        # back off for longer and retry concurrent updates rather than failing part way through
+        retry_decorator = AWSRetry.jittered_backoff(
+            retries=16, delay=1, max_delay=30, catch_extra_error_codes=["TooManyUpdates"]
+        )
+    else:
+        retry_decorator = AWSRetry.jittered_backoff()
     connection = module.client("ssm", retry_decorator=retry_decorator)
     return connection
 
 
 def setup_module_object():
     argument_spec = dict(
-        name=dict(required=True),
+        name=dict(),
         description=dict(),
         value=dict(required=False, no_log=True),
         state=dict(default="present", choices=["present", "absent"]),
@@ -555,19 +864,45 @@ def setup_module_object():
         tier=dict(default="Standard", choices=["Standard", "Advanced", "Intelligent-Tiering"]),
         tags=dict(type="dict", aliases=["resource_tags"]),
         purge_tags=dict(type="bool", default=True),
+        parameters=dict(
+            type="list",
+            elements="dict",
+            options=dict(
+                name=dict(required=True),
+                description=dict(),
+                value=dict(no_log=True),
+                state=dict(choices=["present", "absent"]),
+                string_type=dict(choices=["String", "StringList", "SecureString"], aliases=["type"]),
+                key_id=dict(),
+                tier=dict(choices=["Standard", "Advanced", "Intelligent-Tiering"]),
+                tags=dict(type="dict"),
+            ),
+        ),
+        max_concurrency=dict(type="int", default=3),
     )
 
-    return AnsibleAWSModule(
+    module = AnsibleAWSModule(
         argument_spec=argument_spec,
+        mutually_exclusive=[["name", "parameters"]],
+        required_one_of=[["name", "parameters"]],
         supports_check_mode=True,
     )
 
+    if module.params.get("max_concurrency") < 1:
+        module.fail_json(msg="max_concurrency must be at least 1")
+
+    return module
+
 
 def main():
     module = setup_module_object()
     state = module.params.get("state")
     client = setup_client(module)
 
+    if module.params.get("parameters"):
+        (changed, results) = bulk_update_parameters(client, module)
+        module.exit_json(changed=changed, parameters=results)
+
     invocations = {
         "present": create_update_parameter,
         "absent": delete_parameter,
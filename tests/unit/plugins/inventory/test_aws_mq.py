@@ -18,8 +18,12 @@
 # along with Ansible.  If not, see <http://www.gnu.org/licenses/>.
 
 import copy
+import json
 import random
 import string
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import ANY
 from unittest.mock import MagicMock
 from unittest.mock import call
 from unittest.mock import patch
@@ -33,9 +37,11 @@ except ImportError:
     pass
 
 from ansible.errors import AnsibleError
+from ansible.errors import AnsibleParserError
 
 from ansible_collections.amazon.aws.plugins.module_utils.botocore import HAS_BOTO3
 
+from ansible_collections.community.aws.plugins.inventory.aws_mq import BrokerDetailCache
 from ansible_collections.community.aws.plugins.inventory.aws_mq import InventoryModule
 from ansible_collections.community.aws.plugins.inventory.aws_mq import _add_details_to_hosts
 from ansible_collections.community.aws.plugins.inventory.aws_mq import _find_hosts_matching_statuses
@@ -333,6 +339,74 @@ def test_add_details_to_hosts_with_hosts(connection):
     ]
 
 
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_add_details_to_hosts_with_executor(connection, max_workers):
+    hosts = [{"BrokerId": str(i)} for i in range(10)]
+    connection.describe_broker.side_effect = lambda **kwargs: {"BrokerState": f"state_{kwargs['BrokerId']}"}
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        _add_details_to_hosts(connection, hosts, strict=True, executor=executor)
+
+    assert hosts == [{"BrokerId": str(i), "Tags": [], "BrokerState": f"state_{i}"} for i in range(10)]
+
+
+def test_add_details_to_hosts_with_detail_cache(connection):
+    def _summary(i, state="RUNNING"):
+        return {"BrokerArn": f"arn:{i}", "BrokerId": str(i), "BrokerName": f"brk{i}", "BrokerState": state}
+
+    connection.describe_broker.side_effect = lambda **kwargs: {
+        "BrokerState": "RUNNING",
+        "EngineVersion": f"version_{kwargs['BrokerId']}",
+        "Tags": {"id": kwargs["BrokerId"]},
+    }
+    detail_cache = BrokerDetailCache()
+    hosts = [_summary(i) for i in range(3)]
+    _add_details_to_hosts(connection, hosts, strict=True, detail_cache=detail_cache)
+    assert connection.describe_broker.call_count == 3
+
+    # round trip through JSON, as with the jsonfile cache plugin
+    data = json.loads(json.dumps(detail_cache.dump()))
+    connection.describe_broker.reset_mock()
+    detail_cache = BrokerDetailCache(data)
+    # broker 0 is unchanged, broker 1 was rebooted, broker 2 was removed and broker 3 is new
+    refreshed = [_summary(0), _summary(1, state="REBOOT_IN_PROGRESS"), _summary(3)]
+    _add_details_to_hosts(connection, refreshed, strict=True, detail_cache=detail_cache)
+
+    connection.describe_broker.assert_has_calls([call(BrokerId="1"), call(BrokerId="3")], any_order=True)
+    assert connection.describe_broker.call_count == 2
+    assert (detail_cache.hits, detail_cache.misses) == (1, 2)
+    assert refreshed[0]["EngineVersion"] == "version_0"
+    assert refreshed[0]["Tags"] == [{"Key": "id", "Value": "0"}]
+    assert sorted(detail_cache.dump()["brokers"]) == ["arn:0", "arn:1", "arn:3"]
+
+
+def test_broker_detail_cache_concurrent(connection):
+    hosts = [{"BrokerArn": f"arn:{i}", "BrokerId": str(i), "BrokerState": "RUNNING"} for i in range(200)]
+    detail_cache = BrokerDetailCache()
+    for host in hosts[:100]:
+        detail_cache.set(host, {"EngineVersion": "1"})
+    detail_cache = BrokerDetailCache(detail_cache.dump())
+    connection.describe_broker.side_effect = lambda **kwargs: {"BrokerState": "RUNNING"}
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        _add_details_to_hosts(connection, hosts, strict=True, executor=executor, detail_cache=detail_cache)
+
+    assert (detail_cache.hits, detail_cache.misses) == (100, 100)
+    assert len(detail_cache.dump()["brokers"]) == 200
+
+
+def test_broker_detail_cache_max_age(monkeypatch):
+    host = {"BrokerArn": "arn:0", "BrokerId": "0", "BrokerState": "RUNNING"}
+    detail_cache = BrokerDetailCache(max_age=60)
+    detail_cache.set(host, {"EngineVersion": "1"})
+    data = detail_cache.dump()
+
+    assert BrokerDetailCache(data, max_age=60).get(host) == {"EngineVersion": "1"}
+    monkeypatch.setattr(time, "time", lambda: data["brokers"]["arn:0"]["fetched"] + 61)
+    assert BrokerDetailCache(data, max_age=60).get(host) is None
+    assert BrokerDetailCache(data, max_age=0).get(host) == {"EngineVersion": "1"}
+
+
 ADD_DETAILS_TO_HOSTS = "ansible_collections.community.aws.plugins.inventory.aws_mq._add_details_to_hosts"
 
 
@@ -364,7 +438,28 @@ def test_get_broker_hosts(m_add_details_to_hosts, inventory, connection):
 
     assert result == [broker]
 
-    m_add_details_to_hosts.assert_called_with(connection, result, strict)
+    m_add_details_to_hosts.assert_called_with(connection, result, strict, executor=None, detail_cache=None)
+
+
+@pytest.mark.parametrize("details", [True, False])
+@patch(ADD_DETAILS_TO_HOSTS)
+def test_get_broker_hosts_filters_statuses(m_add_details_to_hosts, inventory, connection, details):
+    brokers = [
+        {"BrokerId": "1", "BrokerName": "brk1", "BrokerState": "RUNNING"},
+        {"BrokerId": "2", "BrokerName": "brk2", "BrokerState": "DELETION_IN_PROGRESS"},
+        {"BrokerId": "3", "BrokerName": "brk3", "BrokerState": "CREATION_IN_PROGRESS"},
+    ]
+    build_full_result = MagicMock(return_value={"BrokerSummaries": brokers})
+
+    result = inventory._get_broker_hosts(connection, False, statuses=["RUNNING"], details=details)(build_full_result)
+
+    assert result == [brokers[0]]
+    if details:
+        m_add_details_to_hosts.assert_called_once_with(
+            connection, [brokers[0]], False, executor=None, detail_cache=None
+        )
+    else:
+        m_add_details_to_hosts.assert_not_called()
 
 
 @pytest.mark.parametrize("strict", [True, False])
@@ -447,12 +542,41 @@ def test_inventory_get_all_hosts(m_find_hosts, inventory, regions):
     assert result == inventory._get_all_hosts(**params)
     inventory.all_clients.assert_called_with("mq")
     inventory._get_broker_hosts.assert_has_calls(
-        [call(connections[i], params["strict"]) for i in range(regions)], any_order=True
+        [
+            call(
+                connections[i],
+                params["strict"],
+                executor=ANY,
+                statuses=params["statuses"],
+                details=True,
+                detail_cache=None,
+            )
+            for i in range(regions)
+        ],
+        any_order=True,
     )
 
     m_find_hosts.assert_called_with(result, params["statuses"])
 
 
+@patch(ADD_DETAILS_TO_HOSTS)
+def test_inventory_get_all_hosts_concurrent(m_add_details_to_hosts, inventory):
+    connections = []
+    for i in range(5):
+        connection = MagicMock()
+        paginate = connection.get_paginator.return_value.paginate.return_value
+        paginate.build_full_result.return_value = {
+            "BrokerSummaries": [{"BrokerName": f"broker_{j}_{i}", "BrokerState": "RUNNING"} for j in reversed(range(3))]
+        }
+        connections.append((connection, f"region-{i}"))
+    inventory.all_clients.return_value = iter(connections)
+
+    result = inventory._get_all_hosts([], strict=True, statuses=["RUNNING"], max_workers=3)
+
+    assert [host["BrokerName"] for host in result] == [f"broker_{j}_{i}" for j in range(3) for i in range(5)]
+    assert m_add_details_to_hosts.call_count == 5
+
+
 @pytest.mark.parametrize("hostvars_prefix", [True])
 @pytest.mark.parametrize("hostvars_suffix", [True])
 @patch("ansible_collections.community.aws.plugins.inventory.aws_mq._get_mq_hostname")
@@ -586,6 +710,8 @@ def test_inventory_parse(m_parse, inventory, user_cache_directive, cache, cache_
     options["strict_permissions"] = random.choice((True, False))
     options["statuses"] = generate_random_string(with_punctuation=False)
 
+    options["max_workers"] = random.randint(1, 10)
+    options["broker_details"] = random.choice((True, False))
     options["cache"] = user_cache_directive
 
     def get_option_side_effect(v):
@@ -624,6 +750,8 @@ def test_inventory_parse(m_parse, inventory, user_cache_directive, cache, cache_
             options["regions"],
             options["strict_permissions"],
             options["statuses"],
+            max_workers=options["max_workers"],
+            details=options["broker_details"],
         )
         inventory._populate.assert_called_with(all_hosts)
         inventory._format_inventory.assert_called_with(all_hosts)
@@ -636,3 +764,53 @@ def test_inventory_parse(m_parse, inventory, user_cache_directive, cache, cache_
     if cache and user_cache_directive and not cache_hit or (not cache and user_cache_directive):
         # validate that cache was populated
         assert inventory._cache[cache_key] == format_cache_key_value
+
+
+@pytest.mark.parametrize("cache", [True, False])
+@patch(BASE_INVENTORY_PARSE)
+def test_inventory_parse_incremental_cache(m_parse, inventory, cache):
+    options = {
+        "regions": ["us-east-1"],
+        "strict_permissions": True,
+        "statuses": ["RUNNING"],
+        "max_workers": 1,
+        "broker_details": True,
+        "cache": True,
+        "cache_timeout": 3600,
+        "incremental_cache": True,
+    }
+    inventory.get_option.side_effect = options.get
+    inventory.get_cache_key.return_value = "cache_key"
+    # the complete inventory isn't used in incremental mode
+    inventory._cache["cache_key"] = {"_meta": {}}
+    host = {"BrokerArn": "arn:0", "BrokerName": "brk0", "BrokerState": "RUNNING"}
+    previous = BrokerDetailCache()
+    previous.set(host, {"EngineVersion": "1"})
+    inventory._cache["cache_key_brokers"] = previous.dump()
+
+    def _get_all_hosts(*args, detail_cache=None, **kwargs):
+        detail_cache.get(host)
+        return [host]
+
+    inventory._get_all_hosts = MagicMock(side_effect=_get_all_hosts)
+    inventory._populate = MagicMock()
+    inventory._populate_from_cache = MagicMock()
+
+    inventory.parse(MagicMock(), MagicMock(), "path", cache)
+
+    inventory._populate_from_cache.assert_not_called()
+    inventory._populate.assert_called_once_with([host])
+    # when refreshing the cache the previous details are ignored
+    assert bool(inventory._cache["cache_key_brokers"]["brokers"]) == cache
+
+
+@pytest.mark.parametrize("max_workers", [0, -1])
+@patch(BASE_INVENTORY_PARSE)
+def test_inventory_parse_max_workers(m_parse, inventory, max_workers):
+    options = {"regions": ["us-east-1"], "max_workers": max_workers, "broker_details": True}
+    inventory.get_option.side_effect = options.get
+    inventory._get_all_hosts = MagicMock()
+
+    with pytest.raises(AnsibleParserError, match="max_workers must be at least 1"):
+        inventory.parse(MagicMock(), MagicMock(), "path", False)
+    inventory._get_all_hosts.assert_not_called()
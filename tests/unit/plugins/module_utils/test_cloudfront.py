@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: Contributors to the Ansible project
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+import json
+from unittest.mock import MagicMock
+
+import pytest
+
+try:
+    import botocore
+except ImportError:
+    # Handled by HAS_BOTO3
+    pass
+
+from ansible_collections.amazon.aws.plugins.module_utils.botocore import HAS_BOTO3
+
+from ansible_collections.community.aws.plugins.module_utils.cloudfront import DistributionAliasLookup
+from ansible_collections.community.aws.plugins.module_utils.cloudfront import DistributionIndexCache
+
+if not HAS_BOTO3:
+    pytestmark = pytest.mark.skip("test_cloudfront.py requires the python modules 'boto3' and 'botocore'")
+
+
+def make_distribution(distribution_id, aliases):
+    return {"Id": distribution_id, "Aliases": {"Quantity": len(aliases), "Items": aliases}}
+
+
+@pytest.fixture(name="facts_mgr")
+def fixture_facts_mgr():
+    facts_mgr = MagicMock()
+    facts_mgr.list_distributions.return_value = [
+        make_distribution("E1", ["www.example.com", "Example.com"]),
+        make_distribution("E2", []),
+        make_distribution("E3", ["static.example.com"]),
+    ]
+    facts_mgr.get_distribution.side_effect = lambda id, fail_if_error: {
+        "Distribution": {"DistributionConfig": {"Aliases": {"Items": ["www.example.com"]}}}
+    }
+    return facts_mgr
+
+
+def test_distribution_index_cache(tmp_path):
+    path = tmp_path / "cache" / "cloudfront.json"
+
+    index = DistributionIndexCache(str(path))
+    index.load()
+    index.set_caller_reference("ref-1", "E1")
+    index.set_caller_reference("ref-2", "E2")
+    index.set_caller_reference(None, "E3")
+    index.save()
+
+    index = DistributionIndexCache(str(path))
+    index.load()
+    assert index.get_caller_reference("ref-1") == "E1"
+    assert index.get_caller_reference("ref-3") is None
+    index.discard_caller_reference("ref-1")
+    index.save()
+    assert json.loads(path.read_text()) == {"version": 1, "caller_references": {"ref-2": "E2"}}
+
+
+def test_distribution_index_cache_corrupt(tmp_path):
+    path = tmp_path / "cloudfront.json"
+    path.write_text("{not json")
+
+    index = DistributionIndexCache(str(path))
+    index.load()
+    assert index.caller_references == {}
+    # nothing changed, the file's left alone
+    index.save()
+    assert path.read_text() == "{not json"
+
+
+def test_distribution_index_cache_without_path():
+    index = DistributionIndexCache()
+    index.load()
+    index.set_caller_reference("ref-1", "E1")
+    index.save()
+    assert index.get_caller_reference("ref-1") == "E1"
+
+
+def test_alias_lookup(facts_mgr):
+    lookup = DistributionAliasLookup(facts_mgr, DistributionIndexCache())
+    assert lookup.lookup(["example.COM"]) == "E1"
+    assert lookup.lookup(["other.example.com", "static.example.com"]) == "E3"
+    assert lookup.lookup(["other.example.com"]) is None
+    # the distributions are only listed once and a fresh listing doesn't need checking
+    facts_mgr.list_distributions.assert_called_once_with(keyed=False)
+    facts_mgr.get_distribution.assert_not_called()
+
+
+def test_alias_lookup_cached(tmp_path, facts_mgr):
+    path = str(tmp_path / "cloudfront.json")
+    index = DistributionIndexCache(path)
+    DistributionAliasLookup(facts_mgr, index).lookup(["www.example.com"])
+    index.save()
+    facts_mgr.list_distributions.reset_mock()
+
+    index = DistributionIndexCache(path)
+    index.load()
+    assert DistributionAliasLookup(facts_mgr, index).lookup(["www.example.com"]) == "E1"
+    facts_mgr.list_distributions.assert_not_called()
+    facts_mgr.get_distribution.assert_called_once_with(id="E1", fail_if_error=False)
+
+    # aliases which aren't in the cached index might have been added since
+    assert DistributionAliasLookup(facts_mgr, index).lookup(["new.example.com"]) is None
+    facts_mgr.list_distributions.assert_called_once_with(keyed=False)
+
+
+def test_alias_lookup_stale(tmp_path, facts_mgr):
+    index = DistributionIndexCache(str(tmp_path / "cloudfront.json"))
+    index.set_aliases({"www.example.com": "E9"})
+    facts_mgr.get_distribution.side_effect = botocore.exceptions.ClientError(
+        {"Error": {"Code": "NoSuchDistribution", "Message": "Not found"}}, "GetDistribution"
+    )
+
+    assert DistributionAliasLookup(facts_mgr, index).lookup(["www.example.com"]) == "E1"
+    assert index.aliases["www.example.com"] == "E1"
+
+
+def test_alias_lookup_expired(facts_mgr):
+    index = DistributionIndexCache(alias_ttl=60)
+    index.set_aliases({"www.example.com": "E9"})
+    index.aliases_updated -= 120
+
+    assert DistributionAliasLookup(facts_mgr, index).lookup(["www.example.com"]) == "E1"
+    facts_mgr.get_distribution.assert_not_called()
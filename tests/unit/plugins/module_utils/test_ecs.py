@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: Contributors to the Ansible project
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+import json
+
+import pytest
+
+from ansible_collections.community.aws.plugins.module_utils.ecs import TaskDefinitionCache
+from ansible_collections.community.aws.plugins.module_utils.ecs import task_definition_family
+from ansible_collections.community.aws.plugins.module_utils.ecs import task_definition_revision
+
+ARN = "arn:aws:ecs:us-east-1:123456789012:task-definition/web-worker:42"
+
+
+def test_task_definition_arn():
+    assert task_definition_family(ARN) == "web-worker"
+    assert task_definition_revision(ARN) == 42
+
+
+def test_fingerprint():
+    assert TaskDefinitionCache.fingerprint(family="web", containers=[{"name": "app", "memory": 128}]) == (
+        TaskDefinitionCache.fingerprint(containers=[{"memory": 128, "name": "app"}], family="web")
+    )
+    assert TaskDefinitionCache.fingerprint(family="web") != TaskDefinitionCache.fingerprint(family="web-worker")
+    assert TaskDefinitionCache.fingerprint(account_id="123456789012", region="us-east-1", family="web") != (
+        TaskDefinitionCache.fingerprint(account_id="210987654321", region="us-east-1", family="web")
+    )
+
+
+@pytest.mark.parametrize(
+    "contents",
+    [
+        None,
+        "{not json",
+        json.dumps({"version": 0, "task_definitions": {"a": ARN}}),
+        # entries from before the account ID was part of the fingerprint
+        json.dumps({"version": 1, "task_definitions": {"a": ARN}}),
+    ],
+)
+def test_task_definition_cache_empty(tmp_path, contents):
+    path = tmp_path / "ecs.json"
+    if contents is not None:
+        path.write_text(contents)
+    cache = TaskDefinitionCache(str(path))
+    cache.load()
+    assert cache.get("a") is None
+
+
+def test_task_definition_cache(tmp_path):
+    path = tmp_path / "cache" / "ecs.json"
+
+    cache = TaskDefinitionCache(str(path))
+    cache.load()
+    cache.set("a", ARN)
+    cache.set("b", ARN)
+    cache.save()
+
+    cache = TaskDefinitionCache(str(path))
+    cache.load()
+    assert cache.get("a") == ARN
+    cache.discard("b")
+    cache.save()
+    assert json.loads(path.read_text()) == {"version": 2, "task_definitions": {"a": ARN}}
@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: Contributors to the Ansible project
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+import base64
+import hashlib
+
+import pytest
+
+from ansible_collections.community.aws.plugins.module_utils.etag import HAS_AWSCRT
+from ansible_collections.community.aws.plugins.module_utils.etag import MiB
+from ansible_collections.community.aws.plugins.module_utils.etag import calculate_multipart_checksums
+from ansible_collections.community.aws.plugins.module_utils.etag import calculate_multipart_etag
+from ansible_collections.community.aws.plugins.module_utils.etag import calculate_multipart_etags
+from ansible_collections.community.aws.plugins.module_utils.etag import candidate_chunk_sizes
+from ansible_collections.community.aws.plugins.module_utils.etag import select_etag
+
+CHUNK_SIZE = 1024
+
+
+def reference_etag(data, chunk_size):
+    md5s = [hashlib.md5(data[i:i + chunk_size]) for i in range(0, len(data), chunk_size)]  # fmt:skip
+    if len(md5s) == 1:
+        return f'"{md5s[0].hexdigest()}"'
+    return f'"{hashlib.md5(b"".join(m.digest() for m in md5s)).hexdigest()}-{len(md5s)}"'
+
+
+@pytest.mark.parametrize("size", [0, 1, CHUNK_SIZE - 1, CHUNK_SIZE, CHUNK_SIZE + 1, 5 * CHUNK_SIZE, 7 * CHUNK_SIZE + 3])
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_calculate_multipart_etag(tmp_path, size, max_workers):
+    data = bytes(range(256)) * (size // 256) + bytes(range(size % 256))
+    source = tmp_path / "source"
+    source.write_bytes(data)
+
+    etag = calculate_multipart_etag(str(source), CHUNK_SIZE, max_workers=max_workers, parallel_threshold=0)
+
+    assert etag == reference_etag(data, CHUNK_SIZE)
+
+
+@pytest.mark.parametrize(
+    "etag, size, expected",
+    [
+        ('"d41d8cd98f00b204e9800998ecf8427e"', 100, [100]),
+        # the preferred part size is listed first, followed by common part sizes and the smallest whole MiB
+        ('"d41d8cd98f00b204e9800998ecf8427e-3"', 20 * MiB + 1, [8 * MiB, 10 * MiB, 7 * MiB]),
+        ('"d41d8cd98f00b204e9800998ecf8427e-2"', 20 * MiB + 1, [15 * MiB, 16 * MiB, 11 * MiB]),
+        ('"d41d8cd98f00b204e9800998ecf8427e-4"', 20 * MiB + 1, [6 * MiB]),
+    ],
+)
+def test_candidate_chunk_sizes(etag, size, expected):
+    assert candidate_chunk_sizes(etag, size, chunk_size=8 * MiB) == expected
+
+
+def test_calculate_multipart_etags(tmp_path):
+    data = bytes(range(256)) * 40 + b"tail"
+    source = tmp_path / "source"
+    source.write_bytes(data)
+    chunk_sizes = [1000, CHUNK_SIZE, 3 * CHUNK_SIZE, len(data)]
+
+    etags = calculate_multipart_etags(str(source), chunk_sizes, block_size=700)
+
+    assert etags == {chunk_size: reference_etag(data, chunk_size) for chunk_size in chunk_sizes}
+
+
+def test_select_etag(tmp_path):
+    data = b"x" * (5 * CHUNK_SIZE)
+    source = tmp_path / "source"
+    source.write_bytes(data)
+    remote_etag = reference_etag(data, 2 * CHUNK_SIZE)
+    etags = calculate_multipart_etags(str(source), [CHUNK_SIZE, 2 * CHUNK_SIZE, 4 * CHUNK_SIZE])
+
+    assert select_etag(etags, [CHUNK_SIZE, 2 * CHUNK_SIZE], remote_etag) == remote_etag
+    assert select_etag(etags, [CHUNK_SIZE, 4 * CHUNK_SIZE], remote_etag) == reference_etag(data, CHUNK_SIZE)
+
+
+@pytest.mark.parametrize("composite", [True, False])
+def test_calculate_multipart_checksums_sha256(tmp_path, composite):
+    data = b"x" * (3 * CHUNK_SIZE + 5)
+    source = tmp_path / "source"
+    source.write_bytes(data)
+
+    checksums = calculate_multipart_checksums(str(source), [CHUNK_SIZE], "sha256", composite=composite)
+
+    if composite:
+        digests = b"".join(hashlib.sha256(data[i:i + CHUNK_SIZE]).digest() for i in range(0, len(data), CHUNK_SIZE))  # fmt:skip
+        expected = f"{base64.b64encode(hashlib.sha256(digests).digest()).decode()}-4"
+    else:
+        expected = base64.b64encode(hashlib.sha256(data).digest()).decode()
+    assert checksums == {CHUNK_SIZE: expected}
+
+
+@pytest.mark.skipif(not HAS_AWSCRT, reason="test requires awscrt")
+def test_calculate_multipart_checksums_crc32c(tmp_path):
+    source = tmp_path / "source"
+    source.write_bytes(b"123456789")
+
+    # The standard CRC32C check value for "123456789"
+    expected = base64.b64encode((0xE3069283).to_bytes(4, byteorder="big")).decode()
+    assert calculate_multipart_checksums(str(source), [CHUNK_SIZE], "crc32c", composite=False) == {CHUNK_SIZE: expected}
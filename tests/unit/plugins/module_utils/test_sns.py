@@ -0,0 +1,218 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: Contributors to the Ansible project
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from unittest.mock import MagicMock
+
+import pytest
+
+try:
+    import botocore
+except ImportError:
+    # Handled by HAS_BOTO3
+    pass
+
+from ansible_collections.amazon.aws.plugins.module_utils.botocore import HAS_BOTO3
+
+from ansible_collections.community.aws.plugins.module_utils import sns
+
+if not HAS_BOTO3:
+    pytestmark = pytest.mark.skip("test_sns.py requires the python modules 'boto3' and 'botocore'")
+
+TOPIC_ARN = "arn:aws:sns:us-east-1:123456789012:my-topic"
+ACCOUNT_ID = "123456789012"
+
+
+def make_clienterror_exception(code="AuthorizationError"):
+    return botocore.exceptions.ClientError(
+        {
+            "Error": {"Code": code, "Message": "Not authorized"},
+            "ResponseMetadata": {"RequestId": "01234567-89ab-cdef-0123-456789abcdef"},
+        },
+        "GetTopicAttributes",
+    )
+
+
+@pytest.fixture(name="module")
+def fixture_module():
+    module = MagicMock()
+    module.params = {"state": "present"}
+    return module
+
+
+@pytest.fixture(name="client")
+def fixture_client():
+    client = MagicMock()
+    client.meta.region_name = "us-east-1"
+    client.get_topic_attributes.return_value = {"Attributes": {"TopicArn": TOPIC_ARN}}
+    client.get_paginator.return_value.paginate.return_value = [
+        {"Topics": [{"TopicArn": "arn:aws:sns:us-east-1:123456789012:other"}]},
+        {"Topics": [{"TopicArn": TOPIC_ARN}]},
+        {"Topics": [{"TopicArn": "arn:aws:sns:us-east-1:123456789012:another"}]},
+    ]
+    return client
+
+
+def test_topic_arn_lookup(client, module):
+    assert sns.topic_arn_lookup(client, module, "my-topic", ACCOUNT_ID, "aws") == TOPIC_ARN
+    client.get_topic_attributes.assert_called_once_with(TopicArn=TOPIC_ARN)
+    client.get_paginator.assert_not_called()
+
+
+def test_topic_arn_lookup_not_found(client, module):
+    client.get_topic_attributes.side_effect = make_clienterror_exception("NotFound")
+    assert sns.topic_arn_lookup(client, module, "my-topic", ACCOUNT_ID, "aws") is None
+    client.get_paginator.assert_not_called()
+
+
+def test_topic_arn_lookup_falls_back_to_listing(client, module):
+    client.get_topic_attributes.side_effect = make_clienterror_exception()
+    pages = iter(client.get_paginator.return_value.paginate.return_value)
+    client.get_paginator.return_value.paginate.return_value = pages
+
+    assert sns.topic_arn_lookup(client, module, "my-topic", ACCOUNT_ID, "aws") == TOPIC_ARN
+    # we stop listing once the topic's found
+    assert next(pages)["Topics"][0]["TopicArn"].endswith(":another")
+
+
+@pytest.mark.parametrize(
+    "topic_arn,expected",
+    [
+        (TOPIC_ARN, True),
+        # third party topic
+        ("arn:aws:sns:us-east-1:210987654321:my-topic", False),
+        # topic in another region
+        ("arn:aws:sns:us-west-2:123456789012:my-topic", False),
+        (None, False),
+    ],
+)
+def test_topic_exists(client, module, topic_arn, expected):
+    assert sns.topic_exists(client, module, topic_arn, ACCOUNT_ID) is expected
+    client.get_paginator.assert_not_called()
+
+
+def test_topic_exists_without_account(client, module):
+    assert sns.topic_exists(client, module, TOPIC_ARN) is True
+    assert sns.topic_exists(client, module, "arn:aws:sns:us-east-1:210987654321:my-topic") is False
+    client.get_topic_attributes.assert_not_called()
+
+
+def test_topic_arn_lookup_without_account(client, module):
+    assert sns.topic_arn_lookup(client, module, "my-topic") == TOPIC_ARN
+    client.get_topic_attributes.assert_not_called()
+
+
+def test_get_info(client, module):
+    client.get_topic_attributes.return_value = {"Attributes": {"TopicArn": TOPIC_ARN, "EffectiveDeliveryPolicy": "{}"}}
+    client.get_paginator.return_value.paginate.return_value = MagicMock()
+    client.get_paginator.return_value.paginate.return_value.build_full_result.return_value = {"Subscriptions": []}
+    client.list_tags_for_resource.return_value = {"Tags": []}
+
+    info = sns.get_info(client, module, TOPIC_ARN, ACCOUNT_ID)
+
+    assert info["topic_arn"] == TOPIC_ARN
+    assert info["delivery_policy"] == "{}"
+    # the attributes fetched to check the topic exists are reused
+    client.get_topic_attributes.assert_called_once_with(TopicArn=TOPIC_ARN)
+
+
+def test_get_info_attributes_denied(client, module):
+    # without the account ID the topic is found by listing, the attributes are then fetched separately
+    client.get_topic_attributes.side_effect = make_clienterror_exception()
+    module.fail_json_aws.side_effect = SystemExit(1)
+
+    with pytest.raises(SystemExit):
+        sns.get_info(client, module, TOPIC_ARN)
+    assert module.fail_json_aws.call_args.kwargs["msg"] == f"Couldn't get topic attributes for topic {TOPIC_ARN}"
+
+
+def test_get_account_info(module):
+    sts_client = module.client.return_value
+    sts_client.get_caller_identity.return_value = {
+        "Account": ACCOUNT_ID,
+        "Arn": f"arn:aws-us-gov:iam::{ACCOUNT_ID}:user/ansible",
+    }
+
+    assert sns.get_account_info(module) == (ACCOUNT_ID, "aws-us-gov")
+
+
+def test_get_account_info_denied(module):
+    module.client.return_value.get_caller_identity.side_effect = make_clienterror_exception("AccessDenied")
+
+    assert sns.get_account_info(module) == (None, None)
+    module.fail_json_aws.assert_not_called()
+
+
+def test_describe_topic(client):
+    client.get_topic_attributes.return_value = {
+        "Attributes": {"TopicArn": TOPIC_ARN, "EffectiveDeliveryPolicy": "{}", "DisplayName": "My Topic"}
+    }
+    client.get_paginator.return_value.paginate.return_value = MagicMock()
+    client.get_paginator.return_value.paginate.return_value.build_full_result.return_value = {
+        "Subscriptions": [{"Protocol": "sqs", "Endpoint": "arn:aws:sqs:us-east-1:123456789012:queue"}]
+    }
+    client.list_tags_for_resource.return_value = {"Tags": [{"Key": "Env", "Value": "prod"}]}
+
+    assert sns.describe_topic(client, TOPIC_ARN) == (
+        {
+            "topic_arn": TOPIC_ARN,
+            "display_name": "My Topic",
+            "delivery_policy": "{}",
+            "subscriptions": [{"protocol": "sqs", "endpoint": "arn:aws:sqs:us-east-1:123456789012:queue"}],
+            "tags": {"Env": "prod"},
+        },
+        [],
+    )
+    client.get_paginator.assert_called_once_with("list_subscriptions_by_topic")
+
+    # the tags aren't retrieved again if we already have them
+    client.list_tags_for_resource.reset_mock()
+    assert sns.describe_topic(client, TOPIC_ARN, tags={})[0]["tags"] == {}
+    client.list_tags_for_resource.assert_not_called()
+
+
+def test_describe_topic_access_denied(client):
+    client.get_topic_attributes.return_value = {"Attributes": {"TopicArn": TOPIC_ARN}}
+    client.get_paginator.return_value.paginate.side_effect = make_clienterror_exception()
+    client.list_tags_for_resource.side_effect = make_clienterror_exception()
+
+    info, warnings = sns.describe_topic(client, TOPIC_ARN)
+
+    assert info["subscriptions"] == []
+    assert info["tags"] == {}
+    assert warnings == [
+        f"Permission denied accessing subscriptions of topic {TOPIC_ARN}",
+        f"Permission denied accessing tags of topic {TOPIC_ARN}",
+    ]
+    # the subscriptions of the account are listed as a fallback
+    assert [c.args[0] for c in client.get_paginator.call_args_list] == [
+        "list_subscriptions_by_topic",
+        "list_subscriptions",
+    ]
+
+
+def test_describe_topic_subscriptions_fallback(client):
+    client.get_topic_attributes.return_value = {"Attributes": {"TopicArn": TOPIC_ARN}}
+    client.list_tags_for_resource.return_value = {"Tags": []}
+    subscriptions = {
+        "Subscriptions": [
+            {"TopicArn": TOPIC_ARN, "Protocol": "sqs"},
+            {"TopicArn": "arn:aws:sns:us-east-1:123456789012:other", "Protocol": "sqs"},
+        ]
+    }
+
+    def get_paginator(name):
+        paginator = MagicMock()
+        if name == "list_subscriptions_by_topic":
+            paginator.paginate.side_effect = make_clienterror_exception()
+        else:
+            paginator.paginate.return_value.build_full_result.return_value = subscriptions
+        return paginator
+
+    client.get_paginator.side_effect = get_paginator
+
+    info, warnings = sns.describe_topic(client, TOPIC_ARN)
+
+    assert info["subscriptions"] == [{"topic_arn": TOPIC_ARN, "protocol": "sqs"}]
+    assert warnings == []
@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: Contributors to the Ansible project
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from ansible_collections.community.aws.plugins.modules import cloudfront_distribution_info
+
+
+def make_distribution(distribution_id, aliases):
+    return {"Id": distribution_id, "Aliases": {"Quantity": len(aliases), "Items": aliases}}
+
+
+@pytest.fixture(name="module")
+def fixture_module():
+    module = MagicMock()
+    module.params = {"distribution_cache_path": None, "distribution_cache_ttl": 3600}
+    return module
+
+
+@pytest.fixture(name="service_mgr")
+def fixture_service_mgr():
+    service_mgr = MagicMock()
+    service_mgr.list_distributions.return_value = [make_distribution("E1", ["www.example.com"])]
+    service_mgr.list_streaming_distributions.return_value = [make_distribution("S1", ["Stream.example.com"])]
+    return service_mgr
+
+
+def test_get_distribution_id_from_alias(module, service_mgr):
+    distribution_id = cloudfront_distribution_info.get_distribution_id_from_alias(
+        module, service_mgr, "www.example.com"
+    )
+
+    assert distribution_id == "E1"
+    service_mgr.list_distributions.assert_called_once_with(keyed=False)
+    service_mgr.list_streaming_distributions.assert_not_called()
+
+
+@pytest.mark.parametrize("alias, expected", [("stream.example.com", "S1"), ("missing.example.com", None)])
+def test_get_distribution_id_from_alias_streaming(module, service_mgr, alias, expected):
+    distribution_id = cloudfront_distribution_info.get_distribution_id_from_alias(module, service_mgr, alias)
+
+    assert distribution_id == expected
+    # the web distributions have already been listed in full, only the streaming distributions are added
+    service_mgr.list_distributions.assert_called_once_with(keyed=False)
+    service_mgr.list_streaming_distributions.assert_called_once_with(keyed=False)
+    service_mgr.get_distribution_id_from_domain_name.assert_not_called()
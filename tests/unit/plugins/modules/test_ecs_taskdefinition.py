@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: Contributors to the Ansible project
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from unittest.mock import MagicMock
+
+import pytest
+from botocore.exceptions import ClientError
+
+from ansible_collections.community.aws.plugins.modules.ecs_taskdefinition import EcsTaskManager
+
+PREFIX = "arn:aws:ecs:us-east-1:123456789012:task-definition/"
+
+
+def make_arns(family, revisions):
+    return [f"{PREFIX}{family}:{revision}" for revision in revisions]
+
+
+@pytest.fixture(name="ecs")
+def fixture_ecs():
+    ecs = MagicMock()
+    pages = {
+        "ACTIVE": [
+            {"taskDefinitionArns": make_arns("web-worker", [3, 2, 1]) + make_arns("web", [30, 29]), "nextToken": "t"},
+            {"taskDefinitionArns": make_arns("web", range(28, 0, -1))},
+        ],
+        "INACTIVE": [{"taskDefinitionArns": make_arns("web", [31])}],
+    }
+
+    def list_task_definitions(aws_retry, familyPrefix, status, sort, nextToken=None):
+        return pages[status][1 if nextToken else 0]
+
+    ecs.list_task_definitions.side_effect = list_task_definitions
+    ecs.describe_task_definition.side_effect = lambda aws_retry, taskDefinition: {
+        "taskDefinition": {"taskDefinitionArn": taskDefinition, "revision": int(taskDefinition.rsplit(":", 1)[1])}
+    }
+    ecs.delete_task_definitions.return_value = {"failures": []}
+    return ecs
+
+
+@pytest.fixture(name="task_mgr")
+def fixture_task_mgr(ecs):
+    module = MagicMock()
+    module.client.return_value = ecs
+    return EcsTaskManager(module, max_concurrency=4)
+
+
+def test_list_task_definition_arns(task_mgr, ecs):
+    arns = task_mgr.list_task_definition_arns("web")
+    assert next(arns) == f"{PREFIX}web:30"
+    # the next page isn't fetched until it's needed
+    assert ecs.list_task_definitions.call_count == 1
+    assert task_mgr.get_latest_revision("web") == 30
+    assert task_mgr.get_latest_revision("api") is None
+
+
+def test_find_task_definition(task_mgr, ecs):
+    assert task_mgr.find_task_definition("web", lambda td: td["revision"] == 30)["revision"] == 30
+    assert ecs.describe_task_definition.call_count == 1
+
+    ecs.describe_task_definition.reset_mock()
+    assert task_mgr.find_task_definition("web", lambda td: td["revision"] in (26, 22))["revision"] == 26
+    # the newest revision on its own, then a batch of max_concurrency
+    assert ecs.describe_task_definition.call_count == 5
+
+    assert task_mgr.find_task_definition("web", lambda td: False) is None
+
+
+def test_cleanup_revisions(task_mgr, ecs):
+    def deregister_task_definition(aws_retry, taskDefinition):
+        if taskDefinition.endswith(":10"):
+            raise ClientError({"Error": {"Code": "ServerException"}}, "DeregisterTaskDefinition")
+        return {"taskDefinition": {}}
+
+    ecs.deregister_task_definition.side_effect = deregister_task_definition
+
+    summary, failed = task_mgr.cleanup_revisions("web", 5, delete=True)
+
+    assert ecs.deregister_task_definition.call_count == 25
+    assert {k: v for k, v in summary.items() if k != "elapsed"} == dict(kept=5, deregistered=24, deleted=25, failed=1)
+    assert [f["arn"] for f in failed] == [f"{PREFIX}web:10"]
+    deleted = [arn for c in ecs.delete_task_definitions.call_args_list for arn in c.kwargs["taskDefinitions"]]
+    assert len(deleted) == 25 and f"{PREFIX}web:31" in deleted
+    assert max(len(c.kwargs["taskDefinitions"]) for c in ecs.delete_task_definitions.call_args_list) == 10
+
+
+def test_cleanup_revisions_check_mode(task_mgr, ecs):
+    summary, failed = task_mgr.cleanup_revisions("web", 5, check_mode=True)
+    assert (summary["deregistered"], summary["deleted"], failed) == (25, 0, [])
+    ecs.deregister_task_definition.assert_not_called()
+    ecs.delete_task_definitions.assert_not_called()
+
+
+def test_find_task_definition_not_found(task_mgr, ecs):
+    ecs.describe_task_definition.side_effect = ClientError(
+        {"Error": {"Code": "ClientException", "Message": "Unable to describe task definition."}},
+        "DescribeTaskDefinition",
+    )
+    assert task_mgr.find_task_definition("web", lambda td: True) is None
+    task_mgr.module.fail_json_aws.assert_not_called()
+
+
+def test_find_task_definition_throttled(task_mgr, ecs):
+    ecs.describe_task_definition.side_effect = ClientError(
+        {"Error": {"Code": "ThrottlingException", "Message": "Rate exceeded"}}, "DescribeTaskDefinition"
+    )
+    task_mgr.module.fail_json_aws.side_effect = SystemExit(1)
+
+    # failing to describe a revision mustn't be mistaken for there being no matching revision
+    with pytest.raises(SystemExit):
+        task_mgr.find_task_definition("web", lambda td: True)
+    task_mgr.module.fail_json_aws.assert_called_once()
+    ecs.register_task_definition.assert_not_called()
@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: Contributors to the Ansible project
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+import time
+from unittest.mock import MagicMock
+from unittest.mock import patch
+
+import pytest
+
+from ansible_collections.community.aws.plugins.modules import efs_info
+
+module_name = "ansible_collections.community.aws.plugins.modules.efs_info"
+
+
+class ExitJson(Exception):
+    pass
+
+
+def make_file_system(index):
+    return {
+        "FileSystemId": f"fs-{index}",
+        "CreationToken": f"token-{index}",
+        "CreationTime": "2024-01-01 00:00:00",
+        "LifeCycleState": "available",
+        "SizeInBytes": {"Value": 6144},
+        "Tags": [{"Key": "Name", "Value": f"fs-{index}"}],
+    }
+
+
+@pytest.fixture(name="client")
+def fixture_client():
+    client = MagicMock()
+
+    def paginate(FileSystemId=None, **kwargs):
+        paginator = MagicMock()
+        if FileSystemId is None:
+            paginator.build_full_result.return_value = {"FileSystems": [make_file_system(i) for i in range(8)]}
+        else:
+            # finish out of order
+            time.sleep((8 - int(FileSystemId.rsplit("-", 1)[1])) / 1000)
+            paginator.build_full_result.return_value = {
+                "MountTargets": [
+                    {
+                        "FileSystemId": FileSystemId,
+                        "MountTargetId": f"fsmt-{FileSystemId}-{i}",
+                        "SubnetId": f"subnet-{i}",
+                        "LifeCycleState": "available",
+                    }
+                    for i in range(2)
+                ]
+            }
+        return paginator
+
+    client.get_paginator.return_value.paginate.side_effect = paginate
+    client.describe_mount_target_security_groups.side_effect = lambda MountTargetId: {
+        "SecurityGroups": [f"sg-{MountTargetId}"]
+    }
+    return client
+
+
+@pytest.fixture(name="module")
+def fixture_module(client):
+    module = MagicMock()
+    module.region = "us-east-1"
+    module.params = dict(
+        id=None,
+        name=None,
+        tags={},
+        targets=[],
+        include_mount_targets=True,
+        include_security_groups=True,
+        max_concurrency=4,
+    )
+    module.client.return_value = client
+    module.fail_json.side_effect = SystemExit(1)
+    module.fail_json_aws.side_effect = SystemExit(1)
+    module.exit_json.side_effect = ExitJson
+    return module
+
+
+def run_module(module):
+    with patch(module_name + ".AnsibleAWSModule", return_value=module):
+        with pytest.raises(ExitJson):
+            efs_info.main()
+    return module.exit_json.call_args.kwargs["efs"]
+
+
+def test_efs_info(module, client):
+    file_systems = run_module(module)
+
+    assert [fs["file_system_id"] for fs in file_systems] == [f"fs-{i}" for i in range(8)]
+    for fs in file_systems:
+        assert [mt["file_system_id"] for mt in fs["mount_targets"]] == [fs["file_system_id"]] * 2
+        assert [mt["security_groups"] for mt in fs["mount_targets"]] == [
+            [f"sg-{mt['mount_target_id']}"] for mt in fs["mount_targets"]
+        ]
+        # the tags are returned by DescribeFileSystems
+        assert fs["tags"] == {"Name": fs["file_system_id"]}
+    client.list_tags_for_resource.assert_not_called()
+    assert "describe_tags" not in [c.args[0] for c in client.get_paginator.call_args_list]
+
+
+def test_efs_info_without_security_groups(module, client):
+    module.params["include_security_groups"] = False
+    file_systems = run_module(module)
+
+    assert all("security_groups" not in mt for fs in file_systems for mt in fs["mount_targets"])
+    client.describe_mount_target_security_groups.assert_not_called()
+
+
+def test_efs_info_without_mount_targets(module, client):
+    module.params["include_mount_targets"] = False
+    file_systems = run_module(module)
+
+    assert all("mount_targets" not in fs for fs in file_systems)
+    assert [c.args[0] for c in client.get_paginator.call_args_list] == ["describe_file_systems"]
+    client.describe_mount_target_security_groups.assert_not_called()
+
+
+def test_efs_info_max_concurrency(module, client):
+    module.params["max_concurrency"] = 0
+    with patch(module_name + ".AnsibleAWSModule", return_value=module):
+        with pytest.raises(SystemExit):
+            efs_info.main()
+    assert "max_concurrency" in module.fail_json.call_args.kwargs["msg"]
+    client.get_paginator.assert_not_called()
@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: Contributors to the Ansible project
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from unittest.mock import MagicMock
+from unittest.mock import patch
+
+import pytest
+from botocore.exceptions import ClientError
+
+from ansible_collections.community.aws.plugins.modules.elasticache_info import get_elasticache_clusters
+
+module_name = "ansible_collections.community.aws.plugins.modules.elasticache_info"
+
+
+def make_cluster(cluster_id, replication_group_id=None, status=None):
+    cluster = {"CacheClusterId": cluster_id}
+    if status:
+        cluster["CacheClusterStatus"] = status
+    if replication_group_id:
+        cluster["ReplicationGroupId"] = replication_group_id
+    return cluster
+
+
+@pytest.fixture(name="module")
+def fixture_module():
+    module = MagicMock()
+    module.region = "us-east-1"
+    module.params = {"name": None, "include_tags": True, "include_replication_group": True, "max_concurrency": 4}
+    return module
+
+
+@pytest.fixture(name="client")
+def fixture_client():
+    client = MagicMock()
+    client.get_paginator.return_value.paginate.return_value.build_full_result.return_value = {
+        "ReplicationGroups": [{"ReplicationGroupId": "rg-1"}, {"ReplicationGroupId": "rg-2"}],
+    }
+
+    def list_tags_for_resource(ResourceName):
+        if ResourceName.endswith(":deleted"):
+            raise ClientError({"Error": {"Code": "CacheClusterNotFound"}}, "ListTagsForResource")
+        return {"TagList": [{"Key": "Name", "Value": ResourceName.rsplit(":", 1)[-1]}]}
+
+    client.list_tags_for_resource.side_effect = list_tags_for_resource
+    return client
+
+
+@patch(module_name + ".get_aws_account_info", MagicMock(return_value=("123456789012", "aws")))
+@patch(module_name + ".describe_cache_clusters_with_backoff")
+def test_get_elasticache_clusters(m_describe_cache_clusters, client, module):
+    m_describe_cache_clusters.return_value = [
+        make_cluster("node-1", "rg-1"),
+        make_cluster("node-2", "rg-1"),
+        make_cluster("deleted", "rg-2"),
+        make_cluster("node-3", "rg-2"),
+        make_cluster("memcached"),
+        make_cluster("deleting", status="deleting"),
+    ]
+
+    clusters = get_elasticache_clusters(client, module)
+
+    assert [c["cache_cluster_id"] for c in clusters] == ["node-1", "node-2", "node-3", "memcached"]
+    assert [c["tags"]["Name"] for c in clusters] == ["node-1", "node-2", "node-3", "memcached"]
+    assert [c.get("replication_group", {}).get("replication_group_id") for c in clusters] == [
+        "rg-1",
+        "rg-1",
+        "rg-2",
+        None,
+    ]
+    # the replication groups are listed once rather than described for each node
+    client.get_paginator.return_value.paginate.assert_called_once_with()
+    client.list_tags_for_resource.assert_any_call(
+        ResourceName="arn:aws:elasticache:us-east-1:123456789012:cluster:node-1"
+    )
+
+
+@patch(module_name + ".get_aws_account_info")
+@patch(module_name + ".describe_cache_clusters_with_backoff")
+def test_get_elasticache_clusters_without_details(m_describe_cache_clusters, m_get_aws_account_info, client, module):
+    m_describe_cache_clusters.return_value = [
+        make_cluster("node-1", "rg-1"),
+        make_cluster("node-2", "rg-1", status="deleting"),
+    ]
+    module.params.update(include_tags=False, include_replication_group=False)
+
+    assert get_elasticache_clusters(client, module) == [{"cache_cluster_id": "node-1", "replication_group_id": "rg-1"}]
+    client.list_tags_for_resource.assert_not_called()
+    client.get_paginator.assert_not_called()
+    m_get_aws_account_info.assert_not_called()
@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: Contributors to the Ansible project
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from unittest.mock import MagicMock
+
+from ansible_collections.community.aws.plugins.modules.elb_target_info import TargetInfoGatherer
+
+
+def make_target_group(name, target_type="instance", vpc_id="vpc-1", load_balancers=1):
+    target_group = {
+        "TargetGroupArn": f"arn:aws:elasticloadbalancing:us-east-1:123456789012:targetgroup/{name}/0123456789abcdef",
+        "TargetType": target_type,
+        "LoadBalancerArns": ["arn:lb"] * load_balancers,
+    }
+    if vpc_id:
+        target_group["VpcId"] = vpc_id
+    return target_group
+
+
+def make_instance(instance_id, ip, vpc_id="vpc-1"):
+    return {
+        "InstanceId": instance_id,
+        "VpcId": vpc_id,
+        "PrivateIpAddress": ip,
+        "NetworkInterfaces": [{"PrivateIpAddress": ip, "PrivateIpAddresses": [{"PrivateIpAddress": ip}]}],
+    }
+
+
+def test_target_info_gatherer():
+    module = MagicMock()
+    ec2 = MagicMock()
+    elbv2 = MagicMock()
+    module.client.side_effect = lambda service, **kwargs: ec2 if service == "ec2" else elbv2
+
+    ec2.describe_instances.return_value = {
+        "Reservations": [{"Instances": [make_instance("i-1", "10.0.0.1"), make_instance("i-2", "10.0.0.2")]}]
+    }
+    elbv2.get_paginator.return_value.paginate.return_value.build_full_result.return_value = {
+        "TargetGroups": [
+            make_target_group("web"),
+            make_target_group("ip", target_type="ip", vpc_id="vpc-2"),
+            make_target_group("other-vpc", vpc_id="vpc-2"),
+            make_target_group("lambda", target_type="lambda", vpc_id=None),
+            make_target_group("unused", load_balancers=0),
+        ]
+    }
+    targets = {
+        "web": [{"Id": "i-1", "Port": 80}, {"Id": "i-1", "Port": 8080}, {"Id": "i-3", "Port": 80}],
+        "ip": [{"Id": "10.0.0.2", "Port": 443, "AvailabilityZone": "all"}],
+    }
+    elbv2.describe_target_health.side_effect = lambda TargetGroupArn, aws_retry: {
+        "TargetHealthDescriptions": [
+            {"Target": target, "TargetHealth": {"State": "healthy"}} for target in targets[TargetGroupArn.split("/")[1]]
+        ]
+    }
+
+    gatherer = TargetInfoGatherer(module, ["i-1", "i-2"], False, max_concurrency=2)
+
+    # only the target groups which could contain the instances are described
+    described = sorted(c.kwargs["TargetGroupArn"].split("/")[1] for c in elbv2.describe_target_health.call_args_list)
+    assert described == ["ip", "web"]
+
+    tgs = {instance_id: [tg.to_dict() for tg in tgs] for instance_id, tgs in gatherer.tgs_by_instance.items()}
+    assert [tg["target_group_type"] for tg in tgs["i-1"]] == ["instance"]
+    assert [(t["target_id"], t["target_port"]) for t in tgs["i-1"][0]["targets"]] == [("i-1", 80), ("i-1", 8080)]
+    assert [tg["target_group_type"] for tg in tgs["i-2"]] == ["ip"]
+    assert tgs["i-2"][0]["targets"][0]["target_az"] == "all"
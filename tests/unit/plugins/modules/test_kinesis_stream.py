@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: Contributors to the Ansible project
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from ansible_collections.amazon.aws.plugins.module_utils.botocore import HAS_BOTO3
+
+from ansible_collections.community.aws.plugins.modules import kinesis_stream
+
+if not HAS_BOTO3:
+    pytestmark = pytest.mark.skip("test_kinesis_stream.py requires the python modules 'boto3' and 'botocore'")
+
+
+def make_shard(shard_id, closed=False):
+    sequence_range = {"StartingSequenceNumber": "1"}
+    if closed:
+        sequence_range["EndingSequenceNumber"] = "2"
+    return {"ShardId": shard_id, "SequenceNumberRange": sequence_range}
+
+
+@pytest.fixture(name="client")
+def fixture_client():
+    client = MagicMock()
+    client.describe_stream_summary.return_value = {
+        "StreamDescriptionSummary": {
+            "StreamName": "test-stream",
+            "StreamStatus": "ACTIVE",
+            "OpenShardCount": 2,
+            "ConsumerCount": 0,
+        }
+    }
+    client.list_shards.side_effect = [
+        {"Shards": [make_shard("shard-0", closed=True), make_shard("shard-1")], "NextToken": "token"},
+        {"Shards": [make_shard("shard-2")]},
+    ]
+    return client
+
+
+def test_find_stream_without_shards(client):
+    success, err_msg, stream = kinesis_stream.find_stream(client, "test-stream", shards=False)
+    assert success
+    assert stream["StreamStatus"] == "ACTIVE"
+    assert stream["OpenShardsCount"] == 2
+    assert "Shards" not in stream
+    client.list_shards.assert_not_called()
+
+
+def test_find_stream_with_shards(client):
+    success, err_msg, stream = kinesis_stream.find_stream(client, "test-stream")
+    assert success
+    assert [shard["ShardId"] for shard in stream["Shards"]] == ["shard-0", "shard-1", "shard-2"]
+    assert stream["OpenShardsCount"] == 2
+    assert stream["ClosedShardsCount"] == 1
+    assert stream["ShardsCount"] == 3
+    # only the keys returned by DescribeStream
+    assert "OpenShardCount" not in stream
+    assert "ConsumerCount" not in stream
+    assert client.list_shards.call_args_list[0].kwargs == {"StreamName": "test-stream"}
+    # StreamName can't be combined with NextToken
+    assert client.list_shards.call_args_list[1].kwargs == {"NextToken": "token"}
+
+
+@pytest.mark.parametrize(
+    "current_shards,target_shards,expected",
+    [
+        (10, 10, []),
+        (10, 15, [15]),
+        (10, 100, [20, 40, 80, 100]),
+        (100, 10, [50, 25, 13, 10]),
+        # we can't go below half the open shards
+        (5, 2, [3, 2]),
+    ],
+)
+def test_plan_shard_scaling(current_shards, target_shards, expected):
+    assert kinesis_stream.plan_shard_scaling(current_shards, target_shards) == expected
+
+
+def test_update_shard_count_check_mode(client):
+    success, err_msg, scaling_steps = kinesis_stream.update_shard_count(
+        client, "test-stream", 5, current_shards=2, check_mode=True
+    )
+    assert success
+    assert scaling_steps == [
+        {"current_shard_count": 2, "target_shard_count": 4, "status": "planned"},
+        {"current_shard_count": 4, "target_shard_count": 5, "status": "planned"},
+    ]
+    client.update_shard_count.assert_not_called()
+
+
+def test_update_shard_count_steps(client, monkeypatch):
+    monkeypatch.setattr(kinesis_stream, "wait_for_status", MagicMock(return_value=(True, "", {})))
+    success, err_msg, scaling_steps = kinesis_stream.update_shard_count(
+        client, "test-stream", 5, current_shards=2, wait=False
+    )
+    assert success
+    assert [call.kwargs["TargetShardCount"] for call in client.update_shard_count.call_args_list] == [4, 5]
+    # without wait we only wait between the steps
+    kinesis_stream.wait_for_status.assert_called_once()
+    assert [step["status"] for step in scaling_steps] == ["completed", "started"]
+
+
+def test_update_shard_count_too_many_steps(client):
+    success, err_msg, scaling_steps = kinesis_stream.update_shard_count(client, "test-stream", 4096, current_shards=1)
+    assert not success
+    assert len(scaling_steps) == 12
+    client.update_shard_count.assert_not_called()
@@ -0,0 +1,359 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: Contributors to the Ansible project
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+import datetime
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+try:
+    import botocore
+    from boto3.s3.transfer import TransferConfig
+except ImportError:
+    # Handled by HAS_BOTO3
+    pass
+
+from ansible_collections.amazon.aws.plugins.module_utils.botocore import HAS_BOTO3
+
+from ansible_collections.community.aws.plugins.modules import s3_sync
+
+if not HAS_BOTO3:
+    pytestmark = pytest.mark.skip("test_s3_sync.py requires the python modules 'boto3' and 'botocore'")
+
+
+def make_clienterror_exception(code="AccessDenied"):
+    return botocore.exceptions.ClientError(
+        {
+            "Error": {"Code": code, "Message": "Access Denied"},
+            "ResponseMetadata": {"RequestId": "01234567-89ab-cdef-0123-456789abcdef"},
+        },
+        "ListObjectsV2",
+    )
+
+
+def _remote_object(key, size, etag='"d41d8cd98f00b204e9800998ecf8427e"'):
+    return {
+        "Key": key,
+        "Size": size,
+        "ETag": etag,
+        "LastModified": datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc),
+    }
+
+
+def _local_file(chopped_path, size, modified_epoch=1600000000, key_prefix="prefix"):
+    return {
+        "fullpath": f"/tmp/root/{chopped_path}",
+        "chopped_path": chopped_path,
+        "modified_epoch": modified_epoch,
+        "bytes": size,
+        "s3_path": f"{key_prefix}/{chopped_path}",
+    }
+
+
+@pytest.fixture(name="s3")
+def fixture_s3():
+    s3 = MagicMock()
+    paginator = MagicMock()
+    paginator.paginate.return_value = [
+        {"Contents": [_remote_object("prefix/a.txt", 10), _remote_object("prefix/b.txt", 20)]},
+        {"Contents": [_remote_object("prefix/stale.txt", 30)]},
+    ]
+    s3.get_paginator.return_value = paginator
+    return s3
+
+
+def test_list_s3_objects(s3):
+    index = s3_sync.list_s3_objects(s3, "bucket", "prefix")
+
+    s3.get_paginator.assert_called_once_with("list_objects_v2")
+    s3.get_paginator.return_value.paginate.assert_called_once_with(Bucket="bucket", Prefix="prefix")
+    assert sorted(index) == ["prefix/a.txt", "prefix/b.txt", "prefix/stale.txt"]
+    assert index["prefix/b.txt"]["ContentLength"] == 20
+
+
+def test_list_s3_objects_denied(s3):
+    s3.get_paginator.return_value.paginate.side_effect = make_clienterror_exception()
+
+    assert s3_sync.list_s3_objects(s3, "bucket", "prefix") is None
+
+
+def test_filter_list_uses_index(s3):
+    index = s3_sync.list_s3_objects(s3, "bucket", "prefix")
+    filelist = [_local_file("a.txt", 10), _local_file("b.txt", 21), _local_file("new.txt", 5)]
+
+    actionable = s3_sync.filter_list(s3, "bucket", filelist, "date_size", s3index=index)
+
+    s3.head_object.assert_not_called()
+    assert [x["chopped_path"] for x in actionable] == ["b.txt", "new.txt"]
+
+
+def test_filter_list_falls_back_to_head(s3):
+    s3.head_object.side_effect = make_clienterror_exception("404")
+    filelist = [_local_file("a.txt", 10)]
+
+    actionable = s3_sync.filter_list(s3, "bucket", filelist, "date_size", s3index=None)
+
+    s3.head_object.assert_called_once_with(Bucket="bucket", Key="prefix/a.txt")
+    assert [x["chopped_path"] for x in actionable] == ["a.txt"]
+
+
+def test_remove_files_reuses_index(s3):
+    index = s3_sync.list_s3_objects(s3, "bucket", "prefix")
+    s3.get_paginator.reset_mock()
+    filelist = [_local_file("a.txt", 10), _local_file("b.txt", 20)]
+
+    s3.delete_objects.return_value = {}
+
+    removed, summary, failed = s3_sync.remove_files(
+        s3, filelist, {"bucket": "bucket", "key_prefix": "prefix"}, s3index=index
+    )
+
+    s3.get_paginator.assert_not_called()
+    assert removed == ["prefix/stale.txt"]
+    assert failed == []
+    assert summary["removed"] == 1
+    assert summary["bytes"] == 30
+    assert summary["batches"] == 1
+    s3.delete_objects.assert_called_once_with(
+        Bucket="bucket", Delete={"Objects": [{"Key": "prefix/stale.txt"}], "Quiet": True}
+    )
+
+
+def test_remove_files_streams_listing(monkeypatch, s3):
+    monkeypatch.setattr(s3_sync, "DELETE_BATCH_SIZE", 2)
+    monkeypatch.setattr(s3_sync, "DELETE_RETRY_DELAY", 0)
+    s3.get_paginator.return_value.paginate.return_value = [
+        {"Contents": [_remote_object(f"prefix/{i}.txt", i) for i in range(3)]},
+        {"Contents": [_remote_object("prefix/keep.txt", 5), _remote_object("prefix/3.txt", 3)]},
+    ]
+    errors = {
+        "prefix/0.txt": [{"Key": "prefix/0.txt", "Code": "SlowDown", "Message": "Please reduce your request rate."}],
+        "prefix/3.txt": [{"Key": "prefix/3.txt", "Code": "AccessDenied", "Message": "Access Denied"}],
+    }
+
+    def delete_objects(Bucket, Delete):
+        keys = [obj["Key"] for obj in Delete["Objects"]]
+        # fail the first attempt for 0.txt, always fail for 3.txt
+        if len(keys) > 1 or keys != ["prefix/0.txt"]:
+            return {"Errors": [e for key in keys for e in errors.get(key, [])]}
+        return {}
+
+    s3.delete_objects.side_effect = delete_objects
+    params = {"bucket": "bucket", "key_prefix": "prefix", "max_concurrency": 2}
+
+    removed, summary, failed = s3_sync.remove_files(s3, [_local_file("keep.txt", 5)], params, keep_removed=False)
+
+    assert removed is None
+    assert summary["removed"] == 3
+    assert summary["bytes"] == 0 + 1 + 2
+    assert summary["batches"] == 2
+    assert failed == [{"key": "prefix/3.txt", "code": "AccessDenied", "message": "Access Denied"}]
+    # the two batches plus the retry of 0.txt, 3.txt isn't retried
+    assert s3.delete_objects.call_count == 3
+
+
+def test_delete_batch_retries_request_errors(monkeypatch, s3):
+    monkeypatch.setattr(s3_sync, "DELETE_RETRY_DELAY", 0)
+    s3.delete_objects.side_effect = [make_clienterror_exception("SlowDown"), {}]
+
+    deleted, failed = s3_sync.delete_batch(s3, "bucket", [("prefix/stale.txt", 30)])
+
+    assert deleted == [("prefix/stale.txt", 30)]
+    assert failed == []
+    assert s3.delete_objects.call_count == 2
+
+
+def test_delete_batch_raises_request_errors(monkeypatch, s3):
+    monkeypatch.setattr(s3_sync, "DELETE_RETRY_DELAY", 0)
+    s3.delete_objects.side_effect = make_clienterror_exception()
+
+    with pytest.raises(botocore.exceptions.ClientError):
+        s3_sync.delete_batch(s3, "bucket", [("prefix/stale.txt", 30)])
+    # AccessDenied isn't retried
+    assert s3.delete_objects.call_count == 1
+
+
+def test_upload_files_collects_failures(monkeypatch, s3):
+    good_future = MagicMock()
+    bad_future = MagicMock()
+    bad_future.result.side_effect = make_clienterror_exception()
+    manager = MagicMock()
+    manager.__enter__.return_value = manager
+    manager.upload.side_effect = [good_future, bad_future]
+    create_transfer_manager = MagicMock(return_value=manager)
+    monkeypatch.setattr(s3_sync, "create_transfer_manager", create_transfer_manager)
+
+    filelist = [
+        dict(_local_file("a.txt", 10), mime_type="text/plain"),
+        dict(_local_file("b.txt", 20), mime_type="text/plain"),
+    ]
+    params = {"permission": "private", "cache_control": "", "storage_class": "STANDARD"}
+    transfer_config = TransferConfig(max_concurrency=2)
+
+    uploaded, failed = s3_sync.upload_files(s3, "bucket", filelist, params, transfer_config=transfer_config)
+
+    create_transfer_manager.assert_called_once_with(s3, transfer_config)
+    manager.upload.assert_any_call(
+        "/tmp/root/a.txt",
+        "bucket",
+        "prefix/a.txt",
+        extra_args={"ContentType": "text/plain", "ACL": "private", "StorageClass": "STANDARD"},
+    )
+    assert [x["chopped_path"] for x in uploaded] == ["a.txt"]
+    assert [x["chopped_path"] for x in failed] == ["b.txt"]
+    assert "AccessDenied" in failed[0]["error"]
+
+
+def test_local_etag_cache(monkeypatch, tmp_path):
+    file_root = tmp_path / "root"
+    file_root.mkdir()
+    (file_root / "a.txt").write_bytes(b"a" * 10)
+    (file_root / "b.txt").write_bytes(b"b" * 10)
+    cache_path = str(tmp_path / "cache.json")
+    filelist = [
+        {"fullpath": str(file_root / "a.txt"), "bytes": 10},
+        {"fullpath": str(file_root / "b.txt"), "bytes": 10},
+    ]
+
+    cache = s3_sync.LocalEtagCache(cache_path)
+    cache.load()
+    first = s3_sync.calculate_local_etag(filelist, etag_cache=cache)
+    cache.save(str(file_root))
+    assert (cache.hits, cache.misses) == (0, 2)
+
+    calculate = MagicMock(side_effect=AssertionError("unexpected checksum calculation"))
+    monkeypatch.setattr(s3_sync, "calculate_multipart_etag", calculate)
+    cache = s3_sync.LocalEtagCache(cache_path)
+    cache.load()
+    second = s3_sync.calculate_local_etag(filelist[:1], etag_cache=cache)
+    cache.save(str(file_root))
+    assert (cache.hits, cache.misses) == (1, 0)
+    assert second[0]["local_etag"] == first[0]["local_etag"]
+
+    # b.txt wasn't seen during the last run, so it should have been evicted
+    cache = s3_sync.LocalEtagCache(cache_path)
+    cache.load()
+    assert list(cache._entries) == [str(file_root / "a.txt")]
+
+
+def test_calculate_local_etag_lazy(monkeypatch):
+    calculate = MagicMock(return_value={10: '"etag"'})
+    monkeypatch.setattr(s3_sync, "calculate_checksums", calculate)
+    filelist = [
+        dict(_local_file("same.txt", 10), s3_head={"ContentLength": 10, "ETag": '"etag"'}),
+        dict(_local_file("resized.txt", 10), s3_head={"ContentLength": 11, "ETag": '"etag"'}),
+        _local_file("new.txt", 10),
+    ]
+
+    result = s3_sync.calculate_local_etag(filelist, lazy=True)
+
+    # the remote etag isn't from a multipart upload, so the whole file is hashed as a single part
+    calculate.assert_called_once_with("/tmp/root/same.txt", [10], '"etag"', "md5")
+    assert [x.get("local_etag") for x in result] == ['"etag"', None, None]
+    actionable = s3_sync.apply_strategy(result, "checksum")
+    assert [x["chopped_path"] for x in actionable] == ["resized.txt", "new.txt"]
+
+
+def test_calculate_checksums_unavailable(monkeypatch):
+    # md5 isn't available in FIPS mode
+    monkeypatch.setattr(s3_sync, "calculate_multipart_etag", MagicMock(side_effect=ValueError("unsupported hash type")))
+
+    with pytest.raises(s3_sync.ChecksumFailure) as exc_info:
+        s3_sync.calculate_checksums("/tmp/root/a.txt", [8 * 1024 * 1024])
+    assert isinstance(exc_info.value.exc, ValueError)
+
+
+def test_checksum_strategy(s3, tmp_path):
+    source = tmp_path / "a.txt"
+    source.write_bytes(b"hello world")
+    s3.get_paginator.return_value.paginate.return_value = [
+        {
+            "Contents": [
+                dict(_remote_object("prefix/a.txt", 11), ChecksumAlgorithm=["SHA256"]),
+                _remote_object("prefix/b.txt", 11),
+            ]
+        }
+    ]
+    s3.head_object.return_value = {"ChecksumSHA256": "uU0nuZNNPgilLlLX2n2r+sSE7+N6U4DukIj3rOLvzek="}
+    filelist = [
+        dict(_local_file("a.txt", 11), fullpath=str(source)),
+        dict(_local_file("b.txt", 11), fullpath=str(source)),
+    ]
+
+    index = s3_sync.list_s3_objects(s3, "bucket", "prefix")
+    keeplist = s3_sync.lookup_s3(s3, "bucket", filelist, "sha256", s3index=index)
+    keeplist = s3_sync.calculate_local_etag(keeplist, lazy=True, algorithm="sha256")
+    actionable = s3_sync.apply_strategy(keeplist, "sha256")
+
+    # b.txt doesn't have a SHA256 checksum, so there's no need to fetch it
+    s3.head_object.assert_called_once_with(Bucket="bucket", Key="prefix/a.txt", ChecksumMode="ENABLED")
+    assert keeplist[0]["local_checksum"] == "uU0nuZNNPgilLlLX2n2r+sSE7+N6U4DukIj3rOLvzek="
+    assert [x["chopped_path"] for x in actionable] == ["b.txt"]
+
+
+def test_iter_lookups_fetches_checksums_concurrently(s3):
+    index = {
+        f"prefix/{i}.txt": {"ETag": '"etag"', "ContentLength": 1, "ChecksumAlgorithm": ["SHA256"]} for i in range(25)
+    }
+    barrier = threading.Barrier(4, timeout=5)
+
+    def head_object(Bucket, Key, ChecksumMode):
+        # only returns once four requests are in flight
+        if Key in ("prefix/0.txt", "prefix/1.txt", "prefix/2.txt", "prefix/3.txt"):
+            barrier.wait()
+        return {"ChecksumSHA256": Key}
+
+    s3.head_object.side_effect = head_object
+    entries = (_local_file(f"{i}.txt", 1) for i in range(25))
+
+    looked_up = list(s3_sync.iter_lookups(s3, "bucket", entries, "sha256", s3index=index, max_concurrency=4))
+
+    assert [entry["s3_head"]["ChecksumSHA256"] for entry in looked_up] == [f"prefix/{i}.txt" for i in range(25)]
+    assert s3.head_object.call_count == 25
+
+
+def test_iter_uploads_streams_input(monkeypatch, s3):
+    manager = MagicMock()
+    manager.__enter__.return_value = manager
+    monkeypatch.setattr(s3_sync, "create_transfer_manager", MagicMock(return_value=manager))
+    consumed = []
+
+    def filelist():
+        for i in range(15):
+            consumed.append(i)
+            yield dict(_local_file(f"{i}.txt", 1), mime_type="text/plain")
+
+    uploads = s3_sync.iter_uploads(s3, "bucket", filelist(), {}, transfer_config=TransferConfig(max_concurrency=1))
+    first = next(uploads)
+
+    # with a single worker only ten transfers are submitted before we start collecting results
+    assert first == (dict(_local_file("0.txt", 1), mime_type="text/plain"), None)
+    assert len(consumed) == 10
+    assert [entry["chopped_path"] for entry, error in uploads] == [f"{i}.txt" for i in range(1, 15)]
+
+
+def test_gather_files(tmp_path):
+    for path in ("a.txt", "b.log", ".hidden", "sub/c.txt", ".git/config", "node_modules/x/d.txt"):
+        (tmp_path / path).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / path).write_text("x")
+
+    files = s3_sync.gather_files(str(tmp_path), include="*", exclude=".*,*.log")
+    # patterns without a trailing / only match file names
+    assert sorted(x["chopped_path"] for x in files) == [
+        ".git/config",
+        "a.txt",
+        "node_modules/x/d.txt",
+        "sub/c.txt",
+    ]
+    assert files[0] == {
+        "fullpath": str(tmp_path / files[0]["chopped_path"]),
+        "chopped_path": files[0]["chopped_path"],
+        "modified_epoch": int((tmp_path / files[0]["chopped_path"]).stat().st_mtime),
+        "bytes": 1,
+    }
+
+    files = s3_sync.gather_files(str(tmp_path), include="*.txt", exclude=".*,.git/,node_modules/")
+    assert sorted(x["chopped_path"] for x in files) == ["a.txt", "sub/c.txt"]
@@ -0,0 +1,313 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: Contributors to the Ansible project
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+import threading
+from concurrent.futures import Future
+from unittest.mock import MagicMock
+
+import pytest
+
+try:
+    import botocore
+except ImportError:
+    # Handled by HAS_BOTO3
+    pass
+
+from ansible_collections.amazon.aws.plugins.module_utils.botocore import HAS_BOTO3
+
+from ansible_collections.community.aws.plugins.modules import ssm_parameter
+
+if not HAS_BOTO3:
+    pytestmark = pytest.mark.skip("test_ssm_parameter.py requires the python modules 'boto3' and 'botocore'")
+
+
+def make_spec(**kwargs):
+    spec = dict(
+        name="/app/param",
+        description=None,
+        value="value",
+        state="present",
+        string_type="String",
+        key_id="alias/aws/ssm",
+        tier="Standard",
+        tags=None,
+    )
+    spec.update(kwargs)
+    return spec
+
+
+@pytest.fixture(name="module")
+def fixture_module():
+    module = MagicMock()
+    module.check_mode = False
+    module.params = dict(
+        description=None,
+        value=None,
+        state="present",
+        string_type="String",
+        key_id="alias/aws/ssm",
+        tier="Standard",
+        tags=None,
+        overwrite_value="changed",
+        purge_tags=True,
+        max_concurrency=3,
+        parameters=[],
+    )
+    module.fail_json.side_effect = SystemExit(1)
+    module.fail_json_aws.side_effect = SystemExit(1)
+    return module
+
+
+@pytest.fixture(name="client")
+def fixture_client():
+    client = MagicMock()
+    client.parameters = {
+        name: {"Name": name, "Type": "String", "Value": "value", "Description": "description"}
+        for name in ["/app/existing"] + [f"/app/old{i}" for i in range(25)]
+    }
+    client.get_parameters.side_effect = lambda aws_retry, Names, WithDecryption: {
+        "Parameters": [client.parameters[name] for name in Names if name in client.parameters],
+        "InvalidParameters": [name for name in Names if name not in client.parameters],
+    }
+
+    def paginate(ParameterFilters):
+        paginator = MagicMock()
+        paginator.build_full_result.return_value = {
+            "Parameters": [client.parameters[name] for name in ParameterFilters[0]["Values"]]
+        }
+        return paginator
+
+    client.get_paginator.return_value.paginate.side_effect = paginate
+    client.delete_parameters.side_effect = lambda aws_retry, Names: {
+        "DeletedParameters": [name for name in Names if name in client.parameters and name != "/app/old0"],
+        # /app/old0 was deleted since we read it
+        "InvalidParameters": [name for name in Names if name not in client.parameters or name == "/app/old0"],
+    }
+    client.put_parameter.return_value = {"Version": 2}
+    client.list_tags_for_resource.return_value = {"TagList": [{"Key": "Old", "Value": "tag"}]}
+    return client
+
+
+def test_get_parameters_batches():
+    client = MagicMock()
+    client.get_parameters.side_effect = lambda **kwargs: {
+        "Parameters": [{"Name": name} for name in kwargs["Names"] if name != "/missing"],
+        "InvalidParameters": [name for name in kwargs["Names"] if name == "/missing"],
+    }
+    names = [f"/param{i}" for i in range(23)] + ["/missing"]
+
+    parameters = ssm_parameter.get_parameters(client, names)
+
+    assert sorted(parameters) == sorted(names[:-1])
+    assert [len(call.kwargs["Names"]) for call in client.get_parameters.call_args_list] == [10, 10, 4]
+
+
+def test_put_parameter_args_new(module):
+    args = ssm_parameter._put_parameter_args(module, make_spec(tags={"Env": "dev"}), None, {})
+    assert args["Value"] == "value"
+    assert args["Tags"] == [{"Key": "Env", "Value": "dev"}]
+    # Overwrite can't be combined with tags
+    assert args["Overwrite"] is False
+
+
+@pytest.mark.parametrize(
+    "spec,existing_metadata,expected",
+    [
+        (make_spec(), {}, False),
+        (make_spec(value="new-value"), {}, True),
+        (make_spec(string_type="StringList"), {}, True),
+        (make_spec(description="Same"), {"Description": "Same"}, False),
+        (make_spec(description="New"), {"Description": "Old"}, True),
+        # the current value is kept if no value is given
+        (make_spec(value=None), {}, False),
+    ],
+)
+def test_put_parameter_args_existing(module, spec, existing_metadata, expected):
+    existing_parameter = {"Name": "/app/param", "Type": "String", "Value": "value"}
+    args = ssm_parameter._put_parameter_args(module, spec, existing_parameter, existing_metadata)
+    assert (args is not None) is expected
+
+
+def test_put_parameter_args_never_overwrite(module):
+    module.params["overwrite_value"] = "never"
+    existing_parameter = {"Name": "/app/param", "Type": "String", "Value": "old-value"}
+    assert ssm_parameter._put_parameter_args(module, make_spec(), existing_parameter, {}) is None
+
+
+def test_parameter_spec_defaults(module):
+    module.params.update(string_type="SecureString", tags={"Env": "dev"})
+    spec = ssm_parameter._parameter_spec(module, {"name": "/app/param", "value": "value", "tier": "Advanced"})
+    assert spec == make_spec(string_type="SecureString", tier="Advanced", tags={"Env": "dev"})
+
+
+def test_bulk_update_parameters_results(client, module):
+    module.params["parameters"] = [
+        {"name": "/app/new", "value": "new-value", "string_type": "StringList"},
+        {"name": "/app/existing", "value": "value"},
+        {"name": "/app/gone", "state": "absent"},
+        {"name": "/app/existing2", "value": "new-value"},
+    ]
+
+    changed, results = ssm_parameter.bulk_update_parameters(client, module)
+
+    assert changed
+    assert results == [
+        {"name": "/app/new", "state": "present", "changed": True, "version": 2},
+        {"name": "/app/existing", "state": "present", "changed": False},
+        {"name": "/app/gone", "state": "absent", "changed": False},
+        {"name": "/app/existing2", "state": "present", "changed": True, "version": 2},
+    ]
+    put_args = {c.kwargs["Name"]: c.kwargs for c in client.put_parameter.call_args_list}
+    assert sorted(put_args) == ["/app/existing2", "/app/new"]
+    assert put_args["/app/new"]["Type"] == "StringList"
+    # falls back to the top level options
+    assert put_args["/app/existing2"]["Type"] == "String"
+    assert put_args["/app/existing2"]["Tier"] == "Standard"
+    client.get_parameters.assert_called_once()
+    client.delete_parameters.assert_called_once_with(aws_retry=True, Names=["/app/gone"])
+    client.list_tags_for_resource.assert_not_called()
+
+
+def test_bulk_update_parameters_duplicates(client, module):
+    module.params["parameters"] = [{"name": "/app/new", "value": "a"}, {"name": "/app/new", "value": "b"}]
+    with pytest.raises(SystemExit):
+        ssm_parameter.bulk_update_parameters(client, module)
+    client.get_parameters.assert_not_called()
+
+
+def test_bulk_update_parameters_delete(client, module):
+    module.params["parameters"] = [{"name": f"/app/old{i}", "state": "absent"} for i in range(25)]
+    module.params["parameters"].append({"name": "/app/missing", "state": "absent"})
+    # parameters we aren't allowed to read are still deleted
+    client.get_parameters.side_effect = lambda aws_retry, Names, WithDecryption: {
+        "Parameters": [],
+        "InvalidParameters": Names,
+    }
+
+    changed, results = ssm_parameter.bulk_update_parameters(client, module)
+
+    assert changed
+    batches = [c.kwargs["Names"] for c in client.delete_parameters.call_args_list]
+    assert [len(batch) for batch in batches] == [10, 10, 6]
+    assert sum(batches, []) == [f"/app/old{i}" for i in range(25)] + ["/app/missing"]
+    changed_names = [result["name"] for result in results if result["changed"]]
+    assert changed_names == [f"/app/old{i}" for i in range(1, 25)]
+
+
+def test_bulk_update_parameters_describe(client, module):
+    module.params["parameters"] = [
+        {"name": "/app/existing", "value": "value", "description": "new description"},
+        {"name": "/app/old1", "value": "value", "description": "description"},
+        {"name": "/app/old2", "value": "value"},
+        # not described, it doesn't exist
+        {"name": "/app/new", "value": "value", "description": "description"},
+    ]
+
+    changed, results = ssm_parameter.bulk_update_parameters(client, module)
+
+    client.get_paginator.return_value.paginate.assert_called_once_with(
+        ParameterFilters=[{"Key": "Name", "Option": "Equals", "Values": ["/app/existing", "/app/old1"]}]
+    )
+    assert [result["changed"] for result in results] == [True, False, False, True]
+
+
+@pytest.mark.parametrize("overwrite_value", ["always", "never"])
+def test_bulk_update_parameters_no_describe(client, module, overwrite_value):
+    module.params["overwrite_value"] = overwrite_value
+    module.params["parameters"] = [{"name": "/app/existing", "value": "value", "description": "new description"}]
+
+    ssm_parameter.bulk_update_parameters(client, module)
+
+    client.get_paginator.assert_not_called()
+    assert client.put_parameter.called is (overwrite_value == "always")
+
+
+def test_bulk_update_parameters_tags(client, module):
+    module.params["parameters"] = [
+        {"name": "/app/existing", "value": "value", "tags": {"New": "tag"}},
+        {"name": "/app/old1", "value": "value", "tags": {"Old": "tag"}},
+        {"name": "/app/new", "value": "value", "tags": {"New": "tag"}},
+    ]
+
+    changed, results = ssm_parameter.bulk_update_parameters(client, module)
+
+    assert [result["changed"] for result in results] == [True, False, True]
+    client.add_tags_to_resource.assert_called_once_with(
+        aws_retry=True, ResourceType="Parameter", ResourceId="/app/existing", Tags=[{"Key": "New", "Value": "tag"}]
+    )
+    client.remove_tags_from_resource.assert_called_once_with(
+        aws_retry=True, ResourceType="Parameter", ResourceId="/app/existing", TagKeys=["Old"]
+    )
+    # new parameters are tagged by PutParameter
+    client.put_parameter.assert_called_once()
+    assert client.put_parameter.call_args.kwargs["Tags"] == [{"Key": "New", "Value": "tag"}]
+    assert client.list_tags_for_resource.call_count == 2
+
+
+def test_bulk_update_parameters_tags_never_overwrite(client, module):
+    module.params["overwrite_value"] = "never"
+    module.params["parameters"] = [{"name": "/app/existing", "value": "new-value", "tags": {"New": "tag"}}]
+
+    changed, results = ssm_parameter.bulk_update_parameters(client, module)
+
+    assert not changed
+    client.list_tags_for_resource.assert_not_called()
+    client.add_tags_to_resource.assert_not_called()
+    client.put_parameter.assert_not_called()
+
+
+def test_bulk_update_parameters_check_mode(client, module):
+    module.check_mode = True
+    module.params["parameters"] = [
+        {"name": "/app/new", "value": "value"},
+        {"name": "/app/existing", "value": "new-value", "tags": {"New": "tag"}},
+        {"name": "/app/old1", "state": "absent"},
+    ]
+
+    changed, results = ssm_parameter.bulk_update_parameters(client, module)
+
+    assert changed
+    assert [result["changed"] for result in results] == [True, True, True]
+    client.put_parameter.assert_not_called()
+    client.delete_parameters.assert_not_called()
+    client.add_tags_to_resource.assert_not_called()
+    client.remove_tags_from_resource.assert_not_called()
+
+
+def test_bulk_update_parameters_failure(client, module, monkeypatch):
+    module.params["max_concurrency"] = 1
+    module.params["parameters"] = [{"name": f"/app/new{i}", "value": "value"} for i in range(20)]
+
+    # hold the update running when the failure is noticed until the queued updates are cancelled
+    cancelled = threading.Event()
+    original_cancel = Future.cancel
+
+    def cancel(future):
+        result = original_cancel(future)
+        cancelled.set()
+        return result
+
+    monkeypatch.setattr(Future, "cancel", cancel)
+
+    def put_parameter(aws_retry, **kwargs):
+        if kwargs["Name"] == "/app/new1":
+            raise botocore.exceptions.ClientError(
+                {"Error": {"Code": "AccessDeniedException", "Message": "Denied"}}, "PutParameter"
+            )
+        if kwargs["Name"] == "/app/new2":
+            cancelled.wait(5)
+        return {"Version": 1}
+
+    client.put_parameter.side_effect = put_parameter
+
+    with pytest.raises(SystemExit):
+        ssm_parameter.bulk_update_parameters(client, module)
+
+    # the queued updates are cancelled
+    assert [c.kwargs["Name"] for c in client.put_parameter.call_args_list] == ["/app/new0", "/app/new1", "/app/new2"]
+    kwargs = module.fail_json_aws.call_args.kwargs
+    assert kwargs["changed"] is True
+    # updates made before (or while) the failure was noticed are reported
+    assert [result["changed"] for result in kwargs["parameters"]] == [True, False, True] + [False] * 17